@@ -12,10 +12,96 @@ Key Features:
 
 import sqlite3
 import os
+from contextlib import contextmanager
 from tkinter import messagebox
-from typing import List, Tuple, Optional, Dict, Callable
+from typing import List, Tuple, Optional, Dict, Callable, Set
 from dataclasses import dataclass
 
+from Collegeite_SQL_Race_input.config.constants import GENDERS, WEIGHTS
+
+# Number of parsed statements each connection keeps in sqlite3's statement cache
+STATEMENT_CACHE_SIZE = 128
+
+# Page cache per connection; negative values are KiB, so this is 8 MiB
+PAGE_CACHE_KIB = 8192
+
+# INSERT ... RETURNING needs SQLite 3.35+
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# ── SQL for the per-event entry rewrite, built once at import time ──────────
+
+_SQL_DELETE_EVENT_ENTRIES = "DELETE FROM entries WHERE event_id = ?"
+_SQL_INSERT_ENTRY = """
+    INSERT INTO entries (event_id, team_id, entry_boat_class, conference_at_time, notes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_ENTRIES_RETURNING = """
+    INSERT INTO entries (event_id, team_id, entry_boat_class, conference_at_time, notes)
+    VALUES {values}
+    RETURNING entry_id, team_id
+"""
+_SQL_INSERT_RESULT = "INSERT INTO results (entry_id, lane, position, elapsed_sec, margin_sec) VALUES (?, ?, ?, ?, ?)"
+
+# ── SQL for the events tab, built once at import time ───────────────────────
+
+_SQL_GET_REGATTA_START_DATE = "SELECT start_date FROM regattas WHERE regatta_id = ?"
+
+
+def _sql_code_to_desc(column: str, pairs: List[Tuple[str, str]]) -> str:
+    """Build a CASE expression mapping code values to descriptions (unknown codes pass through)."""
+    whens = " ".join(f"WHEN '{code}' THEN '{desc}'" for code, desc in pairs)
+    return f"CASE {column} {whens} ELSE {column} END"
+
+_SQL_GET_EVENTS_FOR_REGATTA_DISPLAY = f"""
+    SELECT r.name, e.boat_type, e.event_boat_class,
+           {_sql_code_to_desc('e.gender', GENDERS)}, {_sql_code_to_desc('e.weight', WEIGHTS)},
+           e.round, e.event_distance, COALESCE(e.scheduled_at, ''),
+           e.event_id, e.gender, e.weight, e.scheduled_at
+    FROM events e
+    JOIN regattas r ON e.regatta_id = r.regatta_id
+    WHERE e.regatta_id = ?
+    ORDER BY e.scheduled_at, e.gender, e.weight, e.event_boat_class
+"""
+
+# ── SQL for regattas and conference lookups ─────────────────────────────────
+# Kept as constants so every call passes identical text and hits the
+# connection's statement cache instead of being parsed again
+
+_SQL_GET_REGATTAS = "SELECT regatta_id, name, location, start_date, end_date FROM regattas ORDER BY start_date DESC"
+_SQL_INSERT_REGATTA = "INSERT INTO regattas (name, location, start_date, end_date) VALUES (?, ?, ?, ?)"
+_SQL_GET_TEAM_CONFERENCE_AT_DATE = """
+    SELECT conference FROM conference_affiliations
+    WHERE team_id = ?
+    AND start_date <= ?
+    AND (end_date IS NULL OR end_date > ?)
+    ORDER BY start_date DESC LIMIT 1
+"""
+
+# Latest affiliation per team on one date; {placeholders} is filled with one ? per team
+_SQL_GET_TEAM_CONFERENCES_AT_DATE = """
+    SELECT team_id, conference FROM (
+        SELECT team_id, conference,
+               ROW_NUMBER() OVER (PARTITION BY team_id ORDER BY start_date DESC) AS rn
+        FROM conference_affiliations
+        WHERE team_id IN ({placeholders})
+        AND start_date <= ?
+        AND (end_date IS NULL OR end_date > ?)
+    )
+    WHERE rn = 1
+"""
+
+# ── SQL for regatta deletion, built once at import time ─────────────────────
+
+# Rows the regatta delete will cascade to, counted up front for the caller's summary
+_SQL_COUNT_REGATTA_CHILDREN = """
+    SELECT COUNT(DISTINCT ev.event_id), COUNT(DISTINCT en.entry_id), COUNT(r.result_id)
+    FROM events ev
+    LEFT JOIN entries en ON en.event_id = ev.event_id
+    LEFT JOIN results r ON r.entry_id = en.entry_id
+    WHERE ev.regatta_id = ?
+"""
+_SQL_DELETE_REGATTA = "DELETE FROM regattas WHERE regatta_id = ?"
+
 @dataclass
 class School:
     """Represents a school with all its properties."""
@@ -66,18 +152,48 @@ class DatabaseManager:
             )
             exit(1)
         
-        self.conn = sqlite3.connect(db_path)
-        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn = self.open_connection()
         
         # Initialize enhanced school management
         self.school_cache: Dict[int, School] = {}
         self.crr_name_to_id_cache: Dict[str, int] = {}
         self.change_notifier = SchoolChangeNotifier()
         
+        # Regatta list cache; regattas_version is bumped whenever the regattas table changes
+        self._regatta_cache: Optional[List[Tuple[int, str, str, str, str]]] = None
+        self.regattas_version = 0
+        
+        # Regattas added this session that have had no events added since; their
+        # event and entry counts are known to be zero without querying
+        self._childless_regatta_ids: Set[int] = set()
+        
         # Verify database and initialize caches
         self._verify_database_initialized()
         self._initialize_school_caches()
     
+    def open_connection(self) -> sqlite3.Connection:
+        """Open a new connection to the database.
+        
+        SQLite connections can only be used on the thread that created them, so
+        background workers open their own with this instead of sharing self.conn.
+        """
+        conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute(f"PRAGMA cache_size = -{PAGE_CACHE_KIB}")
+        return conn
+    
+    @contextmanager
+    def worker_connection(self):
+        """Open a connection for a background worker and close it when the block ends.
+        
+        Use this on worker threads; self.conn belongs to the Tk thread.
+        """
+        conn = self.open_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
     def _verify_database_initialized(self):
         """Verify that the database has been properly initialized."""
         cursor = self.conn.cursor()
@@ -305,13 +421,41 @@ class DatabaseManager:
         """, (gender, weight))
         return cursor.fetchall()
     
+    def get_schools_for_event_category(self, gender: str, weight: str) -> List[sqlite3.Row]:
+        """Return rows (team_id, school_id, crr_name, name, short_name, color) for teams of a gender/weight, sorted by CRR name."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute("""
+            SELECT t.team_id, s.school_id, s.crr_name, s.name, s.short_name, s.color
+            FROM teams t
+            JOIN schools s ON t.school_id = s.school_id
+            WHERE t.gender = ? AND t.weight = ?
+            ORDER BY s.crr_name
+        """, (gender, weight))
+        return cursor.fetchall()
+    
     # ── Original Methods Enhanced for CRR Name Support ──────────────────────────────
     
     def get_regattas(self) -> List[Tuple[int, str, str, str, str]]:
         """Return all regattas with (id, name, location, start_date, end_date)."""
+        if self._regatta_cache is None:
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_GET_REGATTAS)
+            self._regatta_cache = cursor.fetchall()
+        # Hand out a copy so callers can't change the cached list
+        return list(self._regatta_cache)
+    
+    def _invalidate_regatta_cache(self):
+        """Drop the cached regatta list after the regattas table changes."""
+        self._regatta_cache = None
+        self.regattas_version += 1
+    
+    def get_regatta_start_date(self, regatta_id: int) -> Optional[str]:
+        """Return a regatta's start date (YYYY-MM-DD), or None if unknown."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT regatta_id, name, location, start_date, end_date FROM regattas ORDER BY start_date DESC")
-        return cursor.fetchall()
+        cursor.execute(_SQL_GET_REGATTA_START_DATE, (regatta_id,))
+        result = cursor.fetchone()
+        return result[0] if result else None
     
     def get_events_for_regatta(self, regatta_id: int) -> List[Tuple[int, str, str, str, str, str, str, str]]:
         """Return events for a specific regatta."""
@@ -324,6 +468,18 @@ class DatabaseManager:
         """, (regatta_id,))
         return cursor.fetchall()
     
+    def get_events_for_regatta_display(self, regatta_id: int, conn: sqlite3.Connection = None) -> List[Tuple]:
+        """Return a regatta's events shaped for the events table.
+
+        Each row is the eight display values (regatta name, boat type, class, gender,
+        weight, round, distance, scheduled) followed by event_id and the raw
+        gender, weight and scheduled_at values. Pass conn from worker_connection()
+        when calling from a worker thread.
+        """
+        cursor = (conn or self.conn).cursor()
+        cursor.execute(_SQL_GET_EVENTS_FOR_REGATTA_DISPLAY, (regatta_id,))
+        return cursor.fetchall()
+    
     def get_all_events(self) -> List[Tuple[int, str, str, str, str, str, str, str, str, str]]:
         """Return all events with regatta info."""
         cursor = self.conn.cursor()
@@ -338,11 +494,10 @@ class DatabaseManager:
     def add_regatta(self, name: str, location: str, start_date: str, end_date: str) -> int:
         """Add a new regatta and return its ID."""
         cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO regattas (name, location, start_date, end_date) VALUES (?, ?, ?, ?)",
-            (name, location, start_date, end_date)
-        )
+        cursor.execute(_SQL_INSERT_REGATTA, (name, location, start_date, end_date))
         self.conn.commit()
+        self._invalidate_regatta_cache()
+        self._childless_regatta_ids.add(cursor.lastrowid)
         return cursor.lastrowid
     
     def add_event(self, regatta_id: int, boat_type: str, event_boat_class: str, 
@@ -354,11 +509,12 @@ class DatabaseManager:
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (regatta_id, boat_type, event_boat_class, gender, weight, round_name, event_distance, scheduled_at))
         self.conn.commit()
+        self._childless_regatta_ids.discard(regatta_id)
         return cursor.lastrowid
     
-    def get_event_date(self, event_id: int) -> str:
+    def get_event_date(self, event_id: int, conn: sqlite3.Connection = None) -> str:
         """Get the scheduled date for an event."""
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         cursor.execute("""
             SELECT COALESCE(e.scheduled_at, r.start_date, '2024-01-01') as event_date
             FROM events e
@@ -369,24 +525,46 @@ class DatabaseManager:
         result = cursor.fetchone()
         return result[0] if result else "2024-01-01"
     
-    def get_team_conference_at_date(self, team_id: int, event_date: str) -> str:
+    def get_team_conference_at_date(self, team_id: int, event_date: str, conn: sqlite3.Connection = None) -> str:
         """Get the conference a team was in on a specific date."""
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         
         # Extract just the date part if datetime is provided
         date_only = event_date.split(' ')[0] if ' ' in event_date else event_date
         
-        cursor.execute("""
-            SELECT conference FROM conference_affiliations 
-            WHERE team_id = ? 
-            AND start_date <= ? 
-            AND (end_date IS NULL OR end_date > ?)
-            ORDER BY start_date DESC LIMIT 1
-        """, (team_id, date_only, date_only))
+        cursor.execute(_SQL_GET_TEAM_CONFERENCE_AT_DATE, (team_id, date_only, date_only))
         
         result = cursor.fetchone()
         return result[0] if result else "Unknown"
     
+    def get_conferences_for_teams_at_date(self, team_ids: List[int], event_date: str,
+                                          conn: sqlite3.Connection = None) -> Dict[int, str]:
+        """Get the conference each team was in on a specific date, in one query.
+        
+        Args:
+            team_ids: Teams to look up
+            event_date: Date (or datetime) to look up; only the date part is used
+            conn: Connection to read through (defaults to self.conn)
+            
+        Returns:
+            Dict of team_id -> conference, with "Unknown" for teams without an affiliation
+        """
+        team_ids = list(dict.fromkeys(team_ids))
+        if not team_ids:
+            return {}
+        
+        cursor = (conn or self.conn).cursor()
+        
+        # Extract just the date part if datetime is provided
+        date_only = event_date.split(' ')[0] if ' ' in event_date else event_date
+        
+        placeholders = ",".join("?" * len(team_ids))
+        cursor.execute(_SQL_GET_TEAM_CONFERENCES_AT_DATE.format(placeholders=placeholders),
+                       (*team_ids, date_only, date_only))
+        conferences = dict.fromkeys(team_ids, "Unknown")
+        conferences.update(cursor.fetchall())
+        return conferences
+    
     def add_entry(self, event_id: int, team_id: int, entry_boat_class: str = None, notes: str = "") -> int:
         """Add a new entry and return its ID, capturing conference at time of event."""
         cursor = self.conn.cursor()
@@ -486,7 +664,73 @@ class DatabaseManager:
         )
         self.conn.commit()
         return cursor.lastrowid
-    
+
+    def replace_event_entries(self, event_id: int, entries: List[Tuple[int, str, str, Optional[Tuple]]],
+                              conn: sqlite3.Connection = None) -> int:
+        """Replace all entries and results for an event in a single transaction.
+
+        Args:
+            event_id: Event whose entries are being replaced
+            entries: List of (team_id, entry_boat_class, notes, result) where result is
+                     None or a (lane, position, elapsed_sec, margin_sec) tuple
+            conn: Connection to write through (defaults to self.conn); pass one from
+                  worker_connection() when calling from a worker thread
+
+        Returns:
+            Number of entries inserted
+        """
+        conn = conn or self.conn
+        cursor = conn.cursor()
+
+        # Conference at time of event is captured per entry, same as add_entry
+        event_date = self.get_event_date(event_id, conn)
+
+        try:
+            # Take the write lock up front so the deletes and inserts share a single commit
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Clear existing entries for this event; their results go with them through
+            # ON DELETE CASCADE (open_connection enables foreign keys on every connection)
+            cursor.execute(_SQL_DELETE_EVENT_ENTRIES, (event_id,))
+
+            conferences = self.get_conferences_for_teams_at_date(
+                [team_id for team_id, _, _, _ in entries], event_date, conn)
+            entry_params = [
+                (event_id, team_id, entry_boat_class, conferences[team_id], notes)
+                for team_id, entry_boat_class, notes, result in entries
+            ]
+
+            if SUPPORTS_RETURNING and entry_params:
+                # One multi-row INSERT hands back every new entry_id. RETURNING row order
+                # is not guaranteed, so ids are matched up by team (unique within an event).
+                values = ", ".join(["(?, ?, ?, ?, ?)"] * len(entry_params))
+                cursor.execute(_SQL_INSERT_ENTRIES_RETURNING.format(values=values),
+                               [value for params in entry_params for value in params])
+                entry_id_by_team = {team_id: entry_id for entry_id, team_id in cursor.fetchall()}
+                entry_ids = [entry_id_by_team[params[1]] for params in entry_params]
+            else:
+                # Older SQLite: insert one at a time to capture each id
+                entry_ids = []
+                for params in entry_params:
+                    cursor.execute(_SQL_INSERT_ENTRY, params)
+                    entry_ids.append(cursor.lastrowid)
+
+            # Results go in one batch
+            result_rows = [
+                (entry_id, *result)
+                for entry_id, (_, _, _, result) in zip(entry_ids, entries)
+                if result is not None
+            ]
+            cursor.executemany(_SQL_INSERT_RESULT, result_rows)
+
+            conn.commit()
+            return len(entries)
+
+        except Exception as e:
+            # Rollback on any error so the previous entries are kept
+            conn.rollback()
+            raise e
+
     def add_conference_affiliation(self, team_id: int, conference: str, start_date: str, end_date: str = None) -> int:
         """Add a new conference affiliation for a team."""
         cursor = self.conn.cursor()
@@ -583,9 +827,13 @@ class DatabaseManager:
         cursor.execute("SELECT COUNT(*) FROM entries WHERE event_id = ?", (event_id,))
         return cursor.fetchone()[0]
     
-    def get_event_details(self, event_id: int) -> Optional[Tuple[int, str, str, str, str, str, str, str]]:
-        """Get detailed information about a specific event."""
+    def get_event_details(self, event_id: int) -> Optional[sqlite3.Row]:
+        """Get detailed information about a specific event.
+        
+        The row can be indexed by position or by column name.
+        """
         cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
         cursor.execute("""
             SELECT event_id, boat_type, event_boat_class, gender, weight, round, event_distance, scheduled_at
             FROM events
@@ -593,49 +841,46 @@ class DatabaseManager:
         """, (event_id,))
         return cursor.fetchone()
     
-    def delete_regatta(self, regatta_id: int) -> Tuple[int, int, int, int]:
-        """Delete a regatta and all associated events, entries, and results."""
-        cursor = self.conn.cursor()
+    def delete_regatta(self, regatta_id: int, conn: sqlite3.Connection = None) -> Tuple[int, int, int, int]:
+        """Delete a regatta and all associated events, entries, and results.
+        
+        Events, entries and results go through ON DELETE CASCADE, so the whole
+        delete is one statement in one transaction. The child rows are counted
+        first, inside the same transaction, for the returned summary.
+        Pass a connection from worker_connection() when calling from a worker thread;
+        the regatta caches belong to the Tk thread, so the caller must then call
+        forget_regatta() from there once the delete has finished.
+        """
+        on_worker = conn is not None
+        conn = conn or self.conn
+        cursor = conn.cursor()
         
         try:
-            # Step 1: Delete results first (they reference entries)
-            cursor.execute("""
-                DELETE FROM results 
-                WHERE entry_id IN (
-                    SELECT e.entry_id FROM entries e
-                    JOIN events ev ON e.event_id = ev.event_id
-                    WHERE ev.regatta_id = ?
-                )
-            """, (regatta_id,))
-            results_deleted = cursor.rowcount
-            
-            # Step 2: Delete entries (they reference events)
-            cursor.execute("""
-                DELETE FROM entries 
-                WHERE event_id IN (
-                    SELECT event_id FROM events WHERE regatta_id = ?
-                )
-            """, (regatta_id,))
-            entries_deleted = cursor.rowcount
+            # Take the write lock before counting so the counts match what gets deleted
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(_SQL_COUNT_REGATTA_CHILDREN, (regatta_id,))
+            events_deleted, entries_deleted, results_deleted = cursor.fetchone()
             
-            # Step 3: Delete events (they reference regattas)
-            cursor.execute("DELETE FROM events WHERE regatta_id = ?", (regatta_id,))
-            events_deleted = cursor.rowcount
-            
-            # Step 4: Delete the regatta itself
-            cursor.execute("DELETE FROM regattas WHERE regatta_id = ?", (regatta_id,))
+            cursor.execute(_SQL_DELETE_REGATTA, (regatta_id,))
             regattas_deleted = cursor.rowcount
             
             # Commit the transaction
-            self.conn.commit()
+            conn.commit()
+            if not on_worker:
+                self.forget_regatta(regatta_id)
             
             return (results_deleted, entries_deleted, events_deleted, regattas_deleted)
             
         except Exception as e:
             # Rollback on any error
-            self.conn.rollback()
+            conn.rollback()
             raise e
     
+    def forget_regatta(self, regatta_id: int):
+        """Drop a deleted regatta from the cached regatta state (Tk thread only)."""
+        self._invalidate_regatta_cache()
+        self._childless_regatta_ids.discard(regatta_id)
+    
     def get_regatta_event_count(self, regatta_id: int) -> int:
         """Get the number of events for a specific regatta."""
         cursor = self.conn.cursor()
@@ -652,6 +897,25 @@ class DatabaseManager:
         """, (regatta_id,))
         return cursor.fetchone()[0]
     
+    def get_regatta_summary_counts(self, regatta_id: int) -> Tuple[int, int]:
+        """Get (event_count, entry_count) for a regatta in a single query.
+        
+        Regattas added this session with no events since skip the query entirely.
+        """
+        if regatta_id in self._childless_regatta_ids:
+            return 0, 0
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM events WHERE regatta_id = :regatta_id),
+                (SELECT COUNT(*) FROM entries e
+                 JOIN events ev ON e.event_id = ev.event_id
+                 WHERE ev.regatta_id = :regatta_id)
+        """, {'regatta_id': regatta_id})
+        event_count, entry_count = cursor.fetchone()
+        return event_count, entry_count
+    
     def get_regatta_details(self, regatta_id: int) -> Optional[Tuple[int, str, str, str, str]]:
         """Get detailed information about a specific regatta."""
         cursor = self.conn.cursor()
@@ -776,11 +1040,12 @@ class DatabaseManager:
                 for school_id, ow, hm, lm, lw in source_data:
                     # Check if target season participation already exists
                     cursor.execute("""
-                        SELECT COUNT(*) FROM school_participations
+                        SELECT 1 FROM school_participations
                         WHERE school_id = ? AND SUBSTR(start_date, 1, 4) = ?
+                        LIMIT 1
                     """, (school_id, start_year))
                     
-                    if cursor.fetchone()[0] == 0:
+                    if cursor.fetchone() is None:
                         cursor.execute("""
                             INSERT INTO school_participations 
                             (school_id, start_date, end_date, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
@@ -945,11 +1210,12 @@ class DatabaseManager:
                 if ow or hm or lm or lw:
                     # Check if participation already exists
                     cursor.execute("""
-                        SELECT COUNT(*) FROM school_participations
+                        SELECT 1 FROM school_participations
                         WHERE school_id = ? AND SUBSTR(start_date, 1, 4) = ?
+                        LIMIT 1
                     """, (school_id, str(current_year)))
                     
-                    if cursor.fetchone()[0] == 0:
+                    if cursor.fetchone() is None:
                         cursor.execute("""
                             INSERT INTO school_participations 
                             (school_id, start_date, end_date, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
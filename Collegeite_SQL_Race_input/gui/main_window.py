@@ -7,7 +7,7 @@ and sets up the tabbed interface for the different workflow steps.
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import AbstractSet, Dict, Optional, Set
 
 from Collegeite_SQL_Race_input.database import DatabaseManager
 from Collegeite_SQL_Race_input.config.constants import FONT_TITLE
@@ -16,6 +16,28 @@ from Collegeite_SQL_Race_input.config.constants import FONT_TITLE
 class RowingDatabaseApp:
     """Main application class that coordinates the GUI and database."""
     
+    # Tab attributes in notebook order
+    _TAB_NAMES = ('regatta_tab', 'event_tab', 'entries_results_tab', 'conference_tab', 'd1_schools_tab')
+    
+    # Notebook titles, shown on placeholders until each tab is built
+    _TAB_TITLES = {
+        'regatta_tab': "1. Regattas",
+        'event_tab': "2. Events",
+        'entries_results_tab': "3. Entries & Results",
+        'conference_tab': "4. Conferences",
+        'd1_schools_tab': "5. D1 Schools",
+    }
+    
+    # Data domains each tab displays; refresh_all_tabs skips tabs whose domains didn't change
+    ALL_DATA_DOMAINS = frozenset({'regattas', 'events', 'entries', 'schools', 'conferences'})
+    _TAB_DOMAINS = {
+        'regatta_tab': frozenset({'regattas'}),
+        'event_tab': frozenset({'regattas', 'events'}),
+        'entries_results_tab': ALL_DATA_DOMAINS,
+        'conference_tab': frozenset({'schools', 'conferences'}),
+        'd1_schools_tab': frozenset({'schools'}),
+    }
+    
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Rowing Database Entry")
@@ -29,6 +51,10 @@ class RowingDatabaseApp:
         self.current_event_id: Optional[int] = None
         self.current_event_boat_class: Optional[str] = None
         
+        # Tabs waiting on a refresh_all_tabs request, by attribute name
+        self._dirty_tabs: Set[str] = set()
+        self._refresh_scheduled = False
+        
         # Setup the main UI
         self._setup_ui()
         
@@ -54,14 +80,49 @@ class RowingDatabaseApp:
     
     def _create_tabs(self):
         """Create the actual tab modules."""
+        # Built tabs by attribute name, in the order they were built
+        self._tabs: Dict[str, object] = {}
+        
         from .tabs import RegattaTab, EventTab, EntriesResultsTab, ConferenceTab, D1SchoolsTab
         
-        # Create tab instances in logical order
+        # Tab classes by attribute name, built when each tab is first shown
+        self._tab_factories = {
+            'regatta_tab': RegattaTab,
+            'event_tab': EventTab,
+            'entries_results_tab': EntriesResultsTab,
+            'conference_tab': ConferenceTab,
+            'd1_schools_tab': D1SchoolsTab,
+        }
+        
+        # The first tab is visible at startup, so build it now; the others get an
+        # empty placeholder frame until selected
         self.regatta_tab = RegattaTab(self.notebook, self)
-        self.event_tab = EventTab(self.notebook, self)
-        self.entries_results_tab = EntriesResultsTab(self.notebook, self)
-        self.conference_tab = ConferenceTab(self.notebook, self)
-        self.d1_schools_tab = D1SchoolsTab(self.notebook, self)
+        self._tabs['regatta_tab'] = self.regatta_tab
+        self._tab_placeholders = {}
+        for name in self._TAB_NAMES[1:]:
+            placeholder = ttk.Frame(self.notebook)
+            self.notebook.add(placeholder, text=self._TAB_TITLES[name])
+            self._tab_placeholders[name] = placeholder
+        
+        # Build tabs on first visit and catch up deferred refreshes
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed, '+')
+    
+    def _build_tab(self, name: str):
+        """Create a tab in place of its placeholder and show it."""
+        placeholder = self._tab_placeholders.pop(name)
+        index = self.notebook.index(placeholder)
+        
+        # Tabs add their own frame at the end of the notebook; move it to the placeholder's slot
+        tab = self._tab_factories[name](self.notebook, self)
+        setattr(self, name, tab)
+        self._tabs[name] = tab
+        self.notebook.insert(index, tab.frame)
+        self.notebook.select(tab.frame)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+        
+        # A new tab has just loaded current data
+        self._dirty_tabs.discard(name)
     
     def _initialize_tabs(self):
         """Initialize data and state in all tabs."""
@@ -75,16 +136,18 @@ class RowingDatabaseApp:
         """Set the currently selected regatta (called by regatta tab)."""
         self.current_regatta_id = regatta_id
         # Notify event tab of regatta change if needed
-        if hasattr(self, 'event_tab'):
-            self.event_tab.on_regatta_changed(regatta_id)
+        event_tab = self._tabs.get('event_tab')
+        if event_tab is not None:
+            event_tab.on_regatta_changed(regatta_id)
     
     def set_current_event(self, event_id: int, event_boat_class: str = None):
         """Set the currently selected event (called by event/entry tabs)."""
         self.current_event_id = event_id
         self.current_event_boat_class = event_boat_class
         # Notify entries/results tab of event change if needed
-        if hasattr(self, 'entries_results_tab'):
-            self.entries_results_tab.on_event_changed(event_id, event_boat_class)
+        entries_results_tab = self._tabs.get('entries_results_tab')
+        if entries_results_tab is not None:
+            entries_results_tab.on_event_changed(event_id, event_boat_class)
     
     def get_database(self) -> DatabaseManager:
         """Get the database manager instance."""
@@ -104,40 +167,75 @@ class RowingDatabaseApp:
     
     # ── Data Refresh Methods ───────────────────────────────────────────────
     
-    def refresh_all_tabs(self):
-        """Refresh data in all tabs (called when data changes)."""
-        # Refresh all tabs when data changes
-        if hasattr(self, 'regatta_tab'):
-            self.regatta_tab.refresh()
-        if hasattr(self, 'event_tab'):
-            self.event_tab.refresh()
-        if hasattr(self, 'entries_results_tab'):
-            self.entries_results_tab.refresh()
-        if hasattr(self, 'conference_tab'):
-            self.conference_tab.refresh()
-        if hasattr(self, 'd1_schools_tab'):
-            self.d1_schools_tab.refresh()
+    def refresh_all_tabs(self, changed: AbstractSet[str] = ALL_DATA_DOMAINS):
+        """Refresh data in all tabs that show any of the changed data (called when data changes).
+        
+        Requests are coalesced until the event loop is idle. Only the visible tab
+        is refreshed then; the others refresh when they are next selected.
+        
+        Args:
+            changed: Data domains that changed, from ALL_DATA_DOMAINS
+        """
+        self._dirty_tabs.update(
+            name for name in self._tabs
+            if not self._TAB_DOMAINS[name].isdisjoint(changed)
+        )
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.root.after_idle(self._flush_refresh)
+    
+    def _flush_refresh(self):
+        """Refresh the visible tab if it has a pending refresh_all_tabs request."""
+        self._refresh_scheduled = False
+        self._refresh_tab_if_dirty(self._get_selected_tab_name())
+    
+    def _on_notebook_tab_changed(self, event=None):
+        """Build the newly selected tab on first visit, or refresh it if it missed a refresh while hidden."""
+        selected = self.notebook.select()
+        for name, placeholder in self._tab_placeholders.items():
+            if str(placeholder) == selected:
+                self._build_tab(name)
+                return
+        self._refresh_tab_if_dirty(self._get_selected_tab_name())
+    
+    def _get_selected_tab_name(self) -> Optional[str]:
+        """Get the attribute name of the tab currently shown in the notebook."""
+        selected = self.notebook.select()
+        for name, tab in self._tabs.items():
+            if str(tab.frame) == selected:
+                return name
+        return None
+    
+    def _refresh_tab_if_dirty(self, name: Optional[str]):
+        """Refresh the named tab if it is waiting on a refresh."""
+        if name in self._dirty_tabs:
+            self._dirty_tabs.discard(name)
+            self._tabs[name].refresh()
+    
+    def _refresh_tabs(self, *names: str):
+        """Refresh the named tabs that have been built."""
+        for name in names:
+            tab = self._tabs.get(name)
+            if tab is not None:
+                tab.refresh()
     
     def refresh_regatta_dependent_tabs(self):
         """Refresh tabs that depend on regatta data."""
-        if hasattr(self, 'event_tab'):
-            self.event_tab.refresh()
-        if hasattr(self, 'entries_results_tab'):
-            self.entries_results_tab.refresh()
+        self._refresh_tabs('event_tab', 'entries_results_tab')
     
     def refresh_event_dependent_tabs(self):
         """Refresh tabs that depend on event data."""
-        if hasattr(self, 'entries_results_tab'):
-            self.entries_results_tab.refresh()
+        self._refresh_tabs('entries_results_tab')
+    
+    def refresh_after_event_change(self):
+        """Refresh only the event lists of other tabs (called after an event is created or deleted)."""
+        entries_results_tab = self._tabs.get('entries_results_tab')
+        if entries_results_tab is not None:
+            entries_results_tab.refresh_events()
     
     def refresh_team_dependent_tabs(self):
         """Refresh tabs that depend on team/school data."""
-        if hasattr(self, 'conference_tab'):
-            self.conference_tab.refresh()
-        if hasattr(self, 'd1_schools_tab'):
-            self.d1_schools_tab.refresh()
-        if hasattr(self, 'entries_results_tab'):
-            self.entries_results_tab.refresh()
+        self._refresh_tabs('conference_tab', 'd1_schools_tab', 'entries_results_tab')
     
     # ── Application Lifecycle Methods ──────────────────────────────────────
     
@@ -1149,11 +1149,12 @@ class ConferenceTab:
             for team_id, conference in source_affiliations:
                 # Check if affiliation already exists for target season
                 cursor.execute("""
-                    SELECT COUNT(*) FROM conference_affiliations
+                    SELECT 1 FROM conference_affiliations
                     WHERE team_id = ? AND SUBSTR(start_date, 1, 4) = ?
+                    LIMIT 1
                 """, (team_id, target_year))
                 
-                if cursor.fetchone()[0] == 0:  # No existing affiliation
+                if cursor.fetchone() is None:  # No existing affiliation
                     # Create new affiliation for target season
                     cursor.execute("""
                         INSERT INTO conference_affiliations (team_id, conference, start_date, end_date)
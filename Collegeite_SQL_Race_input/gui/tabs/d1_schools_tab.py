@@ -692,8 +692,9 @@ class SchoolTableManager:
                     is_unique, debug_message = CRRNameValidator.validate_uniqueness(
                         self.season_manager.db, new_value, current_crr_name)
                     
-                    # Print the debug message
-                    print(debug_message)
+                    # Print the debug message, if validation debugging is on
+                    if debug_message:
+                        print(debug_message)
                     
                     if not is_unique:
                         debug_print(f"CRR name conflict detected", "ERROR")
@@ -12,9 +12,32 @@ from Collegeite_SQL_Race_input.utils.helpers import (
     format_regatta_display_name, 
     auto_size_treeview_columns, 
     make_treeview_sortable,
-    format_time_seconds
+    format_time_seconds,
+    run_in_background
 )
 
+# ── SQL used by this tab, built once at import time ──────────────────────────
+
+_SQL_GET_EVENT_META = "SELECT gender, weight, event_boat_class FROM events WHERE event_id = ?"
+
+_SQL_GET_EVENT_WITH_REGATTA = """
+    SELECT r.regatta_id, r.name, r.location, r.start_date, 
+        e.gender, e.weight, e.event_boat_class, e.boat_type, e.round, e.event_distance, e.scheduled_at
+    FROM events e
+    JOIN regattas r ON e.regatta_id = r.regatta_id
+    WHERE e.event_id = ?
+"""
+
+_SQL_GET_EVENT_ENTRIES = """
+    SELECT e.entry_id, s.crr_name, e.entry_boat_class, r.lane, r.position, r.elapsed_sec, e.notes
+    FROM entries e
+    JOIN teams t ON e.team_id = t.team_id
+    JOIN schools s ON t.school_id = s.school_id
+    LEFT JOIN results r ON e.entry_id = r.entry_id
+    WHERE e.event_id = ?
+    ORDER BY COALESCE(r.position, 999), s.crr_name
+"""
+
 
 class EntriesResultsTab:
     """Handles team entries and race results in a single workflow."""
@@ -41,11 +64,16 @@ class EntriesResultsTab:
         self.entry_rows = []  # List of (lane_entry, position_label, school_entry, boat_class_entry, time_entry, notes_entry)
         self.results_frame = None
         self.current_school_choices = []
+        self._current_school_choices_set = set()  # Mirrors current_school_choices for membership checks
         self.current_event_boat_class = ""
+        self._event_date_cache = {}  # event_id -> event date, cleared on refresh
         
         # Results display
         self.results_tree = None
         
+        # Set while a submit is being written on the background worker
+        self._submit_in_progress = False
+        
         # CRITICAL FIX: Track if this tab is currently active
         self.is_active_tab = False
         
@@ -56,7 +84,7 @@ class EntriesResultsTab:
     def _setup_tab_focus_tracking(self):
         """Setup tracking of when this tab becomes active/inactive."""
         # Bind to notebook tab change events
-        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed, '+')
         
         # Bind Enter key to the entire application window, but filter by tab
         root = self.frame.winfo_toplevel()
@@ -191,6 +219,10 @@ class EntriesResultsTab:
         self.scroll_frame.bind("<Configure>", 
                               lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
         
+        # Entry rows live in their own container so clearing the form is a single destroy
+        self.rows_container = tk.Frame(self.scroll_frame)
+        self.rows_container.pack(fill='x')
+        
         self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
         
@@ -349,7 +381,7 @@ class EntriesResultsTab:
             
             # Get event details
             cursor = self.db.conn.cursor()
-            cursor.execute("SELECT gender, weight, event_boat_class FROM events WHERE event_id = ?", (event_id,))
+            cursor.execute(_SQL_GET_EVENT_META, (event_id,))
             event_info = cursor.fetchone()
             
             if event_info:
@@ -360,13 +392,12 @@ class EntriesResultsTab:
                 self.current_event_boat_class = event_boat_class
                 
                 # *** ENHANCED: Get event date and use temporal school filtering ***
-                event_date = self.db.get_event_date(event_id)
+                event_date = self._event_date(event_id)
                 print(f"🔍 Event date for temporal filtering: {event_date}")
                 
                 # Get schools that were participating in D1 on the event date
                 participating_schools = self.db.get_schools_participating_at_date(gender, weight, event_date)
-                self.current_school_choices = participating_schools
-                self._update_existing_autocomplete_widgets()
+                self._set_current_school_choices(participating_schools)
                 
                 print(f"📚 Available schools for {gender} {weight} on {event_date}: {len(participating_schools)} schools")
                 print(f"   Sample schools: {participating_schools[:5]}..." if participating_schools else "   No schools found")
@@ -398,13 +429,7 @@ class EntriesResultsTab:
         
         # Find and set the corresponding event in the dropdown
         cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT r.regatta_id, r.name, r.location, r.start_date, 
-                e.gender, e.weight, e.event_boat_class, e.boat_type, e.round, e.event_distance, e.scheduled_at
-            FROM events e
-            JOIN regattas r ON e.regatta_id = r.regatta_id
-            WHERE e.event_id = ?
-        """, (event_id,))
+        cursor.execute(_SQL_GET_EVENT_WITH_REGATTA, (event_id,))
         
         result = cursor.fetchone()
         if not result:
@@ -432,10 +457,9 @@ class EntriesResultsTab:
                 self.current_event_boat_class = event_boat_class
                 
                 # *** ENHANCED: Use temporal school filtering ***
-                event_date = self.db.get_event_date(event_id)
+                event_date = self._event_date(event_id)
                 participating_schools = self.db.get_schools_participating_at_date(gender, weight, event_date)
-                self.current_school_choices = participating_schools
-                self._update_existing_autocomplete_widgets()
+                self._set_current_school_choices(participating_schools)
                 
                 print(f"🔄 Event changed: {len(participating_schools)} schools available for {gender} {weight} on {event_date}")
                 
@@ -461,26 +485,23 @@ class EntriesResultsTab:
 
 
 
-    def _load_existing_entries(self):
-        """Load existing entries for the current event."""
+    def _load_existing_entries(self, entries=None):
+        """Load existing entries for the current event.
+        
+        Args:
+            entries: Rows shaped like _SQL_GET_EVENT_ENTRIES results. When given
+                (e.g. just after a submit) they are shown without querying the database.
+        """
         self._clear_form()
         
         if not self.app.current_event_id:
             return
         
-        # Get existing entries with any results AND NOTES
-        cursor = self.db.conn.cursor()
-        cursor.execute("""
-            SELECT e.entry_id, s.crr_name, e.entry_boat_class, r.lane, r.position, r.elapsed_sec, e.notes
-            FROM entries e
-            JOIN teams t ON e.team_id = t.team_id
-            JOIN schools s ON t.school_id = s.school_id
-            LEFT JOIN results r ON e.entry_id = r.entry_id
-            WHERE e.event_id = ?
-            ORDER BY COALESCE(r.position, 999), s.crr_name
-        """, (self.app.current_event_id,))
-        
-        entries = cursor.fetchall()
+        if entries is None:
+            # Get existing entries with any results AND NOTES
+            cursor = self.db.conn.cursor()
+            cursor.execute(_SQL_GET_EVENT_ENTRIES, (self.app.current_event_id,))
+            entries = cursor.fetchall()
         
         for entry_id, school_name, boat_class, lane, position, elapsed_sec, notes in entries:
             self._add_entry_row(boat_class=boat_class or "")
@@ -505,6 +526,18 @@ class EntriesResultsTab:
         self._update_preview()  
 
 
+    def _event_date(self, event_id):
+        """Return the event's date, querying the database only the first time per event."""
+        if event_id not in self._event_date_cache:
+            self._event_date_cache[event_id] = self.db.get_event_date(event_id)
+        return self._event_date_cache[event_id]
+
+    def _set_current_school_choices(self, schools):
+        """Store the valid schools for the current event and push them to the autocomplete widgets."""
+        self.current_school_choices = schools
+        self._current_school_choices_set = set(schools)
+        self._update_existing_autocomplete_widgets()
+
     def _update_existing_autocomplete_widgets(self):
         """Update autocomplete choices in existing school entry widgets."""
         if not hasattr(self, 'entry_rows'):
@@ -525,7 +558,7 @@ class EntriesResultsTab:
     def _add_entry_row(self, school="", time="", notes="", boat_class=""):
         """Add a new entry row to the form with updated autocomplete choices."""
         row_num = len(self.entry_rows) + 1
-        row_frame = tk.Frame(self.scroll_frame)
+        row_frame = tk.Frame(self.rows_container)
         row_frame.pack(fill='x', pady=1, padx=2)
         
         # HARDCODED WIDTHS - Use field width values for entry widgets
@@ -629,8 +662,9 @@ class EntriesResultsTab:
             notes = notes_entry.get().strip()  # NEW: Get notes
             
             if school and time_text:
-                try:
-                    time_seconds = time_entry.get_seconds()
+                # Seconds are parsed as the time is typed; None means invalid, skip it
+                time_seconds = time_entry.seconds
+                if time_seconds is not None:
                     results.append({
                         'position': i + 1,
                         'lane': lane,
@@ -640,9 +674,6 @@ class EntriesResultsTab:
                         'time_seconds': time_seconds,
                         'notes': notes  # NEW: Include notes
                     })
-                except:
-                    # Invalid time, skip
-                    continue
         
         if not results:
             return
@@ -699,12 +730,26 @@ class EntriesResultsTab:
 
     def _submit_results(self):
         """Submit all entries and results to the database with enhanced validation."""
-        if not self.app.current_event_id:
+        if self._submit_in_progress:
+            return
+        
+        # Snapshot attributes used in the loops below so they are resolved once
+        event_id = self.app.current_event_id
+        db = self.db
+        valid_schools = self._current_school_choices_set
+        
+        if not event_id:
             messagebox.showerror("Error", "Please select an event first")
             return
         
-        # Collect valid entries
+        # Collect and validate entries in a single pass over the form.
+        # Problems are accumulated so the user sees all of them at once.
         entries = []
+        errors = []
+        seen_schools = set()
+        previous_timed_entry = None  # Last entry with a time, for the finishing-order check
+        previous_time = None
+        fastest_time = 0
         for i, (lane_entry, position_label, school_entry, boat_class_entry, time_entry, notes_entry, row_frame) in enumerate(self.entry_rows):
             school = school_entry.get().strip()
             time_text = time_entry.get().strip()
@@ -716,13 +761,21 @@ class EntriesResultsTab:
                 continue
             
             # *** ENHANCED: Validate school against temporally filtered choices ***
-            if school not in self.current_school_choices:
+            if school not in valid_schools:
                 # Get event date for better error message
-                event_date = self.db.get_event_date(self.app.current_event_id)
-                messagebox.showerror("Invalid School", 
-                    f"'{school}' was not participating in D1 for this team category on {event_date}.\n\n"
+                event_date = self._event_date(event_id)
+                errors.append(
+                    f"'{school}' was not participating in D1 for this team category on {event_date}. "
                     f"Only schools with active D1 participation on the event date are valid entries.")
-                return
+            
+            # Check for duplicates as we go so the offending school can be named
+            if school in seen_schools:
+                errors.append(f"Duplicate school entered: {school}")
+            seen_schools.add(school)
+            
+            if lane and not lane.isdigit():
+                errors.append(f"Invalid lane for {school}: {lane}")
+                lane = ""
             
             entry_data = {
                 'position': i + 1,
@@ -734,105 +787,143 @@ class EntriesResultsTab:
             }
             
             if time_text:
-                try:
-                    entry_data['time_seconds'] = time_entry.get_seconds()
-                except ValueError:
-                    messagebox.showerror("Error", f"Invalid time for {school}: {time_text}")
-                    return
+                # Seconds were parsed as the time was typed
+                time_seconds = time_entry.seconds
+                if time_seconds is None:
+                    errors.append(f"Invalid time for {school}: {time_text}")
+                else:
+                    entry_data['time_seconds'] = time_seconds
+                    
+                    # Validate time order - ensure non-decreasing times in finishing order.
+                    # Only a float comparison per timed row; the first one has nothing to compare against.
+                    if previous_time is None:
+                        # Times are non-decreasing, so the first timed entry is the fastest
+                        fastest_time = time_seconds
+                    elif time_seconds < previous_time:
+                        errors.append(
+                            f"Position {entry_data['position']} ({school}) "
+                            f"has a faster time than position {previous_timed_entry['position']} "
+                            f"({previous_timed_entry['school']}). Results must be entered in finishing order "
+                            f"with slower boats having higher times."
+                        )
+                    previous_timed_entry = entry_data
+                    previous_time = time_seconds
             
             entries.append(entry_data)
         
-        if not entries:
-            messagebox.showerror("Error", "Please enter at least one school")
+        if errors:
+            messagebox.showerror("Validation Errors", "\n\n".join(errors))
             return
         
-        # Check for duplicates
-        schools_entered = [e['school'] for e in entries]
-        if len(schools_entered) != len(set(schools_entered)):
-            messagebox.showerror("Error", "Duplicate schools entered")
+        if not entries:
+            messagebox.showerror("Error", "Please enter at least one school")
             return
         
-        # Validate time order - ensure non-decreasing times in finishing order
-        entries_with_times = [e for e in entries if 'time_seconds' in e]
-        if len(entries_with_times) > 1:
-            for i in range(1, len(entries_with_times)):
-                current_entry = entries_with_times[i]
-                previous_entry = entries_with_times[i - 1]
-                
-                if current_entry['time_seconds'] < previous_entry['time_seconds']:
-                    messagebox.showerror(
-                        "Time Order Error",
-                        f"Position {current_entry['position']} ({current_entry['school']}) "
-                        f"has a faster time than position {previous_entry['position']} "
-                        f"({previous_entry['school']}). Results must be entered in finishing order "
-                        f"with slower boats having higher times."
-                    )
-                    return
-        
         try:
-            # Clear existing entries for this event
-            cursor = self.db.conn.cursor()
-            cursor.execute("DELETE FROM results WHERE entry_id IN (SELECT entry_id FROM entries WHERE event_id = ?)", (self.app.current_event_id,))
-            cursor.execute("DELETE FROM entries WHERE event_id = ?", (self.app.current_event_id,))
-            
-            # Add entries and results
+            # *** ENHANCED: Get team_id using temporally filtered teams ***
+            # The event's category and date are the same for every entry, so look the teams up once
+            cursor = db.conn.cursor()
+            cursor.execute(_SQL_GET_EVENT_META, (event_id,))
+            gender, weight, _ = cursor.fetchone()
+
+            event_date = self._event_date(event_id)
+            teams = db.get_teams_for_category_at_date(gender, weight, event_date)
+            team_id_by_school = {school_name: tid for tid, school_name, _ in teams}
+
+            # Build entry and result rows before touching the database
+            entry_rows = []
             for entry_data in entries:
-                # *** ENHANCED: Get team_id using temporally filtered teams ***
-                cursor.execute("SELECT gender, weight FROM events WHERE event_id = ?", (self.app.current_event_id,))
-                gender, weight = cursor.fetchone()
-                
-                event_date = self.db.get_event_date(self.app.current_event_id)
-                teams = self.db.get_teams_for_category_at_date(gender, weight, event_date)
-                team_id = None
-                for tid, school_name, conference in teams:
-                    if school_name == entry_data['school']:
-                        team_id = tid
-                        break
-                
+                team_id = team_id_by_school.get(entry_data['school'])
+
                 if not team_id:
                     raise Exception(f"Team not found for {entry_data['school']} on {event_date}")
-                
-                # Add entry WITH NOTES
-                entry_id = self.db.add_entry(
-                    self.app.current_event_id, 
-                    team_id, 
-                    entry_data['boat_class'],
-                    entry_data['notes']
-                )
-                
+
                 # Add result if time provided
+                result = None
                 if 'time_seconds' in entry_data:
                     # Calculate margin from fastest time
-                    times_with_values = [e['time_seconds'] for e in entries if 'time_seconds' in e]
-                    fastest_time = min(times_with_values) if times_with_values else 0
                     margin = entry_data['time_seconds'] - fastest_time
-                    
-                    self.db.add_result(
-                        entry_id,
-                        lane=entry_data['lane'],
-                        position=entry_data['position'],
-                        elapsed_sec=entry_data['time_seconds'],
-                        margin_sec=margin
-                    )
-            
-            messagebox.showinfo("Success", f"Submitted {len(entries)} entries and results!")
-            
-            # Refresh the display
-            self._load_existing_entries()
-            
+                    result = (entry_data['lane'], entry_data['position'], entry_data['time_seconds'], margin)
+
+                entry_rows.append((team_id, entry_data['boat_class'], entry_data['notes'], result))
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to submit: {str(e)}")
+            return
+        
+        # Replace existing entries and results off the Tk thread so the UI stays responsive
+        self._set_submit_controls_enabled(False)
+        run_in_background(
+            self.frame,
+            lambda: self._write_entries(event_id, entry_rows),
+            lambda result, error: self._on_submit_finished(event_id, entries, error)
+        )
+    
+    def _set_submit_controls_enabled(self, enabled):
+        """Lock the submit button and the event selection while a submit is being written."""
+        self._submit_in_progress = not enabled
+        self.btn_submit.config(state='normal' if enabled else 'disabled')
+        combo_state = 'readonly' if enabled else 'disabled'
+        self.regatta_combo.config(state=combo_state)
+        self.event_combo.config(state=combo_state)
+    
+    def _write_entries(self, event_id, entry_rows):
+        """Write submitted rows to the database (runs on the worker thread)."""
+        with self.db.worker_connection() as conn:
+            return self.db.replace_event_entries(event_id, entry_rows, conn)
+    
+    def _on_submit_finished(self, event_id, entries, error):
+        """Report the outcome of a background submit (runs on the Tk thread)."""
+        self._set_submit_controls_enabled(True)
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to submit: {str(error)}")
+            return
+        
+        messagebox.showinfo("Success", f"Submitted {len(entries)} entries and results!")
+        
+        # Another tab can still change the current event meanwhile; the submitted rows
+        # only belong in the form if it is still showing the event they were written to
+        if event_id != self.app.current_event_id:
+            self._load_existing_entries()
+            return
+        
+        # Refresh the display from what was just written instead of re-reading it.
+        # Rows mirror _SQL_GET_EVENT_ENTRIES: lane and position only exist with a result.
+        rows = []
+        for entry_data in entries:
+            timed = 'time_seconds' in entry_data
+            rows.append((
+                None,
+                entry_data['school'],
+                entry_data['boat_class'],
+                entry_data['lane'] if timed else None,
+                entry_data['position'] if timed else None,
+                entry_data.get('time_seconds'),
+                entry_data['notes']
+            ))
+        rows.sort(key=lambda row: (row[4] if row[4] is not None else 999, row[1]))
+        self._load_existing_entries(entries=rows)
 
     def _clear_form(self):
         """Clear the entry form."""
-        for lane_entry, position_label, school_entry, boat_class_entry, time_entry, notes_entry, row_frame in self.entry_rows:
-            row_frame.destroy()
+        # Destroying the container takes all row widgets with it
+        self.rows_container.destroy()
+        self.rows_container = tk.Frame(self.scroll_frame)
+        self.rows_container.pack(fill='x')
         self.entry_rows.clear()
         
         # Clear preview
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
+    
+    def refresh_events(self):
+        """Reload the event dropdown for the selected regatta (called by main app after event changes)."""
+        # The changed event may have been the cached one
+        self._event_date_cache.clear()
+        self._on_regatta_combo_select(None)
     
     def refresh(self):
         """Refresh this tab's data (called by main app)."""
+        # Event dates may have been edited elsewhere
+        self._event_date_cache.clear()
         self._populate_regatta_combo()
\ No newline at end of file
@@ -4,13 +4,42 @@ Fixed to prevent regatta selection from changing when creating new events.
 """
 
 import tkinter as tk
+from datetime import datetime
 from tkinter import messagebox, ttk
 from tkcalendar import DateEntry
 
 from Collegeite_SQL_Race_input.config.constants import (BOAT_TYPES, EVENT_BOAT_CLASSES, GENDERS, WEIGHTS, ROUNDS, EVENT_DISTANCES,
                             FONT_LABEL, FONT_ENTRY, FONT_BUTTON, FONT_TITLE)
 from Collegeite_SQL_Race_input.widgets import ScheduleTimeEntry
-from Collegeite_SQL_Race_input.utils import format_event_display_name, format_regatta_display_name, auto_size_treeview_columns, make_treeview_sortable
+from Collegeite_SQL_Race_input.utils import format_event_display_name, format_regatta_display_name, make_treeview_sortable, run_in_background
+
+# ── Code/description lookups, built once at import time ──────────────────────
+
+_GENDER_MAP = dict(GENDERS)    # 'M' -> 'Men'
+_WEIGHT_MAP = dict(WEIGHTS)    # 'LW' -> 'Lightweight'
+_GENDER_INV = {desc: code for code, desc in GENDERS}
+_WEIGHT_INV = {desc: code for code, desc in WEIGHTS}
+
+# Events table columns (header text is the column id) with their minimum pixel widths
+_EVENT_COLUMN_MIN_WIDTHS = {
+    'Regatta Name': 150,
+    'Boat Type': 80,
+    'Class': 60,
+    'Gender': 60,
+    'Weight': 80,
+    'Round': 100,
+    'Distance': 80,
+    'Scheduled': 120
+}
+_EVENT_COLUMNS = tuple(_EVENT_COLUMN_MIN_WIDTHS)
+# How long the "Created" status message stays up
+_STATUS_CLEAR_MS = 4000
+
+# Delay before acting on a regatta selection, so rapid changes only refresh once
+_REGATTA_SELECT_DEBOUNCE_MS = 120
+
+_CHAR_WIDTH_PX = 8       # Pixels per character estimate, as in auto_size_treeview_columns
+_COLUMN_PADDING_PX = 20
 
 
 class EventTab:
@@ -29,6 +58,10 @@ class EventTab:
         self.regatta_var = None
         self.regatta_combo = None
         self.regatta_id_map = {}
+        self.regatta_display_by_id = {}  # Inverse of regatta_id_map
+        self.regatta_info = {}  # Maps regatta IDs to name/location/dates from the last load
+        self._regatta_options = []  # Combo values, newest regatta first
+        self._last_regatta_signature = None  # Regatta rows the combo was last built from
         self.events_tree = None
         
         # Form variables
@@ -43,10 +76,22 @@ class EventTab:
         
         # Store event data for deletion
         self.event_data = {}  # Maps tree item IDs to event data
+        self._column_char_widths = [len(column) for column in _EVENT_COLUMN_MIN_WIDTHS]  # Widest text per column
+        self._applied_column_widths = dict(_EVENT_COLUMN_MIN_WIDTHS)  # Pixel widths last given to the tree
         
         # Flag to prevent recursive event handling
         self._updating_regatta_combo = False
         
+        # Pending after() id for a debounced regatta selection
+        self._pending_refresh_after_id = None
+        
+        # Pending after() id for clearing the status label
+        self._status_clear_after_id = None
+        
+        # Events are loaded off the Tk thread; only the newest request's rows are shown
+        self._events_load_generation = 0
+        self._events_loading = False
+        
         self._create_tab()
         self._populate_regatta_combo()
     
@@ -140,6 +185,10 @@ class EventTab:
         tk.Button(form_frame, text="Create Event", font=FONT_BUTTON, 
                  command=self._add_event).grid(row=7, column=1, pady=10)
         
+        # Non-blocking confirmation for created events (no dialog to dismiss between events)
+        self.status_label = tk.Label(form_frame, text="", font=FONT_LABEL, fg='green')
+        self.status_label.grid(row=7, column=2, sticky='w', padx=5)
+        
         # Events table for selected regatta
         events_frame = tk.LabelFrame(self.frame, text="Events for Selected Regatta", font=FONT_LABEL)
         events_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -162,21 +211,21 @@ class EventTab:
         self.events_tree.heading('Distance', text='Distance')
         self.events_tree.heading('Scheduled', text='Scheduled')
         
-        self.events_tree.column('Regatta Name', width=150, anchor='center')
-        self.events_tree.column('Boat Type', width=80, anchor='center')
-        self.events_tree.column('Class', width=60, anchor='center')
-        self.events_tree.column('Gender', width=60, anchor='center')
-        self.events_tree.column('Weight', width=80, anchor='center')
-        self.events_tree.column('Round', width=100, anchor='center')
-        self.events_tree.column('Distance', width=80, anchor='center')
-        self.events_tree.column('Scheduled', width=120, anchor='center')
+        self.events_tree.column('Regatta Name', width=150, minwidth=150, stretch=False, anchor='center')
+        self.events_tree.column('Boat Type', width=80, minwidth=80, stretch=False, anchor='center')
+        self.events_tree.column('Class', width=60, minwidth=60, stretch=False, anchor='center')
+        self.events_tree.column('Gender', width=60, minwidth=60, stretch=False, anchor='center')
+        self.events_tree.column('Weight', width=80, minwidth=80, stretch=False, anchor='center')
+        self.events_tree.column('Round', width=100, minwidth=100, stretch=False, anchor='center')
+        self.events_tree.column('Distance', width=80, minwidth=80, stretch=False, anchor='center')
+        self.events_tree.column('Scheduled', width=120, minwidth=120, stretch=False, anchor='center')
         
         # Add scrollbar
-        events_scrollbar = ttk.Scrollbar(events_container, orient='vertical', command=self.events_tree.yview)
-        self.events_tree.configure(yscrollcommand=events_scrollbar.set)
+        self.events_scrollbar = ttk.Scrollbar(events_container, orient='vertical', command=self.events_tree.yview)
+        self.events_tree.configure(yscrollcommand=self.events_scrollbar.set)
         
         self.events_tree.pack(side='left', fill='both', expand=True)
-        events_scrollbar.pack(side='right', fill='y')
+        self.events_scrollbar.pack(side='right', fill='y')
         
         # Make the events table sortable
         sortable_columns = ['Regatta Name', 'Boat Type', 'Class', 'Gender', 'Weight', 'Round', 'Distance', 'Scheduled']
@@ -225,22 +274,7 @@ class EventTab:
         """Populate the regatta dropdown with initial data only."""
         self._updating_regatta_combo = True
         try:
-            regattas = self.db.get_regattas()
-            
-            # Sort regattas by start_date instead of alphabetically
-            regattas_sorted = sorted(regattas, key=lambda x: x[3] if x[3] else '9999-12-31', reverse=True)  # x[3] is start_date
-            
-            regatta_options = []
-            self.regatta_id_map = {}
-            
-            for regatta_id, name, location, start_date, end_date in regattas_sorted:
-                display_text = format_regatta_display_name(name, location, start_date)
-                regatta_options.append(display_text)
-                self.regatta_id_map[display_text] = regatta_id
-            
-            # Remove the alphabetical sort - regatta_options.sort()
-            
-            self.regatta_combo['values'] = regatta_options
+            regatta_options = self._load_regatta_options(self.db.get_regattas())
             
             # Only set initial selection if no regatta is currently selected
             if regatta_options and not self.app.current_regatta_id:
@@ -256,18 +290,54 @@ class EventTab:
         finally:
             self._updating_regatta_combo = False
     
+    def _load_regatta_options(self, regattas):
+        """Rebuild the regatta combo values and lookups, skipping the work if nothing changed.
+        
+        Args:
+            regattas: Rows from get_regattas()
+            
+        Returns:
+            Combo display texts, newest regatta first
+        """
+        signature = tuple(regattas)
+        if signature == self._last_regatta_signature:
+            # Same regattas as last time (e.g. only an event changed); the combo is already current
+            return self._regatta_options
+        
+        # Sort regattas by start_date instead of alphabetically
+        regattas_sorted = sorted(regattas, key=lambda x: x[3] if x[3] else '9999-12-31', reverse=True)  # x[3] is start_date
+        
+        regatta_options = []
+        self.regatta_id_map = {}
+        self.regatta_display_by_id = {}
+        self.regatta_info = {}
+        
+        for regatta_id, name, location, start_date, end_date in regattas_sorted:
+            display_text = format_regatta_display_name(name, location, start_date)
+            regatta_options.append(display_text)
+            self.regatta_id_map[display_text] = regatta_id
+            self.regatta_display_by_id[regatta_id] = display_text
+            self.regatta_info[regatta_id] = {
+                'name': name, 'location': location, 'start_date': start_date, 'end_date': end_date
+            }
+        
+        self.regatta_combo['values'] = regatta_options
+        self._regatta_options = regatta_options
+        self._last_regatta_signature = signature
+        return regatta_options
+    
     def _set_regatta_combo_to_current(self):
         """Set the regatta combo to show the current regatta without triggering events."""
         if not self.app.current_regatta_id:
             return
             
-        for display_text, regatta_id in self.regatta_id_map.items():
-            if regatta_id == self.app.current_regatta_id:
-                # Use StringVar.set() to avoid triggering ComboboxSelected event
-                self.regatta_var.set(display_text)
-                self._refresh_events_list()
-                self._set_default_scheduled_date(regatta_id)
-                break
+        regatta_id = self.app.current_regatta_id
+        display_text = self.regatta_display_by_id.get(regatta_id)
+        if display_text:
+            # Use StringVar.set() to avoid triggering ComboboxSelected event
+            self.regatta_var.set(display_text)
+            self._refresh_events_list()
+            self._set_default_scheduled_date(regatta_id)
     
     def _on_regatta_combo_select(self, event):
         """Handle regatta selection from user interaction."""
@@ -275,29 +345,38 @@ class EventTab:
         if self._updating_regatta_combo:
             return
             
+        # Only the last of several quick selections (e.g. arrowing through the list) does the refresh
+        if self._pending_refresh_after_id:
+            self.frame.after_cancel(self._pending_refresh_after_id)
         selected_text = self.regatta_var.get()
+        self._pending_refresh_after_id = self.frame.after(
+            _REGATTA_SELECT_DEBOUNCE_MS, lambda t=selected_text: self._do_regatta_select(t))
+    
+    def _do_regatta_select(self, selected_text):
+        """Apply a (debounced) regatta selection."""
+        self._pending_refresh_after_id = None
         if selected_text in self.regatta_id_map:
-            regatta_id = self.regatta_id_map[selected_text]
-            self.app.set_current_regatta(regatta_id)
-            self._refresh_events_list()
-            self._set_default_scheduled_date(regatta_id)
+            # The app notifies this tab back through on_regatta_changed, which reloads the
+            # events and the default scheduled date once
+            self.app.set_current_regatta(self.regatta_id_map[selected_text])
     
     def _set_default_scheduled_date(self, regatta_id):
         """Set the scheduled date to the regatta's start date."""
-        # Get regatta details to find start date
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT start_date FROM regattas WHERE regatta_id = ?", (regatta_id,))
-        result = cursor.fetchone()
+        # Start date comes from the regattas loaded into the combo, or the database if not loaded yet
+        if regatta_id in self.regatta_info:
+            start_date_str = self.regatta_info[regatta_id]['start_date']  # Format: YYYY-MM-DD
+        else:
+            start_date_str = self.db.get_regatta_start_date(regatta_id)
         
-        if result and result[0]:
-            start_date_str = result[0]  # Format: YYYY-MM-DD
+        # Only attempt to parse strings shaped like YYYY-MM-DD; anything else leaves the picker as is
+        if (start_date_str and len(start_date_str) == 10
+                and start_date_str[4] == '-' and start_date_str[7] == '-'):
             try:
                 # Parse the date string and set it in the date picker
-                from datetime import datetime
                 start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
                 self.scheduled_date.set_date(start_date)
             except ValueError:
-                # If date parsing fails, just leave it as is
+                # Right shape but not a real date (e.g. 2024-02-30)
                 pass
             
     def _validate_event_distance(self, event=None):
@@ -322,71 +401,117 @@ class EventTab:
 
     def _refresh_events_list(self):
         """Refresh the events table for the selected regatta."""
-        # Clear existing items and event data mapping
-        for item in self.events_tree.get_children():
-            self.events_tree.delete(item)
+        # Clear existing items (one Tcl call for all of them) and event data mapping
+        children = self.events_tree.get_children()
+        if children:
+            self.events_tree.delete(*children)
         self.event_data.clear()
         
+        # Supersede any load still in flight
+        self._events_load_generation += 1
+        generation = self._events_load_generation
+        
         if not self.app.current_regatta_id:
+            self._events_loading = False
             return
         
-        # Get regatta name for display
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT name FROM regattas WHERE regatta_id = ?", (self.app.current_regatta_id,))
-        regatta_result = cursor.fetchone()
-        regatta_name = regatta_result[0] if regatta_result else "Unknown"
+        # Query on a worker thread so the UI stays responsive; rows are shown by _on_events_loaded
+        regatta_id = self.app.current_regatta_id
+        self._events_loading = True
+        run_in_background(
+            self.frame,
+            lambda: self._fetch_events(regatta_id),
+            lambda events, error: self._on_events_loaded(generation, events, error)
+        )
+    
+    def _fetch_events(self, regatta_id):
+        """Query a regatta's events for display (runs on the worker thread)."""
+        with self.db.worker_connection() as conn:
+            # Rows come back with the regatta name and gender/weight descriptions already filled in
+            return self.db.get_events_for_regatta_display(regatta_id, conn)
+    
+    def _on_events_loaded(self, generation, events, error):
+        """Fill the events table from a background load (runs on the Tk thread)."""
+        if generation != self._events_load_generation:
+            # A newer refresh was started; its rows will arrive separately
+            return
+        self._events_loading = False
         
-        events = self.db.get_events_for_regatta(self.app.current_regatta_id)
+        if error is not None:
+            messagebox.showerror("Database Error", f"Failed to load events: {str(error)}")
+            return
         
-        # Prepare data for display and auto-sizing
-        display_data = []
+        # Widest text per column in characters (headers count too)
+        char_widths = [len(column) for column in _EVENT_COLUMN_MIN_WIDTHS]
+        display_rows = []
+        for row in events:
+            row_data = row[:8]
+            display_rows.append(row_data)
+            for i, value in enumerate(row_data):
+                length = len(str(value)) if value is not None else 0
+                if length > char_widths[i]:
+                    char_widths[i] = length
+        
+        # Take the tree out of the layout while rows go in so it is laid out once, not per row.
+        # The loop does nothing but insert; event data is stored afterwards.
+        insert = self.events_tree.insert
+        self.events_tree.pack_forget()
+        try:
+            item_ids = [insert('', 'end', values=row_data) for row_data in display_rows]
+        finally:
+            # Re-pack ahead of the scrollbar to keep the original packing order
+            self.events_tree.pack(side='left', fill='both', expand=True, before=self.events_scrollbar)
         
-        for event_id, boat_type, event_boat_class, gender, weight, round_name, event_distance, scheduled_at in events:
-            # Convert codes to full display names
-            gender_display = next((desc for code, desc in GENDERS if code == gender), gender)
-            weight_display = next((desc for code, desc in WEIGHTS if code == weight), weight)
-            
-            scheduled_display = scheduled_at if scheduled_at else ""
-            row_data = (regatta_name, boat_type, event_boat_class, gender_display, weight_display, round_name, event_distance, scheduled_display)
-            display_data.append(row_data)
-            
-            # Insert into tree and store event data for deletion
-            item_id = self.events_tree.insert('', 'end', values=row_data)
-            self.event_data[item_id] = {
-                'event_id': event_id,
-                'boat_type': boat_type,
-                'event_boat_class': event_boat_class,
-                'gender': gender,
-                'weight': weight,
-                'round_name': round_name,
-                'event_distance': event_distance,
-                'scheduled_at': scheduled_at
+        # Store event data for deletion
+        self.event_data = {
+            item_id: {
+                'event_id': row[8],
+                'boat_type': row[1],
+                'event_boat_class': row[2],
+                'gender': row[9],
+                'weight': row[10],
+                'round_name': row[5],
+                'event_distance': row[6],
+                'scheduled_at': row[11]
             }
-        
-        # Auto-size columns using the utility function
-        column_headers = {
-            'Regatta Name': 'Regatta Name',
-            'Boat Type': 'Boat Type',
-            'Class': 'Class',
-            'Gender': 'Gender',
-            'Weight': 'Weight',
-            'Round': 'Round',
-            'Distance': 'Distance',
-            'Scheduled': 'Scheduled'
+            for item_id, row in zip(item_ids, events)
         }
         
-        min_widths = {
-            'Regatta Name': 150,
-            'Boat Type': 80,
-            'Class': 60,
-            'Gender': 60,
-            'Weight': 80,
-            'Round': 100,
-            'Distance': 80,
-            'Scheduled': 120
-        }
+        self._column_char_widths = char_widths
         
-        auto_size_treeview_columns(self.events_tree, display_data, column_headers, min_widths)
+        # Auto-size columns from the widths gathered above
+        if events:
+            for i in range(len(char_widths)):
+                self._apply_column_width(i)
+    
+    def _insert_event_row(self, event_info):
+        """Add one newly created event to the table without reloading the others."""
+        regatta_name = self.regatta_info.get(self.app.current_regatta_id, {}).get('name', "Unknown")
+        row_data = (regatta_name, event_info['boat_type'], event_info['event_boat_class'],
+                    _GENDER_MAP.get(event_info['gender'], event_info['gender']),
+                    _WEIGHT_MAP.get(event_info['weight'], event_info['weight']),
+                    event_info['round_name'], event_info['event_distance'], event_info['scheduled_at'] or "")
+        
+        # Append it; the column headers can re-sort the table into any order, so there's
+        # no reliable sorted position to search for (the next full refresh reorders it)
+        item_id = self.events_tree.insert('', 'end', values=row_data)
+        self.event_data[item_id] = event_info
+        
+        # Widen only the columns the new row doesn't fit in
+        for i, value in enumerate(row_data):
+            length = len(str(value))
+            if length > self._column_char_widths[i]:
+                self._column_char_widths[i] = length
+                self._apply_column_width(i)
+    
+    def _apply_column_width(self, index):
+        """Size a column to its widest text, skipping the Tcl call when the width is unchanged."""
+        column = _EVENT_COLUMNS[index]
+        width = max(self._column_char_widths[index] * _CHAR_WIDTH_PX + _COLUMN_PADDING_PX,
+                    _EVENT_COLUMN_MIN_WIDTHS[column])
+        if self._applied_column_widths[column] != width:
+            self.events_tree.column(column, width=width)
+            self._applied_column_widths[column] = width
     
     def _on_event_double_click(self, event):
         """Handle double-click on event (for user feedback)."""
@@ -455,11 +580,12 @@ class EventTab:
                 
                 messagebox.showinfo("Event Deleted", success_msg)
                 
-                # Refresh only the events list (not the regatta combo)
-                self._refresh_events_list()
+                # Drop just this row; the rest of the events list is unchanged
+                self.events_tree.delete(item_id)
+                self.event_data.pop(item_id, None)
                 
-                # Notify main app to refresh other tabs
-                self.app.refresh_all_tabs()
+                # Notify main app so other tabs update their event lists
+                self.app.refresh_after_event_change()
                 
             else:
                 messagebox.showerror("Error", "Event could not be deleted. It may have already been removed.")
@@ -469,6 +595,12 @@ class EventTab:
     
     def _add_event(self):
         """Add a new event to the selected regatta."""
+        # Apply a regatta pick still waiting out the debounce, so the event goes into the
+        # regatta the combo shows rather than the previously selected one
+        if self._pending_refresh_after_id:
+            self.frame.after_cancel(self._pending_refresh_after_id)
+            self._do_regatta_select(self.regatta_var.get())
+        
         if not self.app.current_regatta_id:
             messagebox.showerror("Error", "Please select a regatta first")
             return
@@ -498,9 +630,9 @@ class EventTab:
                 return
 
         # Find gender code
-        gender = next((code for code, desc in GENDERS if desc == gender_display), "M")
+        gender = _GENDER_INV.get(gender_display, "M")
         # Find weight code  
-        weight = next((code for code, desc in WEIGHTS if desc == weight_display), "LW")
+        weight = _WEIGHT_INV.get(weight_display, "LW")
         round_name = self.round_var.get()
         
         # Get scheduled datetime if provided
@@ -525,71 +657,69 @@ class EventTab:
             if scheduled_at:
                 event_description += f" at {scheduled_at}"
             
-            messagebox.showinfo("Success", f"Created event: {event_description}")
+            self._show_status(f"✓ Created: {event_description}")
             
             # Reset form for next event
             self.scheduled_time_entry.delete(0, tk.END)
             self.scheduled_time_entry._add_placeholder()
             
-            # Refresh ONLY the events display - NOT the regatta combo
-            self._refresh_events_list()
+            # Show the new event - NOT a reload of the events display or the regatta combo.
+            # A load still in flight may predate the insert, so reload in that case instead.
+            if self._events_loading:
+                self._refresh_events_list()
+            else:
+                self._insert_event_row({
+                    'event_id': event_id,
+                    'boat_type': boat_type,
+                    'event_boat_class': event_boat_class,
+                    'gender': gender,
+                    'weight': weight,
+                    'round_name': round_name,
+                    'event_distance': event_distance,
+                    'scheduled_at': scheduled_at
+                })
             
             # Notify main app about the new event (but don't refresh this tab again)
-            if hasattr(self.app, 'refresh_tabs_except_events'):
-                self.app.refresh_tabs_except_events()
-            else:
-                # Fallback: refresh other tabs manually
-                if hasattr(self.app, 'entries_results_tab'):
-                    self.app.entries_results_tab.refresh()
-                if hasattr(self.app, 'conference_tab'):
-                    self.app.conference_tab.refresh()
+            self.app.refresh_after_event_change()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create event: {str(e)}")
     
+    def _show_status(self, message):
+        """Show a message next to the Create button and clear it after a few seconds."""
+        if self._status_clear_after_id:
+            self.frame.after_cancel(self._status_clear_after_id)
+        self.status_label.config(text=message)
+        self._status_clear_after_id = self.frame.after(
+            _STATUS_CLEAR_MS, lambda: self.status_label.config(text=''))
+    
     def get_all_events(self):
         """Get all events for use by other tabs."""
         return self.db.get_all_events()
     
     def refresh(self):
-        """Refresh this tab's data without changing current regatta selection."""
+        """Refresh this tab's data without changing current regatta selection.
+        
+        Hidden-tab deferral is handled by the main window: refresh_all_tabs only
+        refreshes the visible tab and catches the others up when they are selected.
+        """
+        self.refresh_regattas()
+        self.refresh_events()
+    
+    def refresh_regattas(self):
+        """Reload the regatta dropdown, keeping the current regatta selected if it still exists."""
         # Store the currently selected regatta ID before refreshing
         current_regatta_id = self.app.current_regatta_id
         
         self._updating_regatta_combo = True
         try:
             # Refresh the regatta dropdown options
-            regattas = self.db.get_regattas()
-            regatta_options = []
-            self.regatta_id_map = {}
-            
-            for regatta_id, name, location, start_date, end_date in regattas:
-                display_text = format_regatta_display_name(name, location, start_date)
-                regatta_options.append(display_text)
-                self.regatta_id_map[display_text] = regatta_id
-            
-            # Sort regattas by start_date instead of alphabetically
-            regattas_sorted = sorted(regattas, key=lambda x: x[3] if x[3] else '9999-12-31', reverse=True)  # x[3] is start_date
-
-            regatta_options = []
-            self.regatta_id_map = {}
-
-            for regatta_id, name, location, start_date, end_date in regattas_sorted:
-                display_text = format_regatta_display_name(name, location, start_date)
-                regatta_options.append(display_text)
-                self.regatta_id_map[display_text] = regatta_id
-            
-            # Update the combo values
-            self.regatta_combo['values'] = regatta_options
+            regatta_options = self._load_regatta_options(self.db.get_regattas())
             
             # Restore the previous selection if it still exists
             if current_regatta_id and regatta_options:
                 # Find the display text for the current regatta ID
-                selected_display_text = None
-                for display_text, stored_id in self.regatta_id_map.items():
-                    if stored_id == current_regatta_id:
-                        selected_display_text = display_text
-                        break
+                selected_display_text = self.regatta_display_by_id.get(current_regatta_id)
                 
                 if selected_display_text:
                     # Set the combo to show the previously selected regatta WITHOUT triggering the event
@@ -605,25 +735,24 @@ class EventTab:
                 # No current selection, select the first one
                 self.regatta_var.set(regatta_options[0])
                 self.app.current_regatta_id = self.regatta_id_map[regatta_options[0]]
-            
-            # Refresh the events list for the current regatta
-            self._refresh_events_list()
-            
         finally:
             self._updating_regatta_combo = False
     
+    def refresh_events(self):
+        """Reload the events table for the current regatta without touching the regatta dropdown."""
+        self._refresh_events_list()
+    
     def refresh_for_regatta(self, regatta_id):
         """Refresh this tab for a specific regatta (called by main app)."""
         # This method is called when regatta selection changes from another tab
         self._updating_regatta_combo = True
         try:
             # Update the combo box to show the selected regatta
-            for display_text, stored_id in self.regatta_id_map.items():
-                if stored_id == regatta_id:
-                    self.regatta_var.set(display_text)
-                    self._refresh_events_list()
-                    self._set_default_scheduled_date(regatta_id)
-                    break
+            display_text = self.regatta_display_by_id.get(regatta_id)
+            if display_text:
+                self.regatta_var.set(display_text)
+                self._refresh_events_list()
+                self._set_default_scheduled_date(regatta_id)
         finally:
             self._updating_regatta_combo = False
     
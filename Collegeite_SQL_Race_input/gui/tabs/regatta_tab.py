@@ -7,6 +7,7 @@ from tkinter import messagebox, ttk
 from tkcalendar import DateEntry
 
 from Collegeite_SQL_Race_input.config.constants import FONT_LABEL, FONT_ENTRY, FONT_BUTTON, FONT_TITLE
+from Collegeite_SQL_Race_input.utils.helpers import run_in_background
 
 
 class RegattaTab:
@@ -29,7 +30,8 @@ class RegattaTab:
         self.regatta_end_date = None
         
         # Store regatta data for deletion
-        self.regatta_data = {}  # Maps listbox indices to regatta data
+        self.regatta_data = []  # (regatta_id, name, location, start_date, end_date) rows in listbox order
+        self._rendered_regattas_version = None  # db.regattas_version the listbox was built from
         
         self._create_tab()
         self._refresh_regatta_list()
@@ -104,42 +106,59 @@ class RegattaTab:
         self.regatta_listbox.bind('<Double-1>', self._on_regatta_double_click)
     
     def _on_start_date_change(self, event):
-        """When start date changes, automatically set end date to match."""
+        """When start date moves past the end date, automatically set end date to match."""
         try:
             start_date = self.regatta_start_date.get_date()
-            self.regatta_end_date.set_date(start_date)
-        except:
-            # If there's any issue getting/setting dates, just continue
+            end_date_entry = self.regatta_end_date
+            # Leave a valid range alone; set_date redraws the widget
+            if end_date_entry.get_date() < start_date:
+                end_date_entry.set_date(start_date)
+        except (ValueError, AttributeError):
+            # Unparseable date text, or the end date widget isn't built yet; just continue
             pass
     
     def _refresh_regatta_list(self):
         """Refresh the regatta listbox with current data."""
+        # Nothing to do if no regatta was added or deleted since the last render
+        if self._rendered_regattas_version == self.db.regattas_version:
+            return
+        self._rendered_regattas_version = self.db.regattas_version
+        
         self.regatta_listbox.delete(0, tk.END)
-        self.regatta_data.clear()
         
-        regattas = self.db.get_regattas()
-        for index, (regatta_id, name, location, start_date, end_date) in enumerate(regattas):
-            display_text = f"{name} - {location} ({start_date})"
-            self.regatta_listbox.insert(tk.END, display_text)
-            
-            # Store regatta data for deletion
-            self.regatta_data[index] = {
-                'regatta_id': regatta_id,
-                'name': name,
-                'location': location,
-                'start_date': start_date,
-                'end_date': end_date
-            }
+        # Keep the query rows as-is for deletion and add every line in one insert call
+        self.regatta_data = self.db.get_regattas()
+        display = [f"{name} - {location} ({start_date})" for _, name, location, start_date, _ in self.regatta_data]
+        if display:
+            self.regatta_listbox.insert(tk.END, *display)
+    
+    def _insert_regatta_row(self, regatta_id, name, location, start_date, end_date):
+        """Add one new regatta to the listbox, keeping the newest-first order of get_regattas()."""
+        index = len(self.regatta_data)
+        for i, row in enumerate(self.regatta_data):
+            if (row[3] or '') < start_date:  # row[3] is start_date
+                index = i
+                break
+        
+        self.regatta_listbox.insert(index, f"{name} - {location} ({start_date})")
+        self.regatta_data.insert(index, (regatta_id, name, location, start_date, end_date))
+        self._rendered_regattas_version = self.db.regattas_version
+    
+    def _remove_regatta_row(self, index):
+        """Remove one deleted regatta from the listbox."""
+        self.regatta_listbox.delete(index)
+        self.regatta_data.pop(index)
+        self._rendered_regattas_version = self.db.regattas_version
     
     def _on_regatta_double_click(self, event):
         """Handle double-click on regatta (for user feedback)."""
         selection = self.regatta_listbox.curselection()
         if selection:
             index = selection[0]
-            if index in self.regatta_data:
-                regatta_info = self.regatta_data[index]
-                regatta_desc = f"{regatta_info['name']} - {regatta_info['location']} ({regatta_info['start_date']})"
-                messagebox.showinfo("Regatta Selected", f"Selected: {regatta_desc}\\n\\nUse the 'Delete Selected Regatta' button to remove this regatta.")
+            if 0 <= index < len(self.regatta_data):
+                _, name, location, start_date, _ = self.regatta_data[index]
+                regatta_desc = f"{name} - {location} ({start_date})"
+                messagebox.showinfo("Regatta Selected", f"Selected: {regatta_desc}\n\nUse the 'Delete Selected Regatta' button to remove this regatta.")
     
     def _delete_selected_regatta(self):
         """Delete the selected regatta and all associated events/entries/results."""
@@ -149,101 +168,121 @@ class RegattaTab:
             return
         
         index = selection[0]
-        if index not in self.regatta_data:
+        if not 0 <= index < len(self.regatta_data):
             messagebox.showerror("Error", "Could not find regatta data for selected item.")
             return
         
-        regatta_info = self.regatta_data[index]
-        regatta_id = regatta_info['regatta_id']
+        regatta_id, name, location, start_date, end_date = self.regatta_data[index]
         
         # Create descriptive regatta name for confirmation
-        regatta_desc = f"{regatta_info['name']} - {regatta_info['location']}"
-        if regatta_info['start_date'] == regatta_info['end_date']:
-            regatta_desc += f" ({regatta_info['start_date']})"
+        regatta_desc = f"{name} - {location}"
+        if start_date == end_date:
+            regatta_desc += f" ({start_date})"
         else:
-            regatta_desc += f" ({regatta_info['start_date']} to {regatta_info['end_date']})"
+            regatta_desc += f" ({start_date} to {end_date})"
         
-        # Use DatabaseManager methods to get counts for confirmation
-        event_count = self.db.get_regatta_event_count(regatta_id)
-        entry_count = self.db.get_regatta_entry_count(regatta_id)
+        # Get both counts for the confirmation in one query
+        event_count, entry_count = self.db.get_regatta_summary_counts(regatta_id)
         
-        # Create confirmation message
+        # Create confirmation message from paragraphs
+        parts = ["Are you sure you want to delete this regatta?", f"Regatta: {regatta_desc}"]
         if event_count > 0 or entry_count > 0:
-            confirm_msg = (f"Are you sure you want to delete this regatta?\\n\\n"
-                          f"Regatta: {regatta_desc}\\n\\n"
-                          f"⚠️ WARNING: This will also permanently delete:\\n")
-            
+            warning = ["⚠️ WARNING: This will also permanently delete:"]
             if event_count > 0:
-                confirm_msg += f"• {event_count} events\\n"
+                warning.append(f"• {event_count} events")
             if entry_count > 0:
-                confirm_msg += f"• {entry_count} team entries\\n"
-                confirm_msg += f"• All associated race results\\n"
-            
-            confirm_msg += f"\\nThis action cannot be undone!"
-        else:
-            confirm_msg = (f"Are you sure you want to delete this regatta?\\n\\n"
-                          f"Regatta: {regatta_desc}\\n\\n"
-                          f"This action cannot be undone!")
+                warning.append(f"• {entry_count} team entries")
+                warning.append("• All associated race results")
+            parts.append("\n".join(warning))
+        parts.append("This action cannot be undone!")
+        confirm_msg = "\n\n".join(parts)
         
         # Show confirmation dialog
         result = messagebox.askyesno("Confirm Regatta Deletion", confirm_msg, icon='warning')
         if not result:
             return
         
-        try:
-            # Use DatabaseManager's delete_regatta method
-            results_deleted, entries_deleted, events_deleted, regattas_deleted = self.db.delete_regatta(regatta_id)
+        # Run the cascade on a worker thread so a large delete doesn't freeze the window
+        self.btn_delete_regatta.config(state='disabled')
+        run_in_background(
+            self.frame,
+            lambda: self._run_delete_regatta(regatta_id),
+            lambda counts, error: self._on_regatta_deleted(regatta_id, regatta_desc, counts, error)
+        )
+    
+    def _run_delete_regatta(self, regatta_id):
+        """Delete a regatta and its events/entries/results (runs on the worker thread)."""
+        with self.db.worker_connection() as conn:
+            return self.db.delete_regatta(regatta_id, conn)
+    
+    def _on_regatta_deleted(self, regatta_id, regatta_desc, counts, error):
+        """Report a background regatta delete and update the list (runs on the Tk thread)."""
+        self.btn_delete_regatta.config(state='normal')
+        
+        if error is not None:
+            messagebox.showerror("Database Error", f"Failed to delete regatta: {str(error)}")
+            return
+        
+        # The worker left the caches alone; they are only touched from this thread
+        self.db.forget_regatta(regatta_id)
+        
+        results_deleted, entries_deleted, events_deleted, regattas_deleted = counts
+        if regattas_deleted > 0:
+            # Create success message
+            parts = [f"Successfully deleted regatta: {regatta_desc}"]
+            if events_deleted > 0 or entries_deleted > 0 or results_deleted > 0:
+                removed = ["Also removed:"]
+                if events_deleted > 0:
+                    removed.append(f"• {events_deleted} events")
+                if entries_deleted > 0:
+                    removed.append(f"• {entries_deleted} team entries")
+                if results_deleted > 0:
+                    removed.append(f"• {results_deleted} race results")
+                parts.append("\n".join(removed))
+            success_msg = "\n\n".join(parts)
             
-            if regattas_deleted > 0:
-                # Create success message
-                success_msg = f"Successfully deleted regatta: {regatta_desc}"
-                if events_deleted > 0 or entries_deleted > 0 or results_deleted > 0:
-                    success_msg += f"\\n\\nAlso removed:\\n"
-                    if events_deleted > 0:
-                        success_msg += f"• {events_deleted} events\\n"
-                    if entries_deleted > 0:
-                        success_msg += f"• {entries_deleted} team entries\\n"
-                    if results_deleted > 0:
-                        success_msg += f"• {results_deleted} race results"
-                
-                messagebox.showinfo("Regatta Deleted", success_msg)
-                
-                # Refresh the regatta list
-                self._refresh_regatta_list()
-                
-                # Notify main app to refresh other tabs
-                self.app.refresh_all_tabs()
-                
-            else:
-                messagebox.showerror("Error", "Regatta could not be deleted. It may have already been removed.")
-                
-        except Exception as e:
-            messagebox.showerror("Database Error", f"Failed to delete regatta: {str(e)}")
+            messagebox.showinfo("Regatta Deleted", success_msg)
+            
+            # Drop just this row from the regatta list; look it up again since the list may have changed
+            for index, row in enumerate(self.regatta_data):
+                if row[0] == regatta_id:
+                    self._remove_regatta_row(index)
+                    break
+            
+            # Notify main app to refresh other tabs
+            self.app.refresh_all_tabs({'regattas', 'events', 'entries'})
+            
+        else:
+            messagebox.showerror("Error", "Regatta could not be deleted. It may have already been removed.")
     
     def _add_regatta(self):
         """Add a new regatta to the database."""
-        name = self.regatta_name_entry.get().strip()
-        location = self.regatta_location_entry.get().strip()
-        start_date = self.regatta_start_date.get()
-        end_date = self.regatta_end_date.get()
+        name_entry = self.regatta_name_entry
+        name = name_entry.get().strip()
         
+        # Check the name before reading the rest of the form
         if not name:
             messagebox.showerror("Error", "Regatta name is required")
             return
         
+        location_entry = self.regatta_location_entry
+        location = location_entry.get().strip()
+        start_date = self.regatta_start_date.get()
+        end_date = self.regatta_end_date.get()
+        
         try:
             regatta_id = self.db.add_regatta(name, location, start_date, end_date)
             messagebox.showinfo("Success", f"Added regatta: {name}")
             
             # Clear form
-            self.regatta_name_entry.delete(0, tk.END)
-            self.regatta_location_entry.delete(0, tk.END)
+            name_entry.delete(0, tk.END)
+            location_entry.delete(0, tk.END)
             
-            # Refresh data
-            self._refresh_regatta_list()
+            # Show the new regatta without rebuilding the list
+            self._insert_regatta_row(regatta_id, name, location, start_date, end_date)
             
             # Notify main app to refresh other tabs
-            self.app.refresh_all_tabs()
+            self.app.refresh_all_tabs({'regattas', 'events', 'entries'})
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add regatta: {str(e)}")
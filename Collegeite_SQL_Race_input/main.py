@@ -128,33 +128,13 @@ class RowingDatabaseApp:
         # Helper method that can be used by entry tab
         try:
             # Get event details
-            event = self.db.get_event_by_id(event_id)
+            event = self.db.get_event_details(event_id)
             if not event:
                 return []
             
-            gender = event.get('gender')
-            weight = event.get('weight')
-            
-            # Get teams matching the event criteria
-            teams = self.db.get_teams_by_category(gender, weight)
-            
-            # Get school details for each team
-            schools = []
-            for team in teams:
-                school = self.db.get_school_by_id(team['school_id'])
-                if school:
-                    schools.append({
-                        'team_id': team['team_id'],
-                        'school_id': school['school_id'],
-                        'crr_name': school['crr_name'],
-                        'name': school['name'],
-                        'short_name': school['short_name'],
-                        'color': school['color']
-                    })
-            
-            # Sort by CRR name for consistent display
-            schools.sort(key=lambda x: x['crr_name'])
-            return schools
+            # Teams and their schools come back joined and already sorted by CRR name;
+            # rows are sqlite3.Row, converted to dicts once here for callers
+            return [dict(row) for row in self.db.get_schools_for_event_category(event['gender'], event['weight'])]
             
         except Exception as e:
             print(f"Error getting schools for event {event_id}: {e}")
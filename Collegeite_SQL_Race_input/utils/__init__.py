@@ -7,11 +7,12 @@ Contains helper functions and utilities that don't fit into other modules:
 - Common operations
 """
 
-from .helpers import format_event_display_name, format_regatta_display_name, auto_size_treeview_columns, make_treeview_sortable
+from .helpers import format_event_display_name, format_regatta_display_name, auto_size_treeview_columns, make_treeview_sortable, run_in_background
 
 __all__ = [
     "format_event_display_name",
     "format_regatta_display_name",
     "auto_size_treeview_columns",
     "make_treeview_sortable",
+    "run_in_background",
 ]
\ No newline at end of file
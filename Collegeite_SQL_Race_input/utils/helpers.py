@@ -3,14 +3,37 @@ Helper utility functions for the rowing database application.
 Enhanced with D1 Schools tab components for better code organization.
 """
 
+import os
+import queue
+import re
+import sys
+import threading
+from collections import Counter
+from functools import cached_property, lru_cache
 from tkinter import ttk, messagebox
-from typing import Dict, List, Tuple, Any, Optional, Set
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Any, Optional, Set, Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
 # ── Original Helper Functions ──────────────────────────────────────────
 
+# Display names depend only on their (string) arguments, so repeated refreshes reuse them
+DISPLAY_NAME_CACHE_SIZE = 4096
+
+# Code -> display word used in event names
+_EVENT_GENDER_NAMES = {
+    'M': "Men's",
+    'W': "Women's"
+}
+_EVENT_WEIGHT_NAMES = {
+    'LW': "Lightweight",
+    'HW': "Heavyweight",
+    'OW': "Openweight"
+}
+
+
+@lru_cache(maxsize=DISPLAY_NAME_CACHE_SIZE)
 def format_event_display_name(gender, weight, event_boat_class, boat_type, round_name, event_distance=None, scheduled_at=None):
     """
     Format an event name for display in dropdowns and other UI elements.
@@ -27,32 +50,14 @@ def format_event_display_name(gender, weight, event_boat_class, boat_type, round
     Returns:
         Formatted string like "Openweight Women's 1V 8+ - Final (2k)"
     """
-    # Gender mapping
-    gender_map = {
-        'M': "Men's",
-        'W': "Women's"
-    }
-    
-    # Weight mapping
-    weight_map = {
-        'LW': "Lightweight",
-        'HW': "Heavyweight", 
-        'OW': "Openweight"
-    }
-    
-    # Build the display name
-    gender_str = gender_map.get(gender, gender)
-    weight_str = weight_map.get(weight, weight)
-    
-    display_name = f"{weight_str} {gender_str} {event_boat_class} {boat_type} - {round_name}"
-      
-    # Add scheduled time if provided
-    if scheduled_at:
-        display_name += f" at {scheduled_at}"
-    
-    return display_name
+    # Build the display name, adding the scheduled time if provided; interned
+    # since the same name ends up in many dropdowns, tree rows and dict keys
+    return sys.intern(f"{_EVENT_WEIGHT_NAMES.get(weight, weight)} {_EVENT_GENDER_NAMES.get(gender, gender)} "
+                      f"{event_boat_class} {boat_type} - {round_name}"
+                      + (f" at {scheduled_at}" if scheduled_at else ""))
 
 
+@lru_cache(maxsize=DISPLAY_NAME_CACHE_SIZE)
 def format_regatta_display_name(name, location, start_date):
     """
     Format a regatta name for display in dropdowns.
@@ -66,9 +71,9 @@ def format_regatta_display_name(name, location, start_date):
         Formatted string like "Head of the Charles - Boston (2024-10-19)"
     """
     if start_date:
-        return f"{name} - ({start_date})"
+        return sys.intern(f"{name} - ({start_date})")
     else:
-        return f"{name}"
+        return sys.intern(f"{name}")
 
 
 
@@ -91,19 +96,17 @@ def auto_size_treeview_columns(treeview: ttk.Treeview, data_rows: List[Tuple],
     if not data_rows:
         return
     
-    # Initialize with header text lengths
+    # Widest of the header and every value, one column at a time; zip pairs each
+    # column with its transposed values and ignores any extra trailing values.
+    # Columns without NULLs (the common case) are measured entirely with map().
     column_widths = {col: len(header) for col, header in column_headers.items()}
-    
-    # Get column identifiers in order
-    columns = list(column_headers.keys())
-    
-    # Calculate maximum content width for each column
-    for row_data in data_rows:
-        for i, value in enumerate(row_data):
-            if i < len(columns):
-                column_id = columns[i]
-                str_value = str(value) if value is not None else ""
-                column_widths[column_id] = max(column_widths[column_id], len(str_value))
+    for column_id, values in zip(column_headers, zip(*data_rows)):
+        if None in values:
+            values = [value for value in values if value is not None]
+        column_widths[column_id] = max(
+            column_widths[column_id],
+            max(map(len, map(str, values)), default=0)
+        )
     
     # Set default minimum widths if not provided
     if min_widths is None:
@@ -117,6 +120,10 @@ def auto_size_treeview_columns(treeview: ttk.Treeview, data_rows: List[Tuple],
         treeview.column(column_id, width=final_width)
 
 
+# Strips the sort arrows from a header in one pass (the space before them is rstripped)
+_SORT_ARROW_REMOVAL = str.maketrans('', '', '↑↓')
+
+
 def make_treeview_sortable(treeview: ttk.Treeview, columns: List[str]):
     """
     Make a treeview sortable by clicking column headers.
@@ -127,9 +134,14 @@ def make_treeview_sortable(treeview: ttk.Treeview, columns: List[str]):
     """
     # Dictionary to track sort direction for each column
     sort_directions = {col: False for col in columns}  # False = ascending, True = descending
+    # Only one header carries an arrow at a time, so remember which
+    arrow_column = None
+    # Sort keys by cell text; a key depends only on the text, so entries never go stale
+    sort_key_cache: Dict[str, Tuple[int, Any]] = {}
     
     def sort_treeview(col):
         """Sort treeview by the specified column."""
+        nonlocal arrow_column
         # Get all items with their values
         items = [(treeview.set(item, col), item) for item in treeview.get_children('')]
         
@@ -137,30 +149,31 @@ def make_treeview_sortable(treeview: ttk.Treeview, columns: List[str]):
         reverse = sort_directions[col]
         sort_directions[col] = not sort_directions[col]  # Toggle for next click
         
-        # Smart sorting: try numeric first, fall back to string
-        try:
-            # Try to sort numerically (handles times, positions, etc.)
-            items.sort(key=lambda x: float(x[0].replace('+', '').replace(':', '').replace('.', '')) if x[0] else 0, reverse=reverse)
-        except (ValueError, AttributeError):
-            # Fall back to string sorting
-            items.sort(key=lambda x: str(x[0]).lower(), reverse=reverse)
+        # Smart sorting: numbers and times by value, then text, then empty cells.
+        # Keys are looked up once per item and reused across clicks.
+        keys = []
+        for val, item in items:
+            key = sort_key_cache.get(val)
+            if key is None:
+                key = sort_key_cache[val] = _smart_sort_key(val)
+            keys.append(key)
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
         
         # Rearrange items in treeview
-        for index, (val, item) in enumerate(items):
-            treeview.move(item, '', index)
+        for index, i in enumerate(order):
+            treeview.move(items[i][1], '', index)
+        
+        # Clear the arrow from the previously sorted column (no other header has one)
+        if arrow_column is not None and arrow_column != col:
+            other_text = treeview.heading(arrow_column)['text']
+            treeview.heading(arrow_column, text=other_text.translate(_SORT_ARROW_REMOVAL).rstrip())
         
         # Update column header to show sort direction
         current_text = treeview.heading(col)['text']
-        base_text = current_text.replace(' ↑', '').replace(' ↓', '')
+        base_text = current_text.translate(_SORT_ARROW_REMOVAL).rstrip()
         arrow = ' ↑' if reverse else ' ↓'
         treeview.heading(col, text=base_text + arrow)
-        
-        # Clear arrows from other columns
-        for other_col in columns:
-            if other_col != col:
-                other_text = treeview.heading(other_col)['text']
-                clean_text = other_text.replace(' ↑', '').replace(' ↓', '')
-                treeview.heading(other_col, text=clean_text)
+        arrow_column = col
     
     # Bind click events to column headers
     for col in columns:
@@ -169,6 +182,10 @@ def make_treeview_sortable(treeview: ttk.Treeview, columns: List[str]):
         treeview.heading(col, text=treeview.heading(col)['text'])
 
 
+# Optionally signed "ss", "ss.fff" or "m:ss.fff" (a ":" before the fraction is accepted too)
+_SORT_NUMBER_RE = re.compile(r'([+-]?)(?:(\d+):)?(\d+)(?:[.:](\d+))?')
+
+
 def _smart_sort_key(value: Any) -> Tuple[int, Any]:
     """
     Create a smart sort key that handles different data types intelligently.
@@ -181,31 +198,31 @@ def _smart_sort_key(value: Any) -> Tuple[int, Any]:
     
     str_value = str(value).strip()
     
-    # Try to parse as number (including times like "18:47.000")
+    # Numbers, times like "18:47.000" and margins like "+3.000" in one match
+    match = _SORT_NUMBER_RE.fullmatch(str_value)
+    if match:
+        sign, minutes, seconds, fraction = match.groups()
+        total_seconds = int(minutes or 0) * 60 + int(seconds)
+        if fraction:
+            total_seconds += int(fraction) / 10 ** len(fraction)
+        return (0, -total_seconds if sign == '-' else total_seconds)
+    
+    # Anything else float() accepts (".5", "1e3", ...)
     try:
-        # Handle time formats (mm:ss.fff)
-        if ':' in str_value:
-            parts = str_value.replace('.', ':').split(':')
-            if len(parts) >= 2:
-                minutes = float(parts[0])
-                seconds = float(parts[1])
-                milliseconds = float(parts[2]) if len(parts) > 2 else 0
-                total_seconds = minutes * 60 + seconds + milliseconds / 1000
-                return (0, total_seconds)
-        
-        # Handle margin formats ("+3.000")
-        clean_value = str_value.replace('+', '').replace('-', '')
-        if clean_value.replace('.', '').isdigit():
-            return (0, float(clean_value))
-        
-        # Try direct numeric conversion
         return (0, float(str_value))
-    except (ValueError, IndexError):
+    except ValueError:
         pass
     
     # Fall back to string sorting
     return (1, str_value.lower())
 
+# Well-formed time input: "m:ss", "m:ss.fff" or "ss.fff" (any part may be empty)
+_FORMATTED_TIME_RE = re.compile(r'(?:(\d*):)?(\d*)(?:\.(\d*))?')
+_NON_DIGITS_RE = re.compile(r'\D+')
+# Scale for 1-5 typed digits so they read as if right-padded with zeros to six
+_DIGIT_PAD_MULTIPLIERS = tuple(10 ** (6 - length) for length in range(6))
+
+
 def parse_time_input(text: str) -> Tuple[int, int, int]:
     """
     Parse time input with smart digit interpretation.
@@ -232,6 +249,16 @@ def parse_time_input(text: str) -> Tuple[int, int, int]:
     
     # If it contains colon or period, try to parse as formatted time first
     if ":" in text or "." in text:
+        # Fast path for well-formed input; same result as the general parsing below
+        match = _FORMATTED_TIME_RE.fullmatch(text)
+        if match:
+            min_str, sec_str, ms_str = match.groups()
+            seconds = int(sec_str) if sec_str else 0
+            if seconds < 60:
+                minutes = int(min_str) if min_str else 0
+                milliseconds = int(ms_str.ljust(3, '0')[:3]) if ms_str else 0
+                return minutes, seconds, milliseconds
+        
         try:
             # Handle formats like "7:04.123" or "7:04"
             if ":" in text:
@@ -269,30 +296,21 @@ def parse_time_input(text: str) -> Tuple[int, int, int]:
             pass
     
     # Extract only digits for smart parsing
-    digits = "".join(filter(str.isdigit, text))
+    digits = _NON_DIGITS_RE.sub('', text)
     if not digits:
         raise ValueError("No digits found")
         
-    # Smart digit parsing based on position
-    if len(digits) <= 6:
-        # For 6 or fewer digits, parse as: M SS T H T
-        # where M=minutes, S=seconds, T=tenths, H=hundredths, T=thousandths
-        digits = digits.ljust(6, '0')  # Pad right with zeros
-        
-        minutes = int(digits[0])
-        seconds = int(digits[1:3])
-        milliseconds = int(digits[3:6])
-    else:
-        # For more than 6 digits, extra digits become 10s of minutes
-        # Format: [extra digits for 10s of minutes][M][SS][THT]
-        extra_digits = digits[:-6]  # All but last 6 digits
-        core_digits = digits[-6:]   # Last 6 digits
-        
-        tens_of_minutes = int(extra_digits)
-        single_minutes = int(core_digits[0])
-        minutes = tens_of_minutes * 10 + single_minutes
-        seconds = int(core_digits[1:3])
-        milliseconds = int(core_digits[3:6])
+    # Smart digit parsing based on position: the last six digits are M SS THT
+    # (minutes, seconds, tenths/hundredths/thousandths) and any extra leading
+    # digits are 10s of minutes. Shorter input is padded right with zeros, which
+    # is the same as scaling the number up to six digits.
+    value = int(digits)
+    if len(digits) < 6:
+        value *= _DIGIT_PAD_MULTIPLIERS[len(digits)]
+    
+    minutes = value // 100000
+    seconds = value // 1000 % 100
+    milliseconds = value % 1000
     
     if seconds >= 60:
         raise ValueError("Seconds must be less than 60")
@@ -300,42 +318,105 @@ def parse_time_input(text: str) -> Tuple[int, int, int]:
     return minutes, seconds, milliseconds
 
 
+# Formatted times repeat a lot in result views, so whole-millisecond values are memoized
+TIME_FORMAT_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TIME_FORMAT_CACHE_SIZE)
+def _format_ms(total_ms: int) -> str:
+    """Format whole milliseconds as mm:ss.fff."""
+    return f"{total_ms // 60000:02d}:{total_ms // 1000 % 60:02d}.{total_ms % 1000:03d}"
+
+
 def format_time_seconds(total_seconds: float) -> str:
     """Convert seconds to mm:ss.fff format."""
-    total_ms = int(round(total_seconds * 1000))
-    minutes, remainder = divmod(total_ms, 60000)
-    seconds, milliseconds = divmod(remainder, 1000)
-    return f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+    # Output only depends on the rounded millisecond count, which is the cache key
+    return _format_ms(int(round(total_seconds * 1000)))
 
 
-def time_to_seconds(time_str: str) -> float:
-    """Convert time string to total seconds."""
+def time_to_ms(time_str: str) -> int:
+    """Convert time string to total milliseconds (0 if it can't be parsed)."""
     try:
         minutes, seconds, milliseconds = parse_time_input(time_str)
-        return minutes * 60 + seconds + milliseconds / 1000.0
     except ValueError:
-        return 0.0
+        return 0
+    return minutes * 60000 + seconds * 1000 + milliseconds
+
+
+def time_to_seconds(time_str: str) -> float:
+    """Convert time string to total seconds."""
+    return time_to_ms(time_str) / 1000
+
+
+# ── Background Work Helpers ──────────────────────────────────────────
+
+def run_in_background(widget, work: Callable[[], Any], on_done: Callable[[Any, Optional[Exception]], None],
+                      poll_ms: int = 50):
+    """
+    Run work() on a daemon thread and deliver its outcome back on the Tk thread.
+    
+    Tk widgets must only be touched from the main thread, so the worker hands its
+    outcome over through a queue that the widget's event loop polls.
+    
+    Args:
+        widget: Any Tk widget, used to schedule polling with after()
+        work: Callable run on the worker thread; must not touch Tk widgets
+        on_done: Called on the Tk thread as on_done(result, error), where error
+                 is the exception raised by work() or None
+        poll_ms: Polling interval in milliseconds
+    """
+    outcome = queue.Queue(maxsize=1)
+    
+    def worker():
+        try:
+            outcome.put((work(), None))
+        except Exception as e:
+            outcome.put((None, e))
+    
+    def poll():
+        try:
+            result, error = outcome.get_nowait()
+        except queue.Empty:
+            widget.after(poll_ms, poll)
+            return
+        on_done(result, error)
+    
+    threading.Thread(target=worker, daemon=True).start()
+    widget.after(poll_ms, poll)
 
 
 # ── D1 Schools Tab Helper Classes ──────────────────────────────────────
 
+# End year used for current (open-ended) seasons in overlap comparisons
+_CURRENT_SEASON_END = 9999
+
+
 @dataclass
 class Season:
-    """Represents an academic season."""
+    """Represents an academic season.
+    
+    Seasons are never modified after creation, so the derived strings are
+    built once per instance.
+    """
     start_year: int
     end_year: Optional[int]  # None means current/ongoing
+    # end_year with current seasons at _CURRENT_SEASON_END, for plain integer comparisons
+    _end_or_inf: int = field(init=False, repr=False, compare=False)
     
-    @property
+    def __post_init__(self):
+        self._end_or_inf = _CURRENT_SEASON_END if self.end_year is None else self.end_year
+    
+    @cached_property
     def display_name(self) -> str:
         if self.end_year is None:
             return f"{self.start_year} - current"
         return f"{self.start_year}-{self.end_year}"
     
-    @property
+    @cached_property
     def start_date(self) -> str:
         return f"{self.start_year}-09-01"
     
-    @property
+    @cached_property
     def end_date(self) -> Optional[str]:
         if self.end_year is None:
             return None
@@ -349,6 +430,10 @@ class Season:
 @dataclass
 class SchoolParticipation:
     """Represents a school's participation data."""
+    # One instance per school per season, so skip the per-instance __dict__
+    __slots__ = ('school_name', 'short_name', 'acronym', 'crr_name', 'color',
+                 'openweight_women', 'heavyweight_men', 'lightweight_men', 'lightweight_women')
+    
     school_name: str
     short_name: str
     acronym: str
@@ -360,6 +445,59 @@ class SchoolParticipation:
     lightweight_women: bool
 
 
+# Overlap type for two seasons that share years, keyed by
+# (compare(new start, existing start), compare(new end, existing end))
+_OVERLAP_TYPES = {
+    (-1, -1): "OVERLAP_START",
+    (-1, 0): "NEW_CONTAINS_EXISTING",
+    (-1, 1): "NEW_CONTAINS_EXISTING",
+    (0, -1): "EXISTING_CONTAINS_NEW",
+    (0, 0): "EXACT_MATCH",
+    (0, 1): "NEW_CONTAINS_EXISTING",
+    (1, -1): "EXISTING_CONTAINS_NEW",
+    (1, 0): "EXISTING_CONTAINS_NEW",
+    (1, 1): "OVERLAP_END",
+}
+
+
+def _compare(a: int, b: int) -> int:
+    """Return -1, 0 or 1 as a is less than, equal to or greater than b."""
+    return (a > b) - (a < b)
+
+
+def _plan_trim_to_new_start(new_season: Season, existing_season: Season) -> Tuple[str, str]:
+    # e.g., 2025-current + 2026-current (or 2026-2027) → trim 2025-current to 2025-2026
+    return f"Trim '{existing_season.display_name}' → becomes '{existing_season.start_year}-{new_season.start_year}'", "TRIM"
+
+
+def _plan_split(new_season: Season, existing_season: Season) -> Tuple[str, str]:
+    if existing_season.is_current:
+        # Split: 2025-current becomes 2025-2025 when inserting 2026-current
+        return f"Split '{existing_season.display_name}' → trim to '{existing_season.start_year}-{new_season.start_year-1}'", "SPLIT"
+    # Split finite season
+    return f"Split '{existing_season.display_name}' → keep parts before and after new season", "SPLIT"
+
+
+def _plan_overlap_start(new_season: Season, existing_season: Season) -> Tuple[str, str]:
+    # New overlaps start of existing
+    if new_season.end_year is not None:
+        return f"Trim '{existing_season.display_name}' → starts from '{new_season.end_year+1}'", "TRIM"
+    return f"Delete '{existing_season.display_name}' (new current season takes over)", "DELETE"
+
+
+# Overlap type → function(new_season, existing_season) returning (action, action_kind)
+_ACTION_PLANNERS = {
+    "EXACT_MATCH": lambda new, existing: (f"Replace '{existing.display_name}' with new season data", "REPLACE"),
+    "NEW_CONTAINS_EXISTING": lambda new, existing: (f"Delete '{existing.display_name}' (completely replaced)", "DELETE"),
+    "ADJACENT_CURRENT_SEASONS": _plan_trim_to_new_start,
+    "ADJACENT_CURRENT_TO_FINITE": _plan_trim_to_new_start,
+    "EXISTING_CONTAINS_NEW": _plan_split,
+    "OVERLAP_START": _plan_overlap_start,
+    # New overlaps end of existing
+    "OVERLAP_END": lambda new, existing: (f"Trim '{existing.display_name}' → ends at '{new.start_year-1}'", "TRIM"),
+}
+
+
 class OverlapAnalyzer:
     """Handles season overlap detection and resolution."""
     
@@ -371,81 +509,52 @@ class OverlapAnalyzer:
         A season ending in year X (Aug 31, X) and another starting in year X (Sept 1, X) 
         are ADJACENT, not overlapping!
         """
+        new_start, existing_start = new_season.start_year, existing_season.start_year
+        new_end, existing_end = new_season._end_or_inf, existing_season._end_or_inf
+        
         # Exact match
-        if new_season.start_year == existing_season.start_year and new_season.end_year == existing_season.end_year:
+        if new_start == existing_start and new_end == existing_end:
             return "EXACT_MATCH"
         
-        # Academic year adjacency rules
-        # Case 1: Seasons ending and starting in the same year are ADJACENT
-        if (existing_season.end_year is not None and 
-            new_season.start_year == existing_season.end_year):
-            return "NO_OVERLAP"
-        
-        # Case 2: New season ends, existing starts in same year - also adjacent
-        if (new_season.end_year is not None and 
-            existing_season.start_year == new_season.end_year):
+        # Academic year adjacency rules: seasons ending and starting in the same
+        # year are ADJACENT, and seasons further apart don't touch at all
+        if new_start >= existing_end or existing_start >= new_end:
             return "NO_OVERLAP"
         
-        # Case 3: Standard year gaps (more than 1 year apart)
-        if (existing_season.end_year is not None and 
-            new_season.start_year > existing_season.end_year):
-            return "NO_OVERLAP"
-        
-        if (new_season.end_year is not None and 
-            existing_season.start_year > new_season.end_year):
-            return "NO_OVERLAP"
-        
-        # Case 4: Special handling for current seasons
-        if (existing_season.is_current and 
-            new_season.is_current and 
-            new_season.start_year == existing_season.start_year + 1):
-            return "ADJACENT_CURRENT_SEASONS"
-        
-        # Case 5: Current season + new finite season starting next year = adjacent
-        if (existing_season.is_current and 
-            not new_season.is_current and 
-            new_season.start_year == existing_season.start_year + 1):
+        # Special handling for a current season followed by one starting next year
+        if existing_end == _CURRENT_SEASON_END and new_start == existing_start + 1:
+            if new_end == _CURRENT_SEASON_END:
+                return "ADJACENT_CURRENT_SEASONS"
             return "ADJACENT_CURRENT_TO_FINITE"
         
-        # Now check for ACTUAL overlaps
-        new_end = new_season.end_year if new_season.end_year is not None else 9999
-        existing_end = existing_season.end_year if existing_season.end_year is not None else 9999
-        
-        # New completely contains existing
-        if new_season.start_year <= existing_season.start_year and new_end >= existing_end:
-            return "NEW_CONTAINS_EXISTING"
-        
-        # Existing completely contains new
-        if existing_season.start_year <= new_season.start_year and existing_end >= new_end:
-            return "EXISTING_CONTAINS_NEW"
-        
-        # Partial overlaps (these indicate actual date conflicts)
-        if new_season.start_year < existing_season.start_year and new_end >= existing_season.start_year:
-            return "OVERLAP_START"
-        
-        if new_season.start_year <= existing_end and new_season.start_year > existing_season.start_year:
-            return "OVERLAP_END"
-        
-        # Fallback
-        return "NO_OVERLAP"
+        # Now the seasons ACTUALLY overlap; how depends on how their starts and ends compare
+        return _OVERLAP_TYPES[(_compare(new_start, existing_start), _compare(new_end, existing_end))]
     
     @staticmethod
     def plan_overlap_resolution(new_season: Season, existing_seasons: List[Season]) -> Dict:
         """Plan how to resolve all overlaps when creating a new season."""
+        # Screen out seasons that can't overlap with plain integer comparisons,
+        # then fully classify and plan actions only for the few that remain
+        analyze = OverlapAnalyzer.analyze_overlap
+        plan_action = OverlapAnalyzer._plan_action
+        new_start, new_end = new_season.start_year, new_season._end_or_inf
+        candidates = [
+            existing for existing in existing_seasons
+            if (new_start < existing._end_or_inf and existing.start_year < new_end)
+            or (new_start == existing.start_year and new_end == existing._end_or_inf)
+        ]
+        classified = [(existing, analyze(new_season, existing)) for existing in candidates]
         overlaps = []
-        actions = []
-        
-        for existing in existing_seasons:
-            overlap_type = OverlapAnalyzer.analyze_overlap(new_season, existing)
-            
+        for existing, overlap_type in classified:
             if overlap_type != "NO_OVERLAP":
-                overlap_info = {
+                action, action_kind = plan_action(new_season, existing, overlap_type)
+                overlaps.append({
                     'existing_season': existing,
                     'overlap_type': overlap_type,
-                    'action': OverlapAnalyzer._plan_action(new_season, existing, overlap_type)
-                }
-                overlaps.append(overlap_info)
-                actions.append(overlap_info['action'])
+                    'action': action,
+                    'action_kind': action_kind
+                })
+        actions = [overlap_info['action'] for overlap_info in overlaps]
         
         return {
             'overlaps': overlaps,
@@ -454,52 +563,35 @@ class OverlapAnalyzer:
         }
     
     @staticmethod
-    def _plan_action(new_season: Season, existing_season: Season, overlap_type: str) -> str:
-        """Plan the specific action for resolving an overlap."""
-        if overlap_type == "EXACT_MATCH":
-            return f"Replace '{existing_season.display_name}' with new season data"
-        elif overlap_type == "NEW_CONTAINS_EXISTING":
-            return f"Delete '{existing_season.display_name}' (completely replaced)"
-        elif overlap_type == "ADJACENT_CURRENT_SEASONS":
-            # This is the key case: 2025-current + 2026-current → trim 2025-current to 2025-2026
-            return f"Trim '{existing_season.display_name}' → becomes '{existing_season.start_year}-{new_season.start_year}'"
-        elif overlap_type == "ADJACENT_CURRENT_TO_FINITE":
-            # e.g., 2025-current + 2026-2027 → trim 2025-current to 2025-2026
-            return f"Trim '{existing_season.display_name}' → becomes '{existing_season.start_year}-{new_season.start_year}'"
-        elif overlap_type == "EXISTING_CONTAINS_NEW":
-            if existing_season.is_current:
-                # Split: 2025-current becomes 2025-2025 when inserting 2026-current
-                return f"Split '{existing_season.display_name}' → trim to '{existing_season.start_year}-{new_season.start_year-1}'"
-            else:
-                # Split finite season
-                return f"Split '{existing_season.display_name}' → keep parts before and after new season"
-        elif overlap_type == "OVERLAP_START":
-            # New overlaps start of existing
-            if new_season.end_year is not None:
-                return f"Trim '{existing_season.display_name}' → starts from '{new_season.end_year+1}'"
-            else:
-                return f"Delete '{existing_season.display_name}' (new current season takes over)"
-        elif overlap_type == "OVERLAP_END":
-            # New overlaps end of existing
-            return f"Trim '{existing_season.display_name}' → ends at '{new_season.start_year-1}'"
+    def _plan_action(new_season: Season, existing_season: Season, overlap_type: str) -> Tuple[str, str]:
+        """Plan the specific action for resolving an overlap.
         
-        return f"Unknown action for {overlap_type}"
+        Returns:
+            (action, action_kind) where action_kind is "REPLACE", "DELETE", "TRIM",
+            "SPLIT" or "UNKNOWN"
+        """
+        planner = _ACTION_PLANNERS.get(overlap_type)
+        if planner is None:
+            return f"Unknown action for {overlap_type}", "UNKNOWN"
+        return planner(new_season, existing_season)
     
     @staticmethod
     def _create_summary(overlaps: List[Dict]) -> Dict:
         """Create summary statistics for overlap resolution."""
-        deletes = sum(1 for o in overlaps if 'Delete' in o['action'] or 'Replace' in o['action'])
-        trims = sum(1 for o in overlaps if 'Trim' in o['action'])
-        splits = sum(1 for o in overlaps if 'Split' in o['action'])
+        kinds = Counter(o['action_kind'] for o in overlaps)
         
         return {
             'total_affected': len(overlaps),
-            'deletes': deletes,
-            'trims': trims,
-            'splits': splits
+            'deletes': kinds["DELETE"] + kinds["REPLACE"],
+            'trims': kinds["TRIM"],
+            'splits': kinds["SPLIT"]
         }
 
 
+# Set to True to have CRRNameValidator explain each check (adds a direct DB query per call)
+CRR_VALIDATION_DEBUG = False
+
+
 class CRRNameValidator:
     """Handles CRR name validation with comprehensive debugging."""
     
@@ -509,62 +601,76 @@ class CRRNameValidator:
         Check if CRR name already exists, excluding the current school being edited.
         
         Returns:
-            (is_valid, debug_message): Tuple of validation result and debug info
+            (is_valid, debug_message): Tuple of validation result and debug info;
+            debug_message is empty unless CRR_VALIDATION_DEBUG is set
         """
+        debug = CRR_VALIDATION_DEBUG
         debug_lines = []
-        debug_lines.append(f"🔍 CRR Name Validation:")
-        debug_lines.append(f"   new_name: '{new_name}'")
-        debug_lines.append(f"   current_crr_name: '{current_crr_name}'")
+        if debug:
+            debug_lines.append(f"🔍 CRR Name Validation:")
+            debug_lines.append(f"   new_name: '{new_name}'")
+            debug_lines.append(f"   current_crr_name: '{current_crr_name}'")
         
         # Get school_id for the current school
         school_id = db_manager.get_school_id_by_crr_name(current_crr_name)
-        debug_lines.append(f"   school_id for '{current_crr_name}': {school_id}")
+        if debug:
+            debug_lines.append(f"   school_id for '{current_crr_name}': {school_id}")
         
         if school_id is None:
-            debug_lines.append(f"   ❌ Current school '{current_crr_name}' not found in cache")
             # School not found, so new name definitely conflicts if it exists
             exists = db_manager.get_school_id_by_crr_name(new_name) is not None
-            debug_lines.append(f"   Checking if '{new_name}' exists: {exists}")
+            if debug:
+                debug_lines.append(f"   ❌ Current school '{current_crr_name}' not found in cache")
+                debug_lines.append(f"   Checking if '{new_name}' exists: {exists}")
             debug_message = "\n".join(debug_lines)
             return not exists, debug_message
         
-        # Check current cache state
-        debug_lines.append(f"   📋 Current cache state:")
-        cache_names = list(db_manager.crr_name_to_id_cache.keys())[:5]  # Show first 5
-        debug_lines.append(f"   Cache contains {len(db_manager.crr_name_to_id_cache)} names: {cache_names}...")
-        debug_lines.append(f"   '{current_crr_name}' in cache: {current_crr_name in db_manager.crr_name_to_id_cache}")
-        debug_lines.append(f"   '{new_name}' in cache: {new_name in db_manager.crr_name_to_id_cache}")
+        if debug:
+            # Check current cache state
+            debug_lines.append(f"   📋 Current cache state:")
+            cache_names = list(db_manager.crr_name_to_id_cache.keys())[:5]  # Show first 5
+            debug_lines.append(f"   Cache contains {len(db_manager.crr_name_to_id_cache)} names: {cache_names}...")
+            debug_lines.append(f"   '{current_crr_name}' in cache: {current_crr_name in db_manager.crr_name_to_id_cache}")
+            debug_lines.append(f"   '{new_name}' in cache: {new_name in db_manager.crr_name_to_id_cache}")
         
         # Use DatabaseManager's validation method
         is_unique = db_manager.validate_crr_name_uniqueness(new_name, school_id)
-        debug_lines.append(f"   DatabaseManager.validate_crr_name_uniqueness('{new_name}', {school_id}): {is_unique}")
-        
-        # Double-check with direct database query
-        cursor = db_manager.conn.cursor()
-        cursor.execute("SELECT school_id, crr_name FROM schools WHERE crr_name = ?", (new_name,))
-        direct_results = cursor.fetchall()
-        debug_lines.append(f"   Direct DB query for '{new_name}': {direct_results}")
-        
         is_valid = is_unique
-        debug_lines.append(f"   🎯 Final result: {is_valid} (True means name is valid/unique)")
+        
+        if debug:
+            debug_lines.append(f"   DatabaseManager.validate_crr_name_uniqueness('{new_name}', {school_id}): {is_unique}")
+            
+            # Double-check with direct database query
+            cursor = db_manager.conn.cursor()
+            cursor.execute("SELECT school_id, crr_name FROM schools WHERE crr_name = ?", (new_name,))
+            direct_results = cursor.fetchall()
+            debug_lines.append(f"   Direct DB query for '{new_name}': {direct_results}")
+            debug_lines.append(f"   🎯 Final result: {is_valid} (True means name is valid/unique)")
         
         debug_message = "\n".join(debug_lines)
         return is_valid, debug_message
 
 
+# debug_print prefixes and ranks by level; unknown levels rank as INFO
+_DEBUG_PREFIXES = {
+    "DEBUG": "🔍",
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌",
+    "CRITICAL": "💥"
+}
+_DEBUG_LEVEL_RANKS = {"DEBUG": 0, "INFO": 1, "SUCCESS": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
+
+# Messages below this level are skipped; set ROWING_DB_LOG_LEVEL=DEBUG to see everything
+_MIN_DEBUG_RANK = _DEBUG_LEVEL_RANKS.get(os.environ.get("ROWING_DB_LOG_LEVEL", "INFO").upper(), 1)
+
+
 def debug_print(message: str, level: str = "INFO"):
     """Enhanced debug printing with levels."""
-    prefix_map = {
-        "DEBUG": "🔍",
-        "INFO": "ℹ️",
-        "SUCCESS": "✅", 
-        "WARNING": "⚠️",
-        "ERROR": "❌",
-        "CRITICAL": "💥"
-    }
-    
-    prefix = prefix_map.get(level, "📝")
-    print(f"{prefix} {message}")
+    if _DEBUG_LEVEL_RANKS.get(level, 1) < _MIN_DEBUG_RANK:
+        return
+    print(f"{_DEBUG_PREFIXES.get(level, '📝')} {message}")
 
 
 def validate_school_field(field_name: str, new_value: str, original_value: str) -> Tuple[bool, str]:
@@ -2,23 +2,73 @@
 Custom input widgets with smart parsing for rowing race times and autocomplete functionality.
 """
 
+import re
 import tkinter as tk
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from tkinter import messagebox
 from typing import Tuple, Optional, List
 from Collegeite_SQL_Race_input.config.constants import FONT_ENTRY
 from Collegeite_SQL_Race_input.utils.helpers import parse_time_input, format_time_seconds
 
+# Schedule times: hours (or HMM/HHMM digits), optional ":MM", optional AM/PM (text is upper-cased)
+_SCHEDULE_TIME_RE = re.compile(r'(\d+)(?::(\d+))?\s*(AM|PM)?')
+_AM_PM_OFFSETS = {'AM': 0, 'PM': 12}
+_SCHEDULE_TIME_WORDS = {
+    'NOON': "12:00", '12 NOON': "12:00", '12NOON': "12:00",
+    'MIDNIGHT': "00:00", '12 MIDNIGHT': "00:00", '12MIDNIGHT': "00:00",
+}
+# Text the _normalize methods would leave unchanged ("HH:MM" and "mm:ss.fff")
+_CANONICAL_SCHEDULE_TIME_RE = re.compile(r'(?:[01]\d|2[0-3]):[0-5]\d')
+_CANONICAL_RACE_TIME_RE = re.compile(r'(?:\d\d|[1-9]\d{2,}):[0-5]\d\.\d{3}')
+
+
+@lru_cache(maxsize=32)
+def _prepare_choices(choices: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], frozenset, str, Tuple[int, ...]]:
+    """Sort choices case-insensitively and precompute what autocomplete matching needs.
+    
+    Cached because many entries on a screen usually share the same school list.
+    
+    Returns:
+        (sorted choices, their casefolded forms, set for exact lookups,
+         casefolded forms joined by newlines, offset of each one in that string)
+    """
+    sorted_choices = tuple(sorted(choices, key=str.casefold))
+    folded = tuple(c.casefold() for c in sorted_choices)
+    offsets = []
+    position = 0
+    for text in folded:
+        offsets.append(position)
+        position += len(text) + 1
+    return sorted_choices, folded, frozenset(sorted_choices), "\n".join(folded) + "\n", tuple(offsets)
+
 
 class AutoCompleteEntry(tk.Entry):
     """Entry with autosuggest listbox that supports team-specific school lists."""
 
+    # Most prefix matches to list, and how few prefix matches (once at least two
+    # characters are typed) make it worth adding choices that merely contain the text,
+    # stopping once the list holds SUBSTRING_MATCH_LIMIT entries
+    PREFIX_MATCH_LIMIT = 50
+    MIN_PREFIX_MATCHES = 6
+    SUBSTRING_MATCH_LIMIT = 20
+    # Keystrokes closer together than this are coalesced into a single dropdown update
+    UPDATE_DELAY_MS = 60
+
     def __init__(self, master: tk.Widget, choices: List[str], **kw):
         super().__init__(master, font=FONT_ENTRY, **kw)
-        self.choices = sorted(choices, key=str.lower)
+        (self.choices, self._choices_folded, self._choice_set,
+         self._choices_blob, self._choice_offsets) = _prepare_choices(tuple(choices))
         self.var = tk.StringVar()
         self.config(textvariable=self.var)
-        self.lb: Optional[tk.Listbox] = None
+        self.lb: Optional[tk.Listbox] = None  # The dropdown while it is shown
+        self._listbox: Optional[tk.Listbox] = None  # Built on first use, then reused
+        # Whether the shown dropdown is still positioned correctly, so successive
+        # keystrokes while it stays open skip the geometry queries
+        self._placed = False
         self._updating = False  # Prevent autocomplete during programmatic updates
+        self._pending_update: Optional[str] = None  # after() id of the scheduled _update
+        self._last_text = ""  # Text seen by the last trace callback
         
         # Bind trace AFTER setup to avoid triggering during initialization
         self.var.trace_add("write", self._on_text_change)
@@ -30,6 +80,8 @@ class AutoCompleteEntry(tk.Entry):
         self.bind("<Up>", self._lb_up)
         self.bind("<Escape>", self._destroy)
         self.bind("<FocusOut>", self._on_focus_out)
+        self.bind("<Destroy>", self._on_entry_destroy)
+        self.bind("<Configure>", self._invalidate_placement)
 
     def insert(self, index, string):
         """Override insert to prevent autocomplete during programmatic insertion."""
@@ -53,14 +105,33 @@ class AutoCompleteEntry(tk.Entry):
 
     def update_choices(self, new_choices: List[str]):
         """Update the choices list for autocomplete."""
-        self.choices = sorted(new_choices, key=str.lower)
+        (self.choices, self._choices_folded, self._choice_set,
+         self._choices_blob, self._choice_offsets) = _prepare_choices(tuple(new_choices))
         self._destroy()
 
     def _on_text_change(self, *_):
         """Handle text changes - only show autocomplete for user typing."""
+        # Programmatic changes still record the text, so only real edits reschedule
+        text = self.var.get()
+        if text == self._last_text:
+            return
+        self._last_text = text
         if self._updating:
             return
-        self.after_idle(self._update)
+        self._cancel_pending_update()
+        self._pending_update = self.after(self.UPDATE_DELAY_MS, self._run_pending_update)
+
+    def _run_pending_update(self):
+        self._pending_update = None
+        self._update()
+
+    def _cancel_pending_update(self):
+        if self._pending_update is not None:
+            try:
+                self.after_cancel(self._pending_update)
+            except tk.TclError:
+                pass
+            self._pending_update = None
 
     def _update(self, *_):
         """Show autocomplete dropdown for user input."""
@@ -68,48 +139,106 @@ class AutoCompleteEntry(tk.Entry):
             return
             
         txt = self.var.get()
-        self._destroy()
         
-        if not txt or not self.focus_get() == self or txt in self.choices:
+        if not txt or not self.focus_get() == self or txt in self._choice_set:
+            self._destroy()
             return
             
-        matches = [s for s in self.choices if txt.lower() in s.lower()]
+        matches = self._find_matches(txt.casefold())
         if not matches:
+            self._destroy()
             return
 
         try:
-            top = self.winfo_toplevel()
-            self.lb = tk.Listbox(top, height=min(len(matches), 6), font=FONT_ENTRY)
+            if self.lb is None or not self._placed:
+                # Opening the dropdown (or the entry moved): measure and place it
+                top = self.winfo_toplevel()
+                if self._listbox is None:
+                    self._listbox = self._build_listbox(top)
+                self.lb = self._listbox
+                x = self.winfo_rootx() - top.winfo_rootx()
+                y = self.winfo_rooty() - top.winfo_rooty() + self.winfo_height()
+                self.lb.place(x=x, y=y, width=self.winfo_width())
+                self.lb.lift()  # Stay above widgets created after the listbox
+                self._placed = True
+            self.lb.delete(0, tk.END)
+            self.lb.config(height=min(len(matches), 6))
             
-            self.lb.bind("<<ListboxSelect>>", self._select)
-            self.lb.bind("<Button-1>", self._on_click)
-            self.lb.bind("<Double-Button-1>", self._on_double_click)
-            self.lb.bind("<Return>", self._lb_enter)
-            self.lb.bind("<Tab>", self._lb_tab)
-            self.lb.bind("<Escape>", self._lb_escape)
-
-            x = self.winfo_rootx() - top.winfo_rootx()
-            y = self.winfo_rooty() - top.winfo_rooty() + self.winfo_height()
-            self.lb.place(x=x, y=y, width=self.winfo_width())
-            
-            for w in matches:
-                self.lb.insert(tk.END, w)
-            
-            if matches:
-                self.lb.selection_set(0)
-                self.lb.activate(0)
+            self.lb.insert(tk.END, *matches)
+            self.lb.selection_set(0)
+            self.lb.activate(0)
                 
         except tk.TclError:
             self._destroy()
 
+    def _find_matches(self, txt_folded: str) -> List[str]:
+        """Choices starting with txt_folded, then (if there are few) ones containing it."""
+        choices, choices_folded = self.choices, self._choices_folded
+        # choices are sorted by their casefolded form, so the prefix matches form one run
+        start = end = bisect_left(choices_folded, txt_folded)
+        stop = min(len(choices_folded), start + self.PREFIX_MATCH_LIMIT)
+        while end < stop and choices_folded[end].startswith(txt_folded):
+            end += 1
+        matches = list(choices[start:end])
+        
+        if len(matches) < self.MIN_PREFIX_MATCHES and len(txt_folded) >= 2 and "\n" not in txt_folded:
+            # One str.find pass over all the folded choices joined by newlines; a hit
+            # can't span two choices, so its offset identifies a single choice
+            blob, offsets = self._choices_blob, self._choice_offsets
+            limit = self.SUBSTRING_MATCH_LIMIT
+            pos = blob.find(txt_folded)
+            while pos != -1:
+                i = bisect_right(offsets, pos) - 1
+                if start <= i < end:
+                    next_i = end  # Already listed as prefix matches
+                else:
+                    matches.append(choices[i])
+                    if len(matches) >= limit:
+                        break
+                    next_i = i + 1
+                if next_i >= len(offsets):
+                    break
+                pos = blob.find(txt_folded, offsets[next_i])
+        return matches
+
+    def _build_listbox(self, top: tk.Misc) -> tk.Listbox:
+        listbox = tk.Listbox(top, font=FONT_ENTRY)
+        listbox.bind("<<ListboxSelect>>", self._select)
+        listbox.bind("<Button-1>", self._on_click)
+        listbox.bind("<Double-Button-1>", self._on_double_click)
+        listbox.bind("<Return>", self._lb_enter)
+        listbox.bind("<Tab>", self._lb_tab)
+        listbox.bind("<Escape>", self._lb_escape)
+        return listbox
+
     def _destroy(self, *_):
+        """Hide the dropdown (the listbox itself is kept for the next update)."""
+        self._cancel_pending_update()
+        self._placed = False
         if self.lb:
             try:
-                self.lb.destroy()
+                self.lb.place_forget()
+                self.lb.selection_clear(0, tk.END)
             except tk.TclError:
-                pass
+                self._listbox = None
             self.lb = None
 
+    def _invalidate_placement(self, *_):
+        self._placed = False
+
+    def _on_entry_destroy(self, e):
+        """The listbox lives on the toplevel, so take it down with the entry."""
+        if e.widget is not self:
+            return
+        self._cancel_pending_update()
+        self.lb = None
+        if self._listbox is not None:
+            try:
+                self._listbox.destroy()
+            except tk.TclError:
+                pass
+            self._listbox = None
+
     def _complete(self, *_):
         if not self.lb or not self.lb.size():
             return "break"
@@ -207,6 +336,7 @@ class AutoCompleteEntry(tk.Entry):
             return "break"
 
     def _on_focus_out(self, e):
+        self._cancel_pending_update()
         if self.lb:
             self.after(100, self._check_focus)
 
@@ -226,6 +356,8 @@ class ScheduleTimeEntry(tk.Entry):
         super().__init__(master, font=FONT_ENTRY, **kwargs)
         self.bind("<FocusOut>", self._normalize)
         self.bind("<Return>", self._normalize)
+        # Bound once; _placeholder_active decides whether focusing clears the text
+        self.bind('<FocusIn>', self._clear_placeholder)
         
         # Add placeholder text
         self._add_placeholder()
@@ -234,18 +366,23 @@ class ScheduleTimeEntry(tk.Entry):
         """Add placeholder text to guide user input."""
         self.insert(0, "e.g. 9:30, 1400")
         self.config(fg='gray')
-        self.bind('<FocusIn>', self._clear_placeholder)
+        self._placeholder_active = True
     
     def _clear_placeholder(self, event):
         """Clear placeholder text when user starts typing."""
+        if not self._placeholder_active:
+            return
         if self.get() == "e.g. 9:30, 1400":
             self.delete(0, tk.END)
             self.config(fg='black')
-        self.unbind('<FocusIn>')
+        self._placeholder_active = False
     
     def _normalize(self, *_):
         """Normalize time input to HH:MM format."""
-        text = self.get().strip()
+        raw_text = self.get()
+        if _CANONICAL_SCHEDULE_TIME_RE.fullmatch(raw_text):
+            return  # Already normalized
+        text = raw_text.strip()
         
         # Handle empty or placeholder text
         if not text or text == "e.g. 9:30, 1400":
@@ -268,70 +405,38 @@ class ScheduleTimeEntry(tk.Entry):
         # Handle common formats
         if not text:
             return ""
+        word_time = _SCHEDULE_TIME_WORDS.get(text)
+        if word_time:
+            return word_time
         
-        # Handle AM/PM format
-        am_pm = None
-        if text.endswith('AM') or text.endswith('PM'):
-            am_pm = text[-2:]
-            text = text[:-2].strip()
-        
-        # Handle colon format (e.g., "9:30", "14:00")
-        if ':' in text:
-            try:
-                parts = text.split(':')
-                hours = int(parts[0])
-                minutes = int(parts[1]) if len(parts) > 1 else 0
-                
-                # Handle AM/PM
-                if am_pm:
-                    if am_pm == 'PM' and hours != 12:
-                        hours += 12
-                    elif am_pm == 'AM' and hours == 12:
-                        hours = 0
-                
-                if hours > 23 or minutes > 59:
-                    raise ValueError("Hours must be 0-23, minutes 0-59")
-                
-                return f"{hours:02d}:{minutes:02d}"
-            except (ValueError, IndexError):
-                raise ValueError("Invalid time format. Use HH:MM or H:MM")
-        
-        # Handle 24-hour format without colon (e.g., "1430", "900")
-        if text.isdigit():
-            if len(text) <= 2:
+        # "9:30", "14:00", "930", "1430", "9PM", "9:30 AM", ...
+        match = _SCHEDULE_TIME_RE.fullmatch(text)
+        if match:
+            digits, minute_digits, am_pm = match.groups()
+            if minute_digits is not None:
+                hours = int(digits)
+                minutes = int(minute_digits)
+            elif len(digits) <= 2:
                 # Just hours (e.g., "9" -> "09:00")
-                hours = int(text)
+                hours = int(digits)
                 minutes = 0
-            elif len(text) == 3:
-                # HMM format (e.g., "930" -> "09:30")
-                hours = int(text[0])
-                minutes = int(text[1:3])
-            elif len(text) == 4:
-                # HHMM format (e.g., "1430" -> "14:30")
-                hours = int(text[0:2])
-                minutes = int(text[2:4])
+            elif len(digits) <= 4:
+                # HMM or HHMM format (e.g., "930" -> "09:30", "1430" -> "14:30")
+                hours, minutes = divmod(int(digits), 100)
             else:
                 raise ValueError("Invalid time format")
             
-            # Handle AM/PM for digit-only input
+            # Handle AM/PM: 12 AM is hour 0 and 12 PM is hour 12
             if am_pm:
-                if am_pm == 'PM' and hours != 12:
-                    hours += 12
-                elif am_pm == 'AM' and hours == 12:
-                    hours = 0
+                if hours > 12:
+                    raise ValueError("Hours must be 1-12 with AM/PM")
+                hours = hours % 12 + _AM_PM_OFFSETS[am_pm]
             
             if hours > 23 or minutes > 59:
                 raise ValueError("Hours must be 0-23, minutes 0-59")
             
             return f"{hours:02d}:{minutes:02d}"
         
-        # Handle text formats
-        text_lower = text.lower()
-        if 'noon' in text_lower or text_lower == '12pm':
-            return "12:00"
-        elif 'midnight' in text_lower or text_lower == '12am':
-            return "00:00"
-        
         raise ValueError("Invalid time format. Examples: 9:30, 1430, 9:30AM, noon")
     
     def get_time_or_none(self) -> Optional[str]:
@@ -342,30 +447,51 @@ class ScheduleTimeEntry(tk.Entry):
         return text
 
 
-# Add this debugging version to your TimeEntry widget temporarily
-
-# Add this debugging version to your TimeEntry widget temporarily
-
 class TimeEntry(tk.Entry):
     """Entry widget for race time input with smart digit parsing from Race Ranker."""
     
     def __init__(self, master, **kwargs):
         super().__init__(master, font=FONT_ENTRY, **kwargs)
+        
+        # Parsed time in seconds, kept current as the text changes (None if empty or invalid)
+        self._seconds: Optional[float] = None
+        self._invalid = False
+        self.var = tk.StringVar()
+        self.config(textvariable=self.var)
+        self.var.trace_add("write", self._on_text_write)
+        
         self.bind("<FocusOut>", self._normalize)
         self.bind("<Return>", self._normalize)
-        self.bind("<KeyRelease>", self._on_key_release)  # Additional debug
     
-    def _on_key_release(self, event):
-        """Debug: Track key releases."""
-        print(f"Key released in TimeEntry: '{event.keysym}' - Current text: '{self.get()}'")
-        # Auto-normalize on certain keys for testing
-        if event.keysym in ['Tab', 'Return']:
-            self._normalize()
+    def _on_text_write(self, *_):
+        """Re-parse the time whenever the text changes and flag invalid input in red."""
+        text = self.var.get().strip()
+        invalid = False
+        if not text:
+            self._seconds = None
+        else:
+            try:
+                minutes, seconds, milliseconds = parse_time_input(text)
+                self._seconds = minutes * 60 + seconds + milliseconds / 1000.0
+            except ValueError:
+                self._seconds = None
+                invalid = True
+        
+        if invalid != self._invalid:
+            self._invalid = invalid
+            self.config(fg='red' if invalid else 'black')
+    
+    @property
+    def seconds(self) -> Optional[float]:
+        """The parsed time in seconds, or None if the field is empty or invalid."""
+        return self._seconds
     
     def _normalize(self, *_):
         """Normalize time input to mm:ss.fff format using smart parsing."""
-        text = self.get().strip()
-        print(f"_normalize called with: '{text}'")  # Debug print
+        raw_text = self.get()
+        if _CANONICAL_RACE_TIME_RE.fullmatch(raw_text):
+            return  # Already normalized
+        text = raw_text.strip()
         
         if not text:
             return
@@ -373,14 +499,11 @@ class TimeEntry(tk.Entry):
         try:
             minutes, seconds, milliseconds = parse_time_input(text)
             normalized = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-            print(f"Parsed '{text}' -> {minutes}m {seconds}s {milliseconds}ms -> '{normalized}'")  # Debug print
             
             self.delete(0, tk.END)
             self.insert(0, normalized)
-            print(f"Field updated to: '{self.get()}'")  # Debug print
             
         except Exception as e:
-            print(f"Error in _normalize: {e}")  # Debug print
             messagebox.showerror(
                 "Invalid Time", 
                 f"Enter time as digits (e.g., 704 for 7:04.000) or mm:ss.fff format\nError: {e}"
@@ -388,13 +511,5 @@ class TimeEntry(tk.Entry):
             self.after(10, self.focus_set)
     
     def get_seconds(self) -> float:
-        """Get the time as total seconds."""
-        text = self.get().strip()
-        if not text:
-            return 0.0
-        try:
-            from Collegeite_SQL_Race_input.utils.helpers import parse_time_input
-            minutes, seconds, milliseconds = parse_time_input(text)
-            return minutes * 60 + seconds + milliseconds / 1000.0
-        except ValueError:
-            return 0.0
\ No newline at end of file
+        """Get the time as total seconds (0.0 if empty or invalid)."""
+        return self._seconds if self._seconds is not None else 0.0
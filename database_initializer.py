@@ -21,110 +21,128 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from Collegeite_SQL_Race_input.database.manager import DatabaseManager
 import sqlite3
-from typing import Dict, List, Tuple
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Set, Tuple
 
 # ── School Data Keyed by CRR Name ──────────────────────────────────────────
-# Format: crr_name: (name, short_name, acronym, color, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
+
+class SchoolInfo(NamedTuple):
+    """Static details and team participation flags for one school."""
+    name: str
+    short_name: str
+    acronym: str
+    color: str
+    openweight_women: bool
+    heavyweight_men: bool
+    lightweight_men: bool
+    lightweight_women: bool
+    
+    @property
+    def participation_flags(self) -> Tuple[bool, bool, bool, bool]:
+        return self[4:]
+
+
+# Format: crr_name: SchoolInfo(name, short_name, acronym, color, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
 # CRR name is now the PRIMARY KEY that will be used throughout the system
 SCHOOL_EXTENDED_INFO = {
-    "Alabama": ("University of Alabama", "Alabama", "", "#9E1B32", True, False, False, False),
-    "Boston College": ("Boston College", "", "", "#98002E", True, False, False, False),
-    "Boston University - BU": ("Boston University", "BU", "BU", "#CC0000", True, True, False, True),
-    "Brown": ("Brown University", "Brown", "", "#8B0000", True, True, False, False),
-    "Bryant": ("Bryant University", "Bryant", "", "#002878", True, False, False, False),
-    "Bucknell": ("Bucknell University", "Bucknell", "", "#FF7900", True, False, False, False),
-    "California": ("University of California - Berkeley", "UC Berkeley", "", "#8B0000", True, True, False, False),
-    "Canisius": ("Canisius University", "Canisius", "", "#003DA5", True, False, False, False),
-    "Clemson": ("Clemson University", "Clemson", "", "#F66733", True, False, False, False),
-    "Colgate": ("Colgate University", "Colgate", "", "#862633", True, True, False, False),
-    "Columbia": ("Columbia University", "Columbia", "", "#0073E6", True, True, True, False),
-    "Cornell": ("Cornell University", "Cornell", "", "#A31621", True, True, True, False),
-    "Creighton": ("Creighton University", "Creighton", "", "#00693E", True, False, False, False),
-    "Dartmouth": ("Dartmouth College", "Dartmouth", "", "#1E3A8A", True, True, True, False),
-    "Dayton": ("University of Dayton", "Dayton", "", "#C41E3A", True, False, False, False),
-    "Delaware": ("University of Delaware", "Delaware", "", "#003DA5", True, False, False, False),
-    "Drake": ("Drake University", "Drake", "", "#004B87", True, False, False, False),
-    "Drexel": ("Drexel University", "Drexel", "", "#003087", True, True, False, False),
-    "Duke": ("Duke University", "Duke", "", "#8A0538", True, False, False, False),
-    "Duquesne": ("Duquesne University", "Duquesne", "", "#0047AB", True, False, False, False),
-    "Eastern Michigan": ("Eastern Michigan University", "Eastern Michigan", "", "#FF6600", True, False, False, False),
-    "Embry-Riddle": ("Embry-Riddle Aeronautical University", "Embry-Riddle", "", "#8B0000", False, True, False, False),
-    "Fairfield": ("Fairfield University", "Fairfield", "", "#862633", True, True, False, False),
-    "Florida Tech - FIT": ("Florida Intitute of Technology", "Florida Tech", "FIT", "#006633", False, True, False, False),
-    "Fordham": ("Fordham University", "Fordham", "", "#003DA5", True, False, False, False),
-    "George Mason": ("George Mason University", "George Mason", "", "#1E3A8A", True, False, False, False),
-    "George Washington": ("George Washington University", "George Washington", "", "#003087", True, False, False, False),
-    "Georgetown": ("Georgetown University", "Georgetown", "", "#006747", True, True, True, True),
-    "Gonzaga": ("Gonzaga University", "Gonzaga", "", "#002147", True, True, False, False),
-    "Gordon College": ("Gordon College", "", "", "#A41034", False, False, True, True),
-    "Harvard": ("Harvard University", "Harvard", "", "#A41034", False, True, True, True),
-    "Hobart": ("Hobart College", "Hobart", "", "#7B2142", False, True, False, False),
-    "Holy Cross": ("College of the Holy Cross", "Holy Cross", "", "#5C0F2E", True, True, False, False),
-    "Indiana": ("Indiana University Bloomington", "Indiana", "", "#FF6600", True, False, False, False),
-    "Iona": ("Iona University", "Iona", "", "#FF6600", True, True, False, False),
-    "Iowa": ("University of Iowa", "Iowa", "", "#002147", True, False, False, False),
-    "Jacksonville": ("Jacksonville University", "Jacksonville", "", "#8E44AD", True, True, False, False),
-    "Kansas": ("University of Kansas", "Kansas", "", "#FF6600", True, False, False, False),
-    "Kansas State - KSU": ("Kansas State University", "Kansas State", "KSU", "#0053A0", True, False, False, False),
-    "La Salle": ("La Salle University", "La Salle", "", "#0047AB", True, True, False, False),
-    "Lehigh": ("Lehigh University", "Lehigh", "", "#003153", True, False, False, False),
-    "Lewis & Clark": ("Lewis & Clark College", "Lewis & Clark", "", "#FF6600", False, True, False, False),
-    "Louisville": ("University of Louisville", "Louisville", "", "#002F87", True, False, False, False),
-    "Loyola Maryland": ("Loyola University Maryland", "Loyola Maryland", "", "#003DA5", True, True, False, False),
-    "Loyola Marymount": ("Loyola Marymount University", "Loyola Marymount", "", "#8B0000", True, False, False, False),
-    "Manhattan": ("Manhattan University", "Manhattan", "", "#FF0000", True, False, False, False),
-    "Marist": ("Marist College", "Marist", "", "#003DA5", True, True, False, False),
-    "Mercyhurst": ("Mercyhurst University", "Mercyhurst", "", "#AD0000", False, True, True, False),
-    "Miami": ("University of Miami", "Miami", "", "#8C1D40", True, False, False, False),
-    "Michigan": ("University of Michigan", "Michigan", "", "#C41E3A", True, False, False, False),
-    "Michigan State": ("Michigan State University", "Michigan State", "MSU", "#0053A0", True, False, False, False),
-    "Minnesota": ("University of Minnesota", "Minnesota", "", "#8B0000", True, False, False, False),
-    "MIT": ("Massachusetts Institute of Technology", "MIT", "MIT", "#18453B", True, True, True, True),
-    "Monmouth": ("Monmouth University", "Monmouth", "", "#CC0000", True, False, False, False),
-    "Navy": ("United States Naval Academy", "Navy", "", "#003F87", True, True, True, False),
-    "Northeastern": ("Northeastern University", "Northeastern", "", "#BB0000", True, True, False, False),
-    "Notre Dame": ("University of Notre Dame", "Notre Dame", "", "#003087", True, False, False, False),
-    "Ohio State": ("Ohio State University", "Ohio State", "OSU", "#D21034", True, False, False, False),
-    "Oklahoma": ("University of Oklahoma", "Oklahoma", "", "#C41E3A", True, False, False, False),
-    "Oklahoma City": ("Oklahoma City University", "Oklahoma City", "OCU", "#FF6600", False, True, False, False),
-    "Old Dominion": ("Old Dominion University", "Old Dominion", "", "#002147", True, False, False, False),
-    "Oregon State - OSU": ("Oregon State  University", "Oregon State", "OSU", "#C8102E", True, True, False, False),
-    "Penn": ("University of Pennsylvania", "Penn", "", "#FF6600", True, True, True, False),
-    "Portland": ("University of Portland", "Portland", "", "#4B2E83", True, False, False, False),
-    "Princeton": ("Princeton University", "Princeton", "", "#FF6600", True, True, True, True),
-    "Radcliff": ("Harvard/Radcliff", "Radcliff", "", "#FF6600", True, False, False, False),
-    "Robert Morris": ("Robert Morris University", "Robert Morris", "", "#003087", True, False, False, False),
-    "Rollins": ("Rollins College", "Rollins", "", "#8B0000", False, True, False, False),
-    "Rutgers": ("Rutgers University", "Rutgers", "", "#FF6600", True, False, False, False),
-    "Sacramento State": ("California State University - Sacramento", "Sacramento State", "", "#046A38", True, False, False, False),
-    "Sacred Heart": ("Sacred Heart University", "Sacred Heart", "", "#CC0000", True, False, False, False),
-    "Saint Joseph's": ("Saint Joseph's University", "Saint Joseph's", "", "#003DA5", True, True, False, False),
-    "Saint Mary's": ("Saint Mary's College of California", "Saint Mary's", "", "#002147", True, False, False, False),
-    "Santa Clara": ("Santa Clara University", "Santa Clara", "", "#001A57", True, True, False, False),
-    "Seattle": ("Seattle University", "Seattle", "", "#8B0000", True, False, False, False),
-    "SMU": ("Southern Methodist University", "SMU", "SMU", "#003087", True, False, False, False),
-    "Stanford": ("Stanford University", "Stanford", "", "#001E3C", True, True, False, True),
-    "Stetson": ("Stetson University", "Stetson", "", "#003DA5", True, True, False, False),
-    "Syracuse": ("Syracuse University", "Syracuse", "", "#8C1D40", True, True, False, False),
-    "Temple": ("Temple University", "Temple", "", "#FF6600", True, True, False, False),
-    "Tennessee": ("University of Tennessee", "Tennessee", "", "#C41E3A", True, False, False, False),
-    "Texas": ("University of Texas at Austin", "Texas", "", "#8B0000", True, False, False, False),
-    "Tulsa": ("University of Tulsa", "Tulsa", "", "#FF6600", True, False, False, False),
-    "UC San Diego": ("University of California - San Diego", "UC San Diego", "UCSD", "#003DA5", True, True, False, False),
-    "UCF": ("University of Central Florida", "UCF", "UCF", "#002147", True, False, False, False),
-    "UCLA": ("University of California - Los Angeles", "UCLA", "UCLA", "#FFCC00", True, False, False, False),
-    "Uconn": ("University of Connecticut", "UConn", "UConn", "#001B3A", True, False, False, False),
-    "UMass": ("University of Massachusetts - Amherst", "UMass", "", "#FFA500", True, False, False, False),
-    "University of North Carolina - UNC": ("University of North Carolina - Chapel Hill", "", "UNC", "#003DA5", True, False, False, False),
-    "University of Rhode Island - URI": ("University of Rhode Island", "", "URI", "#003DA5", True, False, False, False),
-    "University of San Diego - USD": ("University of San Diego", "San Diego", "USD", "#8B0000", True, True, False, False),
-    "University of Southern California - USC": ("University of Southern California", "USC", "USC", "#FF6600", True, False, False, False),
-    "Villanova ": ("Villanova University", "Villanova", "", "#002F87", True, False, False, False),
-    "Washington - UW": ("University of Washington", "Washington", "UW", "#FF6600", True, True, False, False),
-    "Washington State University - WSU": ("Washington State University", "Washington State", "WSU", "#C41E3A", True, False, False, False),
-    "West Virginia University  - WVU": ("West Virginia University", "West Virginia", "WVU", "#981E32", True, False, False, False),
-    "Wisconsin": ("University of Wisconsin - Madison", "Wisconsin", "", "#CC0000", True, True, False, True),
-    "Yale": ("Yale University", "Yale", "", "#00274C", True, True, True, False)
+    "Alabama": SchoolInfo("University of Alabama", "Alabama", "", "#9E1B32", True, False, False, False),
+    "Boston College": SchoolInfo("Boston College", "", "", "#98002E", True, False, False, False),
+    "Boston University - BU": SchoolInfo("Boston University", "BU", "BU", "#CC0000", True, True, False, True),
+    "Brown": SchoolInfo("Brown University", "Brown", "", "#8B0000", True, True, False, False),
+    "Bryant": SchoolInfo("Bryant University", "Bryant", "", "#002878", True, False, False, False),
+    "Bucknell": SchoolInfo("Bucknell University", "Bucknell", "", "#FF7900", True, False, False, False),
+    "California": SchoolInfo("University of California - Berkeley", "UC Berkeley", "", "#8B0000", True, True, False, False),
+    "Canisius": SchoolInfo("Canisius University", "Canisius", "", "#003DA5", True, False, False, False),
+    "Clemson": SchoolInfo("Clemson University", "Clemson", "", "#F66733", True, False, False, False),
+    "Colgate": SchoolInfo("Colgate University", "Colgate", "", "#862633", True, True, False, False),
+    "Columbia": SchoolInfo("Columbia University", "Columbia", "", "#0073E6", True, True, True, False),
+    "Cornell": SchoolInfo("Cornell University", "Cornell", "", "#A31621", True, True, True, False),
+    "Creighton": SchoolInfo("Creighton University", "Creighton", "", "#00693E", True, False, False, False),
+    "Dartmouth": SchoolInfo("Dartmouth College", "Dartmouth", "", "#1E3A8A", True, True, True, False),
+    "Dayton": SchoolInfo("University of Dayton", "Dayton", "", "#C41E3A", True, False, False, False),
+    "Delaware": SchoolInfo("University of Delaware", "Delaware", "", "#003DA5", True, False, False, False),
+    "Drake": SchoolInfo("Drake University", "Drake", "", "#004B87", True, False, False, False),
+    "Drexel": SchoolInfo("Drexel University", "Drexel", "", "#003087", True, True, False, False),
+    "Duke": SchoolInfo("Duke University", "Duke", "", "#8A0538", True, False, False, False),
+    "Duquesne": SchoolInfo("Duquesne University", "Duquesne", "", "#0047AB", True, False, False, False),
+    "Eastern Michigan": SchoolInfo("Eastern Michigan University", "Eastern Michigan", "", "#FF6600", True, False, False, False),
+    "Embry-Riddle": SchoolInfo("Embry-Riddle Aeronautical University", "Embry-Riddle", "", "#8B0000", False, True, False, False),
+    "Fairfield": SchoolInfo("Fairfield University", "Fairfield", "", "#862633", True, True, False, False),
+    "Florida Tech - FIT": SchoolInfo("Florida Intitute of Technology", "Florida Tech", "FIT", "#006633", False, True, False, False),
+    "Fordham": SchoolInfo("Fordham University", "Fordham", "", "#003DA5", True, False, False, False),
+    "George Mason": SchoolInfo("George Mason University", "George Mason", "", "#1E3A8A", True, False, False, False),
+    "George Washington": SchoolInfo("George Washington University", "George Washington", "", "#003087", True, False, False, False),
+    "Georgetown": SchoolInfo("Georgetown University", "Georgetown", "", "#006747", True, True, True, True),
+    "Gonzaga": SchoolInfo("Gonzaga University", "Gonzaga", "", "#002147", True, True, False, False),
+    "Gordon College": SchoolInfo("Gordon College", "", "", "#A41034", False, False, True, True),
+    "Harvard": SchoolInfo("Harvard University", "Harvard", "", "#A41034", False, True, True, True),
+    "Hobart": SchoolInfo("Hobart College", "Hobart", "", "#7B2142", False, True, False, False),
+    "Holy Cross": SchoolInfo("College of the Holy Cross", "Holy Cross", "", "#5C0F2E", True, True, False, False),
+    "Indiana": SchoolInfo("Indiana University Bloomington", "Indiana", "", "#FF6600", True, False, False, False),
+    "Iona": SchoolInfo("Iona University", "Iona", "", "#FF6600", True, True, False, False),
+    "Iowa": SchoolInfo("University of Iowa", "Iowa", "", "#002147", True, False, False, False),
+    "Jacksonville": SchoolInfo("Jacksonville University", "Jacksonville", "", "#8E44AD", True, True, False, False),
+    "Kansas": SchoolInfo("University of Kansas", "Kansas", "", "#FF6600", True, False, False, False),
+    "Kansas State - KSU": SchoolInfo("Kansas State University", "Kansas State", "KSU", "#0053A0", True, False, False, False),
+    "La Salle": SchoolInfo("La Salle University", "La Salle", "", "#0047AB", True, True, False, False),
+    "Lehigh": SchoolInfo("Lehigh University", "Lehigh", "", "#003153", True, False, False, False),
+    "Lewis & Clark": SchoolInfo("Lewis & Clark College", "Lewis & Clark", "", "#FF6600", False, True, False, False),
+    "Louisville": SchoolInfo("University of Louisville", "Louisville", "", "#002F87", True, False, False, False),
+    "Loyola Maryland": SchoolInfo("Loyola University Maryland", "Loyola Maryland", "", "#003DA5", True, True, False, False),
+    "Loyola Marymount": SchoolInfo("Loyola Marymount University", "Loyola Marymount", "", "#8B0000", True, False, False, False),
+    "Manhattan": SchoolInfo("Manhattan University", "Manhattan", "", "#FF0000", True, False, False, False),
+    "Marist": SchoolInfo("Marist College", "Marist", "", "#003DA5", True, True, False, False),
+    "Mercyhurst": SchoolInfo("Mercyhurst University", "Mercyhurst", "", "#AD0000", False, True, True, False),
+    "Miami": SchoolInfo("University of Miami", "Miami", "", "#8C1D40", True, False, False, False),
+    "Michigan": SchoolInfo("University of Michigan", "Michigan", "", "#C41E3A", True, False, False, False),
+    "Michigan State": SchoolInfo("Michigan State University", "Michigan State", "MSU", "#0053A0", True, False, False, False),
+    "Minnesota": SchoolInfo("University of Minnesota", "Minnesota", "", "#8B0000", True, False, False, False),
+    "MIT": SchoolInfo("Massachusetts Institute of Technology", "MIT", "MIT", "#18453B", True, True, True, True),
+    "Monmouth": SchoolInfo("Monmouth University", "Monmouth", "", "#CC0000", True, False, False, False),
+    "Navy": SchoolInfo("United States Naval Academy", "Navy", "", "#003F87", True, True, True, False),
+    "Northeastern": SchoolInfo("Northeastern University", "Northeastern", "", "#BB0000", True, True, False, False),
+    "Notre Dame": SchoolInfo("University of Notre Dame", "Notre Dame", "", "#003087", True, False, False, False),
+    "Ohio State": SchoolInfo("Ohio State University", "Ohio State", "OSU", "#D21034", True, False, False, False),
+    "Oklahoma": SchoolInfo("University of Oklahoma", "Oklahoma", "", "#C41E3A", True, False, False, False),
+    "Oklahoma City": SchoolInfo("Oklahoma City University", "Oklahoma City", "OCU", "#FF6600", False, True, False, False),
+    "Old Dominion": SchoolInfo("Old Dominion University", "Old Dominion", "", "#002147", True, False, False, False),
+    "Oregon State - OSU": SchoolInfo("Oregon State  University", "Oregon State", "OSU", "#C8102E", True, True, False, False),
+    "Penn": SchoolInfo("University of Pennsylvania", "Penn", "", "#FF6600", True, True, True, False),
+    "Portland": SchoolInfo("University of Portland", "Portland", "", "#4B2E83", True, False, False, False),
+    "Princeton": SchoolInfo("Princeton University", "Princeton", "", "#FF6600", True, True, True, True),
+    "Radcliff": SchoolInfo("Harvard/Radcliff", "Radcliff", "", "#FF6600", True, False, False, False),
+    "Robert Morris": SchoolInfo("Robert Morris University", "Robert Morris", "", "#003087", True, False, False, False),
+    "Rollins": SchoolInfo("Rollins College", "Rollins", "", "#8B0000", False, True, False, False),
+    "Rutgers": SchoolInfo("Rutgers University", "Rutgers", "", "#FF6600", True, False, False, False),
+    "Sacramento State": SchoolInfo("California State University - Sacramento", "Sacramento State", "", "#046A38", True, False, False, False),
+    "Sacred Heart": SchoolInfo("Sacred Heart University", "Sacred Heart", "", "#CC0000", True, False, False, False),
+    "Saint Joseph's": SchoolInfo("Saint Joseph's University", "Saint Joseph's", "", "#003DA5", True, True, False, False),
+    "Saint Mary's": SchoolInfo("Saint Mary's College of California", "Saint Mary's", "", "#002147", True, False, False, False),
+    "Santa Clara": SchoolInfo("Santa Clara University", "Santa Clara", "", "#001A57", True, True, False, False),
+    "Seattle": SchoolInfo("Seattle University", "Seattle", "", "#8B0000", True, False, False, False),
+    "SMU": SchoolInfo("Southern Methodist University", "SMU", "SMU", "#003087", True, False, False, False),
+    "Stanford": SchoolInfo("Stanford University", "Stanford", "", "#001E3C", True, True, False, True),
+    "Stetson": SchoolInfo("Stetson University", "Stetson", "", "#003DA5", True, True, False, False),
+    "Syracuse": SchoolInfo("Syracuse University", "Syracuse", "", "#8C1D40", True, True, False, False),
+    "Temple": SchoolInfo("Temple University", "Temple", "", "#FF6600", True, True, False, False),
+    "Tennessee": SchoolInfo("University of Tennessee", "Tennessee", "", "#C41E3A", True, False, False, False),
+    "Texas": SchoolInfo("University of Texas at Austin", "Texas", "", "#8B0000", True, False, False, False),
+    "Tulsa": SchoolInfo("University of Tulsa", "Tulsa", "", "#FF6600", True, False, False, False),
+    "UC San Diego": SchoolInfo("University of California - San Diego", "UC San Diego", "UCSD", "#003DA5", True, True, False, False),
+    "UCF": SchoolInfo("University of Central Florida", "UCF", "UCF", "#002147", True, False, False, False),
+    "UCLA": SchoolInfo("University of California - Los Angeles", "UCLA", "UCLA", "#FFCC00", True, False, False, False),
+    "Uconn": SchoolInfo("University of Connecticut", "UConn", "UConn", "#001B3A", True, False, False, False),
+    "UMass": SchoolInfo("University of Massachusetts - Amherst", "UMass", "", "#FFA500", True, False, False, False),
+    "University of North Carolina - UNC": SchoolInfo("University of North Carolina - Chapel Hill", "", "UNC", "#003DA5", True, False, False, False),
+    "University of Rhode Island - URI": SchoolInfo("University of Rhode Island", "", "URI", "#003DA5", True, False, False, False),
+    "University of San Diego - USD": SchoolInfo("University of San Diego", "San Diego", "USD", "#8B0000", True, True, False, False),
+    "University of Southern California - USC": SchoolInfo("University of Southern California", "USC", "USC", "#FF6600", True, False, False, False),
+    "Villanova ": SchoolInfo("Villanova University", "Villanova", "", "#002F87", True, False, False, False),
+    "Washington - UW": SchoolInfo("University of Washington", "Washington", "UW", "#FF6600", True, True, False, False),
+    "Washington State University - WSU": SchoolInfo("Washington State University", "Washington State", "WSU", "#C41E3A", True, False, False, False),
+    "West Virginia University  - WVU": SchoolInfo("West Virginia University", "West Virginia", "WVU", "#981E32", True, False, False, False),
+    "Wisconsin": SchoolInfo("University of Wisconsin - Madison", "Wisconsin", "", "#CC0000", True, True, False, True),
+    "Yale": SchoolInfo("Yale University", "Yale", "", "#00274C", True, True, True, False)
 }
 
 # Conference mappings ONLY for Openweight Women teams - KEYED BY CRR NAME
@@ -241,251 +259,404 @@ OPENWEIGHT_WOMEN_CONFERENCES = {
     "Temple": "Independent",
 }
 
+# ── Rows derived from the tables above, computed once at import ─────────────
+
+# (gender, weight) of the team each participation flag stands for, in flag order
+_TEAM_TYPES_BY_FLAG = (("W", "OW"), ("M", "HW"), ("M", "LW"), ("W", "LW"))
+
+# Parameters for the schools INSERT: (name, short_name, acronym, crr_name, color)
+_SCHOOL_ROWS = tuple(
+    (info.name, info.short_name, info.acronym, crr_name, info.color)
+    for crr_name, info in SCHOOL_EXTENDED_INFO.items()
+)
+
+# (crr_name, (ow, hm, lm, lw) flags, (gender, weight) of each team the school fields)
+_SCHOOL_TEAM_RECORDS = tuple(
+    (crr_name, info.participation_flags,
+     tuple(team for team, flag in zip(_TEAM_TYPES_BY_FLAG, info.participation_flags) if flag))
+    for crr_name, info in SCHOOL_EXTENDED_INFO.items()
+)
+
+# Columns added since each table was first released, as (name, type and default);
+# migrate_existing_data adds any that an existing database is missing
+_REQUIRED_COLUMNS = {
+    "schools": (
+        ("short_name", "TEXT"),
+        ("acronym", "TEXT"),
+        ("crr_name", "TEXT"),
+        ("color", "TEXT"),
+        ("created_at", "DATETIME DEFAULT CURRENT_TIMESTAMP"),
+        ("updated_at", "DATETIME DEFAULT CURRENT_TIMESTAMP"),
+    ),
+    "entries": (("notes", "TEXT DEFAULT ''"),),
+    "events": (("event_distance", "TEXT DEFAULT '2k'"),),
+}
+
+# Stored in PRAGMA user_version once the schema is current; bump it when adding a
+# migration so existing databases run migrate_existing_data again
+CURRENT_SCHEMA_VERSION = 3
+
+# Page cache while initializing; negative values are KiB, so this is 64 MiB
+BULK_LOAD_CACHE_KIB = 65536
+
+# ── Schema ──────────────────────────────────────────────────────────────────
+# All tables and triggers, run as one script in a single transaction
+_SQL_CREATE_SCHEMA = """
+    BEGIN;
+
+    -- Schools table - CRR name is the primary display identifier
+    CREATE TABLE IF NOT EXISTS schools (
+        school_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        short_name TEXT,
+        acronym TEXT,
+        crr_name TEXT NOT NULL UNIQUE,
+        color TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Teams table
+    CREATE TABLE IF NOT EXISTS teams (
+        team_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        school_id INTEGER NOT NULL,
+        gender TEXT NOT NULL CHECK (gender IN ('M', 'W')),
+        weight TEXT NOT NULL CHECK (weight IN ('LW', 'HW', 'OW')),
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (school_id) REFERENCES schools (school_id) ON UPDATE CASCADE ON DELETE CASCADE,
+        UNIQUE(school_id, gender, weight)
+    );
+
+    -- Conference affiliations table for historical tracking
+    CREATE TABLE IF NOT EXISTS conference_affiliations (
+        affiliation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        team_id INTEGER NOT NULL,
+        conference TEXT NOT NULL,
+        start_date DATE NOT NULL,
+        end_date DATE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (team_id) REFERENCES teams (team_id) ON UPDATE CASCADE ON DELETE CASCADE
+    );
+
+    -- School participations table for D1 Schools tab
+    CREATE TABLE IF NOT EXISTS school_participations (
+        participation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        school_id INTEGER NOT NULL,
+        start_date DATE NOT NULL,
+        end_date DATE,
+        openweight_women BOOLEAN DEFAULT FALSE,
+        heavyweight_men BOOLEAN DEFAULT FALSE,
+        lightweight_men BOOLEAN DEFAULT FALSE,
+        lightweight_women BOOLEAN DEFAULT FALSE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (school_id) REFERENCES schools (school_id) ON UPDATE CASCADE ON DELETE CASCADE
+    );
+
+    -- Regattas table
+    CREATE TABLE IF NOT EXISTS regattas (
+        regatta_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        location TEXT,
+        start_date DATE,
+        end_date DATE,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Events table
+    CREATE TABLE IF NOT EXISTS events (
+        event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        regatta_id INTEGER NOT NULL,
+        boat_type TEXT NOT NULL CHECK (boat_type IN ('8+', '4+', '4x', '2x', '1x', '2-')),
+        event_boat_class TEXT NOT NULL,
+        gender TEXT NOT NULL CHECK (gender IN ('M', 'W')),
+        weight TEXT NOT NULL CHECK (weight IN ('LW', 'HW', 'OW')),
+        round TEXT NOT NULL,
+        event_distance TEXT DEFAULT '2k',
+        scheduled_at DATETIME,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (regatta_id) REFERENCES regattas (regatta_id) ON UPDATE CASCADE ON DELETE CASCADE
+    );
+
+    -- Entries table with conference_at_time for historical accuracy
+    CREATE TABLE IF NOT EXISTS entries (
+        entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_id INTEGER NOT NULL,
+        team_id INTEGER NOT NULL,
+        entry_boat_class TEXT,
+        conference_at_time TEXT,
+        seed INTEGER,
+        notes TEXT DEFAULT '',
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (event_id) REFERENCES events (event_id) ON UPDATE CASCADE ON DELETE CASCADE,
+        FOREIGN KEY (team_id) REFERENCES teams (team_id) ON UPDATE CASCADE ON DELETE CASCADE
+    );
+
+    -- Results table
+    CREATE TABLE IF NOT EXISTS results (
+        result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        entry_id INTEGER NOT NULL,
+        lane INTEGER,
+        position INTEGER,
+        elapsed_sec REAL,
+        margin_sec REAL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (entry_id) REFERENCES entries (entry_id) ON UPDATE CASCADE ON DELETE CASCADE
+    );
+
+    -- Add trigger to update timestamps
+    CREATE TRIGGER IF NOT EXISTS update_schools_timestamp
+    AFTER UPDATE ON schools
+    BEGIN
+        UPDATE schools SET updated_at = CURRENT_TIMESTAMP WHERE school_id = NEW.school_id;
+    END;
+
+    COMMIT;
+"""
+
+# Secondary indexes, built by create_indexes() once the initial data is loaded so
+# the bulk inserts don't maintain them row by row
+_SQL_CREATE_INDEXES = """
+    BEGIN;
+
+    -- Add index on CRR name for fast lookups
+    CREATE INDEX IF NOT EXISTS idx_schools_crr_name ON schools(crr_name);
+
+    -- Add indexes for the per-event delete + re-insert done when results are submitted.
+    -- entries keeps rowid storage (results reference entry_id, which is AUTOINCREMENT); since
+    -- a submit re-inserts the whole event at the end of the table, its rows stay contiguous.
+    CREATE INDEX IF NOT EXISTS idx_entries_event ON entries(event_id);
+    CREATE INDEX IF NOT EXISTS idx_results_entry_id ON results(entry_id);
+
+    -- Covering index for the "all teams of one gender/weight" lookups (team_id is the rowid)
+    CREATE INDEX IF NOT EXISTS idx_teams_gender_weight ON teams(gender, weight, school_id);
+
+    -- Participations by start date, for the "records starting in a given year" checks
+    CREATE INDEX IF NOT EXISTS idx_school_participations_start ON school_participations(start_date, school_id);
+
+    COMMIT;
+"""
+
+# Everything hanging off schools, children first so no row is left orphaned; emptying
+# each table outright is cheaper than letting ON DELETE CASCADE remove them row by row
+_SQL_CLEAR_SCHOOL_DATA = """
+    BEGIN;
+    DELETE FROM results;
+    DELETE FROM entries;
+    DELETE FROM school_participations;
+    DELETE FROM conference_affiliations;
+    DELETE FROM teams;
+    DELETE FROM schools;
+    COMMIT;
+"""
+
+# ── Bulk-load statements ────────────────────────────────────────────────────
+# One fixed SQL string per statement, so sqlite3's statement cache prepares each once
+
+_SQL_SELECT_SCHOOL_IDS = "SELECT crr_name, school_id FROM schools"
+
+_SQL_UPSERT_SCHOOL = """
+    INSERT INTO schools (name, short_name, acronym, crr_name, color) 
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(crr_name) DO UPDATE SET
+        name = excluded.name, short_name = excluded.short_name,
+        acronym = excluded.acronym, color = excluded.color,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_INSERT_TEAM = "INSERT OR IGNORE INTO teams (school_id, gender, weight) VALUES (?, ?, ?)"
+
+_SQL_SELECT_OW_TEAM_IDS = """
+    SELECT s.crr_name, t.team_id FROM teams t
+    JOIN schools s ON t.school_id = s.school_id
+    WHERE t.gender = 'W' AND t.weight = 'OW'
+"""
+
+_SQL_INSERT_AFFILIATION = """
+    INSERT INTO conference_affiliations (team_id, conference, start_date, end_date)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_SELECT_PARTICIPATING_SCHOOL_IDS = """
+    SELECT DISTINCT school_id FROM school_participations
+    WHERE start_date >= ? AND start_date < ?
+"""
+
+_SQL_INSERT_PARTICIPATION = """
+    INSERT INTO school_participations 
+    (school_id, start_date, end_date, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
+    VALUES (?, ?, NULL, ?, ?, ?, ?)
+"""
+
+# Every count print_summary reports, fetched as one row
+_SQL_SUMMARY_COUNTS = """
+    SELECT
+        (SELECT COUNT(*) FROM schools),
+        (SELECT COUNT(*) FROM teams),
+        (SELECT COUNT(*) FROM conference_affiliations),
+        (SELECT COUNT(*) FROM school_participations),
+        (SELECT COUNT(*) FROM school_participations
+         WHERE start_date >= ? AND start_date < ? AND end_date IS NULL)
+"""
+
+def _year_date_range(year: int) -> Tuple[str, str]:
+    """(first day of year, first day of the next year) for a start_date >= ? AND start_date < ? filter.
+    
+    Unlike SUBSTR(start_date, 1, 4) = ?, the range can be answered from an index on start_date.
+    """
+    return f"{year}-01-01", f"{year + 1}-01-01"
+
 class RowingDatabaseInitializer:
     """Initializes the rowing database with CRR name as the primary school identifier."""
     
-    def __init__(self, db_path: str = "rowing_database.db"):
+    def __init__(self, db_path: str = "rowing_database.db", fast: bool = False,
+                 in_memory_build: bool = False):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.fast = fast
+        # Build in memory and write db_path once at the end (new databases only, since
+        # the file is written from scratch)
+        self.in_memory_build = in_memory_build
+        if in_memory_build and os.path.exists(db_path):
+            raise ValueError(f"In-memory build only creates new databases, but {db_path} already exists")
+        # Per-school progress lines are only printed with ROWING_DB_LOG_LEVEL=DEBUG, the
+        # same switch that enables debug_print output in the race-input app
+        self.verbose = os.environ.get("ROWING_DB_LOG_LEVEL", "INFO").upper() == "DEBUG"
+        self._columns_by_table: Dict[str, Set[str]] = {}  # See _table_columns()
+        # Autocommit mode: each bulk phase runs in an explicit _transaction() instead of
+        # the sqlite3 module opening implicit transactions around DML
+        self.conn = sqlite3.connect(":memory:" if in_memory_build else db_path, isolation_level=None)
         self.conn.execute("PRAGMA foreign_keys = ON")
+        # Tune the connection for the bulk load that follows; finalize() restores
+        # full durability and normal locking once it is done
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute(f"PRAGMA cache_size = -{BULK_LOAD_CACHE_KIB}")
+        self.conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+        if fast:
+            # One-shot rebuilds only: a crash mid-load can corrupt the file, which is
+            # acceptable when it is about to be recreated from scratch anyway
+            self.conn.execute("PRAGMA synchronous = OFF")
+            self.conn.execute("PRAGMA journal_mode = MEMORY")
         print(f"Connected to database: {db_path}")
     
+    @contextmanager
+    def _transaction(self):
+        """Run the block in one BEGIN IMMEDIATE ... COMMIT, rolling back on error.
+        
+        Inside an enclosing _transaction() the block simply joins it.
+        """
+        if self.conn.in_transaction:
+            yield
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+    
     def create_tables(self):
         """Create all tables with enhanced schema for CRR name management."""
         print("Creating database tables...")
-        cursor = self.conn.cursor()
-        
-        # Schools table - CRR name is the primary display identifier
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS schools (
-                school_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                short_name TEXT,
-                acronym TEXT,
-                crr_name TEXT NOT NULL UNIQUE,
-                color TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Add index on CRR name for fast lookups
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_schools_crr_name ON schools(crr_name)")
-        
-        # Teams table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS teams (
-                team_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                school_id INTEGER NOT NULL,
-                gender TEXT NOT NULL CHECK (gender IN ('M', 'W')),
-                weight TEXT NOT NULL CHECK (weight IN ('LW', 'HW', 'OW')),
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (school_id) REFERENCES schools (school_id) ON UPDATE CASCADE ON DELETE CASCADE,
-                UNIQUE(school_id, gender, weight)
-            )
-        """)
-        
-        # Conference affiliations table for historical tracking
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS conference_affiliations (
-                affiliation_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                team_id INTEGER NOT NULL,
-                conference TEXT NOT NULL,
-                start_date DATE NOT NULL,
-                end_date DATE,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (team_id) REFERENCES teams (team_id) ON UPDATE CASCADE ON DELETE CASCADE
-            )
-        """)
-        
-        # School participations table for D1 Schools tab
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS school_participations (
-                participation_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                school_id INTEGER NOT NULL,
-                start_date DATE NOT NULL,
-                end_date DATE,
-                openweight_women BOOLEAN DEFAULT FALSE,
-                heavyweight_men BOOLEAN DEFAULT FALSE,
-                lightweight_men BOOLEAN DEFAULT FALSE,
-                lightweight_women BOOLEAN DEFAULT FALSE,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (school_id) REFERENCES schools (school_id) ON UPDATE CASCADE ON DELETE CASCADE
-            )
-        """)
-        
-        # Regattas table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS regattas (
-                regatta_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                location TEXT,
-                start_date DATE,
-                end_date DATE,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Events table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS events (
-                event_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                regatta_id INTEGER NOT NULL,
-                boat_type TEXT NOT NULL CHECK (boat_type IN ('8+', '4+', '4x', '2x', '1x', '2-')),
-                event_boat_class TEXT NOT NULL,
-                gender TEXT NOT NULL CHECK (gender IN ('M', 'W')),
-                weight TEXT NOT NULL CHECK (weight IN ('LW', 'HW', 'OW')),
-                round TEXT NOT NULL,
-                event_distance TEXT DEFAULT '2k',
-                scheduled_at DATETIME,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (regatta_id) REFERENCES regattas (regatta_id) ON UPDATE CASCADE ON DELETE CASCADE
-            )
-        """)
-        
-        # Entries table with conference_at_time for historical accuracy
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS entries (
-                entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_id INTEGER NOT NULL,
-                team_id INTEGER NOT NULL,
-                entry_boat_class TEXT,
-                conference_at_time TEXT,
-                seed INTEGER,
-                notes TEXT DEFAULT '',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (event_id) REFERENCES events (event_id) ON UPDATE CASCADE ON DELETE CASCADE,
-                FOREIGN KEY (team_id) REFERENCES teams (team_id) ON UPDATE CASCADE ON DELETE CASCADE
-            )
-        """)
-        
-        # Results table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS results (
-                result_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                entry_id INTEGER NOT NULL,
-                lane INTEGER,
-                position INTEGER,
-                elapsed_sec REAL,
-                margin_sec REAL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (entry_id) REFERENCES entries (entry_id) ON UPDATE CASCADE ON DELETE CASCADE
-            )
-        """)
-        
-        # Add trigger to update timestamps
-        cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_schools_timestamp 
-            AFTER UPDATE ON schools 
-            BEGIN
-                UPDATE schools SET updated_at = CURRENT_TIMESTAMP WHERE school_id = NEW.school_id;
-            END
-        """)
-        
-        self.conn.commit()
+        is_new_database = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schools'"
+        ).fetchone() is None
+        self.conn.executescript(_SQL_CREATE_SCHEMA)
+        if is_new_database:
+            # Tables were just created with the current schema, so nothing to migrate
+            self._set_schema_version()
         print("✓ Database tables created successfully with CRR name support")
     
+    def _table_columns(self, table: str) -> Set[str]:
+        """Column names of table, read with PRAGMA table_info once and then cached.
+        
+        Callers that ALTER the table add the new column to the returned set.
+        """
+        columns = self._columns_by_table.get(table)
+        if columns is None:
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            self._columns_by_table[table] = columns
+        return columns
+    
+    def _schema_version(self) -> int:
+        return self.conn.execute("PRAGMA user_version").fetchone()[0]
+    
+    def _set_schema_version(self):
+        self.conn.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
+    
+    def create_indexes(self):
+        """Create the secondary indexes (after populating, so the load doesn't maintain them)."""
+        self.conn.executescript(_SQL_CREATE_INDEXES)
+        print("✓ Database indexes created")
+    
     def migrate_existing_data(self):
         """Migrate existing data to new schema if needed."""
         print("Checking for existing data to migrate...")
-        cursor = self.conn.cursor()
-        
-        # Check if schools table needs extended columns
-        cursor.execute("PRAGMA table_info(schools)")
-        existing_columns = [column[1] for column in cursor.fetchall()]
-        
-        columns_to_add = [
-            ("short_name", "TEXT"),
-            ("acronym", "TEXT"), 
-            ("crr_name", "TEXT"),
-            ("color", "TEXT"),
-            ("created_at", "DATETIME DEFAULT CURRENT_TIMESTAMP"),
-            ("updated_at", "DATETIME DEFAULT CURRENT_TIMESTAMP")
-        ]
-        
-        for column_name, column_type in columns_to_add:
-            if column_name not in existing_columns:
-                cursor.execute(f"ALTER TABLE schools ADD COLUMN {column_name} {column_type}")
-                print(f"  ✓ Added {column_name} column to schools table")
+        if self._schema_version() >= CURRENT_SCHEMA_VERSION:
+            print("✓ Schema is up to date, nothing to migrate")
+            return
         
-        # Ensure CRR name is populated and unique
-        cursor.execute("SELECT school_id, name, crr_name FROM schools WHERE crr_name IS NULL OR crr_name = ''")
-        schools_to_update = cursor.fetchall()
+        cursor = self.conn.cursor()
+        messages = []  # Printed together once the migration is done
         
-        for school_id, name, crr_name in schools_to_update:
-            # Use name as CRR name if not set
-            new_crr_name = crr_name if crr_name else name
-            cursor.execute("UPDATE schools SET crr_name = ? WHERE school_id = ?", (new_crr_name, school_id))
-            print(f"  ✓ Set CRR name for {name}: '{new_crr_name}'")
+        with self._transaction():
+            # Add the columns older versions of each table are missing
+            columns_ok = True
+            for table, columns in _REQUIRED_COLUMNS.items():
+                columns_ok &= self._ensure_columns(table, columns, messages)
+            
+            # Ensure CRR name is populated and unique: use the name wherever it isn't set
+            cursor.execute("UPDATE schools SET crr_name = name WHERE crr_name IS NULL OR crr_name = ''")
+            if cursor.rowcount > 0:
+                messages.append(f"  ✓ Set CRR name from the school name for {cursor.rowcount} schools")
+            
+            # Add unique constraint to CRR name if it doesn't exist
+            try:
+                cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_schools_crr_name_unique ON schools(crr_name)")
+            except sqlite3.IntegrityError:
+                messages.append("  ⚠️  Warning: Duplicate CRR names found - manual cleanup required")
+            
+            # A failed column is retried on the next run
+            if columns_ok:
+                self._set_schema_version()
         
-        # Add unique constraint to CRR name if it doesn't exist
-        try:
-            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_schools_crr_name_unique ON schools(crr_name)")
-        except sqlite3.IntegrityError:
-            print("  ⚠️  Warning: Duplicate CRR names found - manual cleanup required")
-        
-        # Add migration for entries table notes column
-        self.migrate_entries_table_for_notes()
-        self.migrate_events_table_for_event_distance()
-        self.conn.commit()
+        if messages:
+            print("\n".join(messages))
         print("✓ Migration completed")
 
-    def migrate_entries_table_for_notes(self):
-        """Add notes column to existing entries table if it doesn't exist."""
-        print("Checking entries table for notes column...")
-        cursor = self.conn.cursor()
-        
-        try:
-            # Check if notes column exists
-            cursor.execute("PRAGMA table_info(entries)")
-            existing_columns = [column[1] for column in cursor.fetchall()]
+    def _ensure_columns(self, table: str, columns: Tuple[Tuple[str, str], ...],
+                        messages: List[str]) -> bool:
+        """Add each (name, type) column missing from table.
+        
+        Args:
+            table: Table to check
+            columns: (column name, column type and default) pairs it should have
+            messages: Progress and warning lines are appended here
             
-            if 'notes' not in existing_columns:
-                cursor.execute("ALTER TABLE entries ADD COLUMN notes TEXT DEFAULT ''")
-                print("  ✓ Added notes column to entries table")
-                self.conn.commit()
+        Returns:
+            False if any column could not be added
+        """
+        existing_columns = self._table_columns(table)
+        all_added = True
+        
+        for column_name, column_type in columns:
+            if column_name in existing_columns:
+                continue
+            try:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}")
+            except sqlite3.Error as e:
+                messages.append(f"  ⚠️  Error adding {column_name} column to {table} table: {e}")
+                all_added = False
             else:
-                print("  ✓ Notes column already exists in entries table")
-                
-        except Exception as e:
-            print(f"  ⚠️  Error adding notes column: {e}")
-            self.conn.rollback()
-
-    def migrate_events_table_for_event_distance(self):
-        """Add event_distance column to existing events table if it doesn't exist."""
-        print("Checking events table for event_distance column...")
-        cursor = self.conn.cursor()
+                existing_columns.add(column_name)
+                messages.append(f"  ✓ Added {column_name} column to {table} table")
         
-        try:
-            # Check if event_distance column exists
-            cursor.execute("PRAGMA table_info(events)")
-            existing_columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'event_distance' not in existing_columns:
-                cursor.execute("ALTER TABLE events ADD COLUMN event_distance TEXT DEFAULT '2k'")
-                print("  ✓ Added event_distance column to events table")
-                self.conn.commit()
-            else:
-                print("  ✓ event_distance column already exists in events table")
-                
-        except Exception as e:
-            print(f"  ⚠️  Error adding event_distance column: {e}")
-            self.conn.rollback()
+        return all_added
 
     def clear_existing_data(self):
         """Clear existing schools and teams data."""
         print("Clearing existing schools and teams data...")
-        cursor = self.conn.cursor()
-        
-        # Delete in order due to foreign key constraints
-        cursor.execute("DELETE FROM results")
-        cursor.execute("DELETE FROM entries") 
-        cursor.execute("DELETE FROM school_participations")
-        cursor.execute("DELETE FROM conference_affiliations")
-        cursor.execute("DELETE FROM teams")
-        cursor.execute("DELETE FROM schools")
-        
-        self.conn.commit()
+        self.conn.executescript(_SQL_CLEAR_SCHOOL_DATA)
         print("✓ Existing data cleared")
     
     def populate_schools(self):
@@ -493,30 +664,22 @@ class RowingDatabaseInitializer:
         print("Populating schools with CRR name as primary identifier...")
         cursor = self.conn.cursor()
         
-        schools_added = 0
-        for crr_name, school_info in SCHOOL_EXTENDED_INFO.items():
-            # Unpack the school info tuple
-            name, short_name, acronym, color, ow, hm, lm, lw = school_info
-            
-            try:
-                cursor.execute("""
-                    INSERT INTO schools (name, short_name, acronym, crr_name, color) 
-                    VALUES (?, ?, ?, ?, ?)
-                """, (name, short_name, acronym, crr_name, color))
-                schools_added += 1
-            except sqlite3.IntegrityError as e:
-                if "UNIQUE constraint failed" in str(e):
-                    # School already exists, update extended info
-                    cursor.execute("""
-                        UPDATE schools 
-                        SET name = ?, short_name = ?, acronym = ?, color = ?, updated_at = CURRENT_TIMESTAMP
-                        WHERE crr_name = ?
-                    """, (name, short_name, acronym, color, crr_name))
+        # Schools already present are updated in place by the upsert below
+        existing_crr_names = {row[0] for row in cursor.execute("SELECT crr_name FROM schools")}
+        
+        with self._transaction():
+            cursor.executemany(_SQL_UPSERT_SCHOOL, _SCHOOL_ROWS)
+        
+        schools_updated = 0
+        for crr_name in SCHOOL_EXTENDED_INFO:
+            if crr_name in existing_crr_names:
+                schools_updated += 1
+                if self.verbose:
                     print(f"  ✓ Updated existing school: {crr_name}")
-                else:
-                    raise e
+        schools_added = len(SCHOOL_EXTENDED_INFO) - schools_updated
         
-        self.conn.commit()
+        if schools_updated and not self.verbose:
+            print(f"  ✓ Updated {schools_updated} existing schools")
         print(f"✓ Added/updated {schools_added} schools using CRR name as key")
     
     def populate_teams(self):
@@ -524,42 +687,23 @@ class RowingDatabaseInitializer:
         print("Populating teams...")
         cursor = self.conn.cursor()
         
-        teams_added = 0
-        for crr_name, school_info in SCHOOL_EXTENDED_INFO.items():
-            name, short_name, acronym, color, ow, hm, lm, lw = school_info
-            
-            # Get school_id by CRR name
-            cursor.execute("SELECT school_id FROM schools WHERE crr_name = ?", (crr_name,))
-            result = cursor.fetchone()
-            if not result:
+        # Look up every school_id at once rather than one query per school
+        school_id_by_crr = dict(cursor.execute(_SQL_SELECT_SCHOOL_IDS))
+        
+        team_rows = []
+        for crr_name, flags, team_types in _SCHOOL_TEAM_RECORDS:
+            school_id = school_id_by_crr.get(crr_name)
+            if school_id is None:
                 print(f"Warning: School with CRR name '{crr_name}' not found")
                 continue
             
-            school_id = result[0]
-            
             # Create teams based on participation flags
-            team_types = []
-            if ow:
-                team_types.append(("W", "OW"))
-            if hm:
-                team_types.append(("M", "HW"))
-            if lm:
-                team_types.append(("M", "LW"))
-            if lw:
-                team_types.append(("W", "LW"))
-            
-            for gender, weight in team_types:
-                try:
-                    cursor.execute(
-                        "INSERT INTO teams (school_id, gender, weight) VALUES (?, ?, ?)",
-                        (school_id, gender, weight)
-                    )
-                    teams_added += 1
-                except sqlite3.IntegrityError:
-                    # Team already exists
-                    pass
-        
-        self.conn.commit()
+            team_rows.extend((school_id, gender, weight) for gender, weight in team_types)
+        
+        # One statement for all teams; teams that already exist are skipped
+        with self._transaction():
+            cursor.executemany(_SQL_INSERT_TEAM, team_rows)
+        teams_added = cursor.rowcount
         print(f"✓ Added {teams_added} teams")
     
     def populate_conference_affiliations(self):
@@ -567,36 +711,25 @@ class RowingDatabaseInitializer:
         print("Populating conference affiliations for 2024-2025 academic year...")
         cursor = self.conn.cursor()
         
-        affiliations_added = 0
         start_date = "2024-09-01"
         end_date = "2025-08-31"
         
+        # Every Openweight Women team_id by CRR name, in one query
+        ow_team_id_by_crr = dict(cursor.execute(_SQL_SELECT_OW_TEAM_IDS))
+        
+        affiliation_rows = []
+        
         for crr_name, conference in OPENWEIGHT_WOMEN_CONFERENCES.items():
-            # Find the team_id using CRR name
-            cursor.execute("""
-                SELECT t.team_id FROM teams t
-                JOIN schools s ON t.school_id = s.school_id
-                WHERE s.crr_name = ? AND t.gender = 'W' AND t.weight = 'OW'
-            """, (crr_name,))
-            
-            result = cursor.fetchone()
-            if not result:
+            team_id = ow_team_id_by_crr.get(crr_name)
+            if team_id is None:
                 print(f"Warning: Openweight Women team not found for CRR name '{crr_name}'")
                 continue
             
-            team_id = result[0]
-            
-            try:
-                cursor.execute("""
-                    INSERT INTO conference_affiliations (team_id, conference, start_date, end_date)
-                    VALUES (?, ?, ?, ?)
-                """, (team_id, conference, start_date, end_date))
-                affiliations_added += 1
-            except sqlite3.IntegrityError:
-                # Affiliation already exists
-                pass
+            affiliation_rows.append((team_id, conference, start_date, end_date))
         
-        self.conn.commit()
+        with self._transaction():
+            cursor.executemany(_SQL_INSERT_AFFILIATION, affiliation_rows)
+        affiliations_added = len(affiliation_rows)
         print(f"✓ Added {affiliations_added} conference affiliations using CRR names")
     
     def populate_school_participations(self):
@@ -607,67 +740,58 @@ class RowingDatabaseInitializer:
         current_year = datetime.now().year
         start_date = f"{current_year}-09-01"
         
-        participation_count = 0
-        for crr_name, school_info in SCHOOL_EXTENDED_INFO.items():
-            name, short_name, acronym, color, ow, hm, lm, lw = school_info
-            
-            # Get school_id by CRR name
-            cursor.execute("SELECT school_id FROM schools WHERE crr_name = ?", (crr_name,))
-            result = cursor.fetchone()
-            if not result:
+        school_id_by_crr = dict(cursor.execute(_SQL_SELECT_SCHOOL_IDS))
+        # Schools that already have a participation record this year, in one query
+        participating_ids = {row[0] for row in cursor.execute(
+            _SQL_SELECT_PARTICIPATING_SCHOOL_IDS, _year_date_range(current_year))}
+        
+        participation_rows = []
+        for crr_name, flags, team_types in _SCHOOL_TEAM_RECORDS:
+            school_id = school_id_by_crr.get(crr_name)
+            if school_id is None:
                 continue
             
-            school_id = result[0]
-            
             # Only create participation record if school has at least one team
-            if ow or hm or lm or lw:
-                # Check if participation already exists
-                cursor.execute("""
-                    SELECT COUNT(*) FROM school_participations
-                    WHERE school_id = ? AND SUBSTR(start_date, 1, 4) = ?
-                """, (school_id, str(current_year)))
-                
-                if cursor.fetchone()[0] == 0:
-                    cursor.execute("""
-                        INSERT INTO school_participations 
-                        (school_id, start_date, end_date, openweight_women, heavyweight_men, lightweight_men, lightweight_women)
-                        VALUES (?, ?, NULL, ?, ?, ?, ?)
-                    """, (school_id, start_date, ow, hm, lm, lw))
-                    participation_count += 1
-        
-        self.conn.commit()
+            # and doesn't have one yet
+            if team_types and school_id not in participating_ids:
+                participation_rows.append((school_id, start_date, *flags))
+        
+        with self._transaction():
+            cursor.executemany(_SQL_INSERT_PARTICIPATION, participation_rows)
+        participation_count = len(participation_rows)
         print(f"✓ Created {participation_count} initial participation records for {current_year} season")
     
     def print_summary(self):
         """Print a summary of what was added to the database."""
-        print("\n" + "="*60)
-        print("DATABASE INITIALIZATION SUMMARY")
-        print("="*60)
-        
+        print(self.format_summary())
+    
+    def format_summary(self) -> str:
+        """Build the summary print_summary shows, as one string."""
         cursor = self.conn.cursor()
         
-        # Count schools
-        cursor.execute("SELECT COUNT(*) FROM schools")
-        school_count = cursor.fetchone()[0]
-        print(f"Schools: {school_count}")
+        # All the totals at once; the current season is the participations starting this year
+        current_year = datetime.now().year
+        cursor.execute(_SQL_SUMMARY_COUNTS, _year_date_range(current_year))
+        (school_count, total_teams, total_affiliations,
+         total_participations, current_participations) = cursor.fetchone()
+        
+        lines = [
+            "\n" + "="*60,
+            "DATABASE INITIALIZATION SUMMARY",
+            "="*60,
+            f"Schools: {school_count}",
+        ]
         
         # Show sample CRR names
         cursor.execute("SELECT crr_name FROM schools ORDER BY crr_name LIMIT 5")
         sample_crr_names = [row[0] for row in cursor.fetchall()]
-        print(f"Sample CRR names: {', '.join(sample_crr_names)}...")
+        lines.append(f"Sample CRR names: {', '.join(sample_crr_names)}...")
         
         # Count teams by category
         cursor.execute("SELECT gender, weight, COUNT(*) FROM teams GROUP BY gender, weight ORDER BY gender, weight")
-        team_counts = cursor.fetchall()
-        print("Teams by category:")
-        for gender, weight, count in team_counts:
-            category_name = f"{gender} {weight}"
-            print(f"  {category_name}: {count}")
-        
-        # Count total teams
-        cursor.execute("SELECT COUNT(*) FROM teams")
-        total_teams = cursor.fetchone()[0]
-        print(f"Total teams: {total_teams}")
+        lines.append("Teams by category:")
+        lines.extend(f"  {gender} {weight}: {count}" for gender, weight, count in cursor.fetchall())
+        lines.append(f"Total teams: {total_teams}")
         
         # Count conference affiliations by conference for 2024-2025
         cursor.execute("""
@@ -679,59 +803,74 @@ class RowingDatabaseInitializer:
             GROUP BY ca.conference 
             ORDER BY ca.conference
         """)
-        conference_counts = cursor.fetchall()
-        print("2024-2025 Openweight Women conference affiliations:")
-        for conference, count in conference_counts:
-            print(f"  {conference}: {count}")
-        
-        # Count total conference affiliations
-        cursor.execute("SELECT COUNT(*) FROM conference_affiliations")
-        total_affiliations = cursor.fetchone()[0]
-        print(f"Total conference affiliations: {total_affiliations}")
-        
-        # Count school participations
-        cursor.execute("SELECT COUNT(*) FROM school_participations")
-        total_participations = cursor.fetchone()[0]
-        print(f"School participation records: {total_participations}")
-        
-        # Show current participation season
-        current_year = datetime.now().year
-        cursor.execute("""
-            SELECT COUNT(*) FROM school_participations
-            WHERE SUBSTR(start_date, 1, 4) = ? AND end_date IS NULL
-        """, (str(current_year),))
-        current_participations = cursor.fetchone()[0]
-        print(f"Current season ({current_year} - current) participations: {current_participations}")
-        
-        print("="*60)
-        print(f"Database ready at: {os.path.abspath(self.db_path)}")
-        print("✓ CRR name is now the primary school identifier")
-        print("✓ All school references use CRR names for consistency")
-        print("✓ D1 School Management tab ready with editable CRR names")
-        print("✓ CRR name changes will propagate throughout the system")
+        lines.append("2024-2025 Openweight Women conference affiliations:")
+        lines.extend(f"  {conference}: {count}" for conference, count in cursor.fetchall())
+        
+        lines += [
+            f"Total conference affiliations: {total_affiliations}",
+            f"School participation records: {total_participations}",
+            f"Current season ({current_year} - current) participations: {current_participations}",
+            "="*60,
+            f"Database ready at: {os.path.abspath(self.db_path)}",
+            "✓ CRR name is now the primary school identifier",
+            "✓ All school references use CRR names for consistency",
+            "✓ D1 School Management tab ready with editable CRR names",
+            "✓ CRR name changes will propagate throughout the system",
+        ]
+        return "\n".join(lines)
     
     def initialize(self, force_recreate: bool = False):
         """Run the complete initialization process."""
         print("Starting rowing database initialization with CRR name support...")
         
-        if force_recreate:
-            self.clear_existing_data()
-        
-        self.create_tables()
-        self.migrate_existing_data()
-        
-        # Check if we already have data
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM schools")
-        if cursor.fetchone()[0] > 0 and not force_recreate:
-            print("Database already contains data. Use --force to recreate.")
-            return
-        
-        self.populate_schools()
-        self.populate_teams()
-        self.populate_conference_affiliations()
-        self.populate_school_participations()
-        self.print_summary()
+        try:
+            if force_recreate:
+                self.clear_existing_data()
+            
+            self.create_tables()
+            self.migrate_existing_data()
+            
+            # Check if we already have data
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT 1 FROM schools LIMIT 1")
+            if cursor.fetchone() is not None and not force_recreate:
+                self.create_indexes()
+                print("Database already contains data. Use --force to recreate.")
+                return
+            
+            # Every id the load writes was just read back from its parent table, so skip
+            # the per-row foreign key lookups; the pragma is ignored inside a transaction
+            self.conn.execute("PRAGMA foreign_keys = OFF")
+            try:
+                # All or nothing: a failure part way leaves no half-populated schools behind
+                with self._transaction():
+                    self.populate_schools()
+                    self.populate_teams()
+                    self.populate_conference_affiliations()
+                    self.populate_school_participations()
+            finally:
+                self.conn.execute("PRAGMA foreign_keys = ON")
+            # Indexes last, so they're built in one pass over the loaded rows
+            self.create_indexes()
+            if self.in_memory_build:
+                self.write_database_file()
+            self.print_summary()
+        finally:
+            self.finalize()
+    
+    def write_database_file(self):
+        """Write the in-memory database out to db_path as one compact file."""
+        self.conn.execute("VACUUM INTO ?", (self.db_path,))
+        print(f"✓ Database written to {self.db_path}")
+    
+    def finalize(self):
+        """Undo the bulk-load tuning from __init__ once initialization is finished."""
+        self.conn.execute("PRAGMA synchronous = FULL")
+        if self.fast:
+            self.conn.execute("PRAGMA journal_mode = DELETE")
+        self.conn.execute("PRAGMA locking_mode = NORMAL")
+        # The exclusive lock is only released on the next access in normal mode
+        self.conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
     
     def close(self):
         """Close the database connection."""
@@ -746,11 +885,16 @@ def main():
                        help="Path to the database file (default: rowing_database.db)")
     parser.add_argument("--force", action="store_true", 
                        help="Force recreation of data (will clear existing schools/teams)")
+    parser.add_argument("--fast", action="store_true",
+                       help="Skip journaling and fsyncs while loading (only for throwaway rebuilds)")
+    parser.add_argument("--in-memory-build", action="store_true",
+                       help="Build a new database in memory and write the file once at the end")
     
     args = parser.parse_args()
     
     try:
-        initializer = RowingDatabaseInitializer(args.database)
+        initializer = RowingDatabaseInitializer(args.database, fast=args.fast,
+                                                in_memory_build=args.in_memory_build)
         initializer.initialize(force_recreate=args.force)
         initializer.close()
         print("\n✓ Database initialization completed successfully!")
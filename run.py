@@ -15,14 +15,14 @@ Usage:
     cd Collegeite_SQL_Race_input && python main.py
 """
 
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 
 def check_dependencies():
     """Check if required dependencies are available."""
-    try:
-        import tkcalendar
-    except ImportError:
+    # Only look the package up; the tabs that use it import it with the rest of the GUI
+    if importlib.util.find_spec("tkcalendar") is None:
         messagebox.showerror(
             "Missing Dependency", 
             "Required package 'tkcalendar' is not installed.\n\n"
@@ -32,13 +32,17 @@ def check_dependencies():
 
 def main():
     """Launch the rowing database application."""
+    # Create the root hidden: the dependency dialog gets a parent without an empty window,
+    # and the window only appears once the GUI has been built
+    root = tk.Tk()
+    root.withdraw()
     check_dependencies()
     
     # Use absolute imports
     from Collegeite_SQL_Race_input.gui.main_window import RowingDatabaseApp
     
-    root = tk.Tk()
     app = RowingDatabaseApp(root)
+    root.deiconify()
     root.mainloop()
 
 if __name__ == "__main__":